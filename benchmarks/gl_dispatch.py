@@ -0,0 +1,95 @@
+"""
+GL call dispatch benchmark: calls per second of the hot entry points through PyOpenGL
+and through the raw pointers of GLDispatch (release mode).
+
+Every call is a no-op for the driver (rebinding the current program / vertex array,
+uniform location -1), so this measures the Python-side dispatch cost only.
+The PyOpenGL figures include the error checking of the selected mode: run it once
+without and once with --release to see both (PyOpenGL reads the mode when it is imported).
+
+Creates its own hidden window & OpenGL 3.3 context
+(headless: SDL_VIDEODRIVER=offscreen PYOPENGL_PLATFORM=egl).
+
+Usage: python benchmarks/gl_dispatch.py [--release] [--iterations 100000]
+"""
+import os
+import sys
+import argparse
+from time import perf_counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--release", action="store_true", help="PYENGINE_GL_RELEASE=1 (no PyOpenGL error checking)")
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+
+    # Must be set before gl_dispatch (and OpenGL.GL) are imported
+    os.environ["PYENGINE_GL_RELEASE"] = "1" if args.release else "0"
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+    from sdl2 import (SDL_Init, SDL_INIT_VIDEO, SDL_GetError, SDL_GL_SetAttribute, SDL_GL_CONTEXT_MAJOR_VERSION,
+                      SDL_GL_CONTEXT_MINOR_VERSION, SDL_GL_CONTEXT_PROFILE_MASK, SDL_GL_CONTEXT_PROFILE_CORE,
+                      SDL_CreateWindow, SDL_WINDOWPOS_UNDEFINED, SDL_WINDOW_OPENGL, SDL_WINDOW_HIDDEN,
+                      SDL_GL_CreateContext, SDL_GL_DeleteContext, SDL_DestroyWindow, SDL_Quit)
+    from pyengine.gl_utils.gl_dispatch import GLDispatch
+    import OpenGL.GL as gl
+    from pyengine.gl_utils.shader import ShaderProgram
+    from pyengine.gl_utils.vertex_array import VertexArray
+
+    if SDL_Init(SDL_INIT_VIDEO) != 0:
+        sys.exit(f"Failed to initialize SDL: {SDL_GetError()}")
+
+    SDL_GL_SetAttribute(SDL_GL_CONTEXT_MAJOR_VERSION, 3)
+    SDL_GL_SetAttribute(SDL_GL_CONTEXT_MINOR_VERSION, 3)
+    SDL_GL_SetAttribute(SDL_GL_CONTEXT_PROFILE_MASK, SDL_GL_CONTEXT_PROFILE_CORE)
+    window = SDL_CreateWindow(b"gl_dispatch", SDL_WINDOWPOS_UNDEFINED, SDL_WINDOWPOS_UNDEFINED, 64, 64,
+                              SDL_WINDOW_OPENGL | SDL_WINDOW_HIDDEN)
+    if not window:
+        sys.exit(f"Failed to create window: {SDL_GetError()}")
+    context = SDL_GL_CreateContext(window)
+    if not context:
+        sys.exit(f"Failed to create OpenGL context: {SDL_GetError()}")
+
+    GLDispatch.load()
+
+    # Uniform calls need a bound program (location -1 is then silently ignored)
+    shader = ShaderProgram.from_files("shaders/mesh.vert", "shaders/mesh.frag")
+    vertex_array = VertexArray()
+    shader.use()
+    vertex_array.bind()
+
+    cases = {
+        "glUseProgram": (int(shader.id),),
+        "glBindVertexArray": (int(vertex_array.id),),
+        "glUniform1i": (-1, 0),
+        "glUniform4f": (-1, 1.0, 1.0, 1.0, 1.0),
+    }
+
+    mode = "release" if args.release else "debug"
+    print(f"{'call':>18} | {'PyOpenGL (' + mode + ')':>18} | {'raw pointer':>16} | {'speedup':>7}")
+    for name, call_args in cases.items():
+        rates = []
+        for function in (getattr(gl, name), GLDispatch.resolve(name)):
+            if function is None:
+                rates.append(0.0)
+                continue
+
+            start = perf_counter()
+            for _ in range(args.iterations):
+                function(*call_args)
+            rates.append(args.iterations / (perf_counter() - start))
+
+        speedup = rates[1] / rates[0] if rates[0] else 0.0
+        print(f"{name:>18} | {rates[0]:>15,.0f} /s | {rates[1]:>13,.0f} /s | {speedup:>6.1f}x")
+
+    vertex_array.destroy()
+    shader.destroy()
+    SDL_GL_DeleteContext(context)
+    SDL_DestroyWindow(window)
+    SDL_Quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Model matrix benchmark, for N entities:
+- legacy: the per-entity path this replaced (RenderSystem._calculate_model_matrix), rebuilt
+  every frame with glm.translate * glm.rotate (x, y, z) * glm.scale
+- Transform.get_matrix() per entity vs Transform.get_matrices() (batched)
+
+The last two go through the same cache. Each one is measured with every transform dirty
+(all entities moved this frame) and with every transform clean (nothing moved).
+No OpenGL context is needed.
+
+Usage: python benchmarks/transform_matrices.py [--counts 1000 10000 100000] [--repeat 5]
+"""
+import os
+import sys
+import argparse
+from time import perf_counter
+
+import glm
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from pyengine.physics.transform import Transform
+
+
+def make_transforms(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-100.0, 100.0, (count, 3)).tolist()
+    rotations = rng.uniform(-np.pi, np.pi, (count, 3)).tolist()
+    scales = rng.uniform(0.5, 2.0, (count, 3)).tolist()
+    return [Transform(p, r, s) for p, r, s in zip(positions, rotations, scales)]
+
+
+def legacy(vectors) -> np.ndarray:
+    """
+    The former RenderSystem._calculate_model_matrix, on (position, rotation, scale) glm.vec3
+    triples (the plain attributes of the former Transform).
+    """
+    matrices = []
+    for position, rotation, scale in vectors:
+        model = glm.mat4(1.0)
+        model = glm.translate(model, position)
+        if rotation.x != 0: model = glm.rotate(model, rotation.x, glm.vec3(1, 0, 0))
+        if rotation.y != 0: model = glm.rotate(model, rotation.y, glm.vec3(0, 1, 0))
+        if rotation.z != 0: model = glm.rotate(model, rotation.z, glm.vec3(0, 0, 1))
+        model = glm.scale(model, scale)
+        matrices.append(model)
+
+    matrices = np.array(glm.array(matrices), dtype=np.float32)
+    return np.ascontiguousarray(matrices.transpose(0, 2, 1))
+
+
+def per_entity(transforms) -> np.ndarray:
+    # Same output as get_matrices(): (N, 4, 4) column-major
+    matrices = np.array(glm.array([transform.get_matrix() for transform in transforms]), dtype=np.float32)
+    return np.ascontiguousarray(matrices.transpose(0, 2, 1))
+
+
+def batched(transforms) -> np.ndarray:
+    return Transform.get_matrices(transforms)
+
+
+def measure(function, transforms, dirty: bool, repeat: int) -> float:
+    """Best time in milliseconds over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        if dirty:
+            for transform in transforms:
+                transform.mark_dirty()
+        else:
+            function(transforms) # Fill the cache
+
+        start = perf_counter()
+        function(transforms)
+        best = min(best, perf_counter() - start)
+    return best * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'entities':>10} | {'legacy':>10} | {'per-entity dirty':>16} | {'batched dirty':>13} | {'per-entity clean':>16} | {'batched clean':>13}")
+    for count in args.counts:
+        transforms = make_transforms(count)
+        vectors = [(glm.vec3(t.position), glm.vec3(t.rotation), glm.vec3(t.scale)) for t in transforms]
+
+        # Every path must produce the same matrices
+        for transform in transforms:
+            transform.mark_dirty()
+        expected = per_entity(transforms)
+        for transform in transforms:
+            transform.mark_dirty()
+        assert np.allclose(batched(transforms), expected, atol=1e-4), "get_matrices() differs from get_matrix()"
+        assert np.allclose(legacy(vectors), expected, atol=1e-4), "get_matrix() differs from the legacy path"
+
+        times = [
+            measure(lambda _: legacy(vectors), transforms, False, args.repeat),
+            measure(per_entity, transforms, True, args.repeat),
+            measure(batched, transforms, True, args.repeat),
+            measure(per_entity, transforms, False, args.repeat),
+            measure(batched, transforms, False, args.repeat),
+        ]
+        print(f"{count:>10} | {times[0]:>7.2f} ms | {times[1]:>13.2f} ms | {times[2]:>10.2f} ms | {times[3]:>13.2f} ms | {times[4]:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
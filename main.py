@@ -3,11 +3,13 @@ import sys
 import ctypes
 from sdl2 import *
 from pyengine.core.app import App
-from pyengine.gl_utils.mesh import Cylinder, Plane, Rectangle, Cube, Sphere
+from pyengine.gl_utils.vertex_format import VertexFormat
 from pyengine.graphics.camera import Camera2D, Camera3D, MainCamera
 from pyengine.graphics.light import DirectionalLight, PointLight
 from pyengine.graphics.material import Material
 from pyengine.graphics.mesh_renderer import MeshRenderer
+from pyengine.graphics.lod_group import LODGroup
+from pyengine.graphics.static_batch import Static
 from pyengine.graphics.sprite import Animation, Animator, SpriteSheet
 from pyengine.gui.text_renderer import TextRenderer
 from pyengine.gui.ui_box import UIBox
@@ -132,8 +134,8 @@ class Game2D(App):
         # Create a material using the shader and the texture.
         mat_player = Material(shader, texture=player_base)
         
-        # Create a simple Rectangle geometry for the sprite.
-        rect_geo = Rectangle(shader)
+        # Create a simple Rectangle geometry for the sprite (shared through the asset cache).
+        rect_geo = self.assets.get_primitive("rectangle", shader)
 
         player = self.entity_manager.create_entity()
         
@@ -205,25 +207,31 @@ class Game3D(App):
         
         # --- FLOOR (Plane) ---
         # A large flat plane (20x20 units), texture repeats 5 times (tile_u/v).
-        plane_geo = Plane(shader, width=20, depth=20, tile_u=5, tile_v=5)
+        plane_geo = self.assets.get_primitive("plane", shader, width=20, depth=20, tile_u=5, tile_v=5)
         floor = self.entity_manager.create_entity()
         self.entity_manager.add_component(floor, Transform(position=(0, 0, 0)))
         self.entity_manager.add_component(floor, MeshRenderer(plane_geo, mat_object))
 
         # --- SPHERE (Left) ---
-        sphere_geo = Sphere(shader, radius=0.5, sectors=32, stacks=16)
+        sphere_geo = self.assets.get_primitive("sphere", shader, radius=0.5, sectors=32, stacks=16)
         sphere = self.entity_manager.create_entity()
         self.entity_manager.add_component(sphere, Transform(position=(-1.5, 0.5, 0))) # Lift y by radius (0.5)
         self.entity_manager.add_component(sphere, MeshRenderer(sphere_geo, mat_object))
 
+        # Simplified versions, picked from the size of the sphere on screen
+        self.assets.generate_lods(sphere_geo, shader)
+        self.entity_manager.add_component(sphere, LODGroup.from_mesh(sphere_geo))
+
         # --- CYLINDER (Right) ---
-        cyl_geo = Cylinder(shader, radius=0.5, height=1.5)
+        cyl_geo = self.assets.get_primitive("cylinder", shader, radius=0.5, height=1.5)
         cylinder = self.entity_manager.create_entity()
         self.entity_manager.add_component(cylinder, Transform(position=(1.5, 0.75, 0))) # Lift y by half height
         self.entity_manager.add_component(cylinder, MeshRenderer(cyl_geo, mat_object))
+        self.assets.generate_lods(cyl_geo, shader)
+        self.entity_manager.add_component(cylinder, LODGroup.from_mesh(cyl_geo))
 
         # --- CUBE (Center) ---
-        cube_geo = Cube(shader)
+        cube_geo = self.assets.get_primitive("cube", shader)
         cube = self.entity_manager.create_entity()
         self.entity_manager.add_component(cube, Transform(position=(0, 0.5, 0)))
         self.entity_manager.add_component(cube, MeshRenderer(cube_geo, mat_object))
@@ -261,7 +269,8 @@ class Game3D(App):
         ))
         
         # (Optional) Visual Debug: Add a small white cube to visualize the light source position
-        mesh_cube = Cube(shader)
+        # (same GPU buffers as the center cube)
+        mesh_cube = self.assets.get_primitive("cube", shader)
         mat_white = Material(shader, color=(1, 1, 1, 1)) # Pure white, no texture
         self.entity_manager.add_component(lamp_entity, MeshRenderer(mesh_cube, mat_white))
         # Scale it down so it looks like a small bulb
@@ -328,12 +337,18 @@ class KenneyGame(App):
         self.entity_manager.add_component(self.camera_entity, Camera3D(self.width, self.height, fov=70.0))
         self.entity_manager.add_component(self.camera_entity, MainCamera())
 
-        block_grass_model = self.assets.load_model("assets/kenney/block-grass.obj", shader)
+        # Level geometry never moves: no LODs, merged by the static batcher instead.
+        # Block textures share texture array pages, so blocks with different textures can share a batch.
+        # Blocks use 16-byte quantized vertices (half the memory of the float layout).
+        self.assets.texture_arrays = True
+        self.assets.vertex_format = VertexFormat.COMPACT
+        block_grass_model = self.assets.load_model("assets/kenney/block-grass.obj", shader, generate_lods=False)
 
         for mesh, material in block_grass_model:
             part_entity = self.entity_manager.create_entity()
             self.entity_manager.add_component(part_entity, Transform(position=(3.0, 0.5, 0.0)))
             self.entity_manager.add_component(part_entity, MeshRenderer(mesh, material))
+            self.entity_manager.add_component(part_entity, Static())
 
         sun_entity = self.entity_manager.create_entity()
         self.entity_manager.add_component(sun_entity, DirectionalLight(
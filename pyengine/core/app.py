@@ -2,13 +2,16 @@ import sys
 import ctypes
 import sdl2.sdlttf
 from sdl2 import *
+from pyengine.gl_utils.gl_dispatch import GLDispatch # Before OpenGL.GL: sets PyOpenGL's error checking mode
 from OpenGL.GL import *
 from pyengine.core.logger import Logger
+from pyengine.gl_utils.gl_state import GLState
 from pyengine.ecs.entity_manager import EntityManager
 from pyengine.graphics.render_system import RenderSystem
 from pyengine.core.input_manager import InputManager
 from pyengine.core.time_manager import TimeManager
 from pyengine.core.asset_manager import AssetManager
+from pyengine.core.render_thread import RenderThread
 from pyengine.graphics.camera import Camera2D, Camera3D
 from pyengine.graphics.animation_system import Animation2dSystem
 from pyengine.ecs.scheduler import SystemScheduler, SchedulerType
@@ -21,9 +24,11 @@ from pyengine.ecs.plugin import Plugin
 # Main application class handling SDL2 windowing and the game loop.
 # =============================================================================
 class App:
-    def __init__(self, width: int, height: int, title: str):
+    def __init__(self, width: int, height: int, title: str, threaded_rendering: bool = False):
         """
         Initializes SDL2, creates a window and an OpenGL context.
+        :param threaded_rendering: Submit OpenGL commands from a dedicated thread (see RenderThread),
+                                   so rendering frame N overlaps with the update of frame N+1.
         """
         Logger.init(name="GameApp", debug_mode=True)
         Logger.info(f"Starting Engine: {width}x{height} - {title}")
@@ -32,6 +37,8 @@ class App:
         self.width = width
         self.height = height
         self.running = False
+        self.threaded_rendering = threaded_rendering
+        self.render_thread = None
         self._init_sdl()
 
         self.input = InputManager()
@@ -47,8 +54,13 @@ class App:
 
         self.scheduler = SystemScheduler()
 
+        self.render_system = RenderSystem()
+        self.resources.add(self.render_system.stats)
+        self.resources.add(self.render_system.dynamic_resolution)
+        self.resources.add(self.render_system.gpu_profile)
+
         self.scheduler.add(SchedulerType.Update, Animation2dSystem())
-        self.scheduler.add(SchedulerType.Render, RenderSystem())
+        self.scheduler.add(SchedulerType.Render, self.render_system)
 
         self.camera_entity = None
         
@@ -94,19 +106,22 @@ class App:
         # Create the OpenGL Context and attach it to the window
         self.context = SDL_GL_CreateContext(self.window)
 
+        # Release mode: resolve the raw entry points of the hot GL calls
+        GLDispatch.load()
+
         # Enable V-Sync (1 = on, 0 = off) to prevent screen tearing
         SDL_GL_SetSwapInterval(1)
 
         # Initialize the viewport to match window dimensions
-        glViewport(0, 0, self.width, self.height)
+        GLState.viewport(0, 0, self.width, self.height)
 
     def add_plugin(self, plugin: Plugin):
         plugin.build(self)
 
     def startup(self) -> None:
         # Enable blending for transparent PNGs (Important for sprites!)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        GLState.enable(GL_BLEND)
+        GLState.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
     def process_events(self) -> None:
         """
@@ -126,8 +141,9 @@ class App:
                 if event.window.event == SDL_WINDOWEVENT_RESIZED:
                     new_w, new_h = event.window.data1, event.window.data2
 
-                    # Update viewport when window is resized
-                    glViewport(0, 0, new_w, new_h)
+                    # Viewport & offscreen render targets follow the window size
+                    # (applied by the RenderSystem on the thread owning the GL context)
+                    self.render_system.resize(new_w, new_h)
 
                     # Retrieve Camera component to update aspect ratio
                     cam_comp = self.entity_manager.get_component(self.camera_entity, Camera2D)
@@ -148,6 +164,10 @@ class App:
         self.running = True
 
         self.scheduler.execute(SchedulerType.StartUp, self.resources)
+
+        if self.threaded_rendering:
+            self.render_thread = RenderThread(self)
+            self.render_thread.start()
         
         while self.running:
             # 1. Update Time (Must be first)
@@ -162,11 +182,18 @@ class App:
             # Update Animations BEFORE Rendering
             self.scheduler.execute(SchedulerType.Update, self.resources)
 
-            # Render
-            self.scheduler.execute(SchedulerType.Render, self.resources)
+            if self.render_thread:
+                # Extract the frame & let the render thread draw it while we simulate the next one
+                self.render_thread.submit(self.render_system.extract(self.resources))
+            else:
+                # Render
+                self.scheduler.execute(SchedulerType.Render, self.resources)
+
+                # Swap the buffers (Display the newly drawn frame)
+                SDL_GL_SwapWindow(self.window)
 
-            # Swap the buffers (Display the newly drawn frame)
-            SDL_GL_SwapWindow(self.window)
+        if self.render_thread:
+            self.render_thread.stop()
 
         # Explicit cleanup call before exiting
         self._cleanup()
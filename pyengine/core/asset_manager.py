@@ -1,11 +1,18 @@
 import os
-from typing import Dict, List, Tuple
+import numpy as np
+from PIL import Image
+from typing import Dict, List, Optional, Sequence, Tuple
 from pyengine.core.logger import Logger
 from pyengine.gl_utils.texture import Texture
+from pyengine.gl_utils.texture_array import TextureArray
 from pyengine.gl_utils.shader import ShaderProgram
-from pyengine.gl_utils.mesh import Mesh
+from pyengine.gl_utils.mesh import Cube, Cylinder, Mesh, Plane, Rectangle, Sphere, Triangle
+from pyengine.gl_utils.vertex_format import VertexFormat
 from pyengine.gl_utils.obj_loader import load_obj_model
+from pyengine.gl_utils.mesh_simplifier import simplify
+from pyengine.gl_utils.mesh_optimizer import MeshOptimizer
 from pyengine.graphics.material import Material
+from pyengine.graphics.sprite_atlas import AtlasRegion, SpriteAtlasBuilder
 from pyengine.gui.font import Font
 from pyengine.ecs.resource import Resource
 
@@ -15,9 +22,41 @@ class AssetManager(Resource):
     Centralized manager to load and store assets.
     Prevents loading the same asset multiple times (Caching).
     """
-    def __init__(self):
+    # Triangle count of each generated LOD level, relative to the original mesh
+    LOD_RATIOS = (0.5, 0.25, 0.1)
+
+    # Meshes smaller than this are not worth simplifying
+    LOD_MIN_TRIANGLES = 64
+
+    # Layers of one texture array page (GL 3.3 guarantees at least 256)
+    TEXTURE_ARRAY_LAYERS = 64
+
+    # Procedural meshes available through get_primitive()
+    PRIMITIVES = {
+        "triangle": Triangle,
+        "rectangle": Rectangle,
+        "cube": Cube,
+        "plane": Plane,
+        "sphere": Sphere,
+        "cylinder": Cylinder,
+    }
+
+    def __init__(self, texture_arrays: bool = False, vertex_format: Optional[VertexFormat] = None):
+        """
+        :param texture_arrays: Model textures of the same size are packed into texture array pages
+                               (Material.texture_page / texture_layer) instead of separate Textures.
+        :param vertex_format: GPU vertex layout of the loaded models (None = VertexFormat.FLOAT).
+                              VertexFormat.COMPACT halves the vertex memory.
+        """
+        self.texture_arrays = texture_arrays
+        self.vertex_format = vertex_format
+
         # Cache for textures: Path -> Texture Object
         self._textures: Dict[str, Texture] = {}
+
+        # Texture array pages per layer size: (width, height) -> pages & Path -> (page, layer)
+        self._texture_pages: Dict[Tuple[int, int], List[TextureArray]] = {}
+        self._texture_layers: Dict[str, Tuple[TextureArray, int]] = {}
         
         # Cache for shaders: (VertPath, FragPath) -> Shader Object
         self._shaders: Dict[Tuple[str, str], ShaderProgram] = {}
@@ -26,9 +65,21 @@ class AssetManager(Resource):
         # Key: file_path, Value: Mesh Object
         self._meshes: Dict[str, Mesh] = {}
 
+        # Cache for procedural meshes: (kind, shader id, parameters) -> Mesh Object
+        self._primitives: Dict[tuple, Mesh] = {}
+
         # Cache for fonts
         self._fonts: Dict[Tuple[str, int], Font] = {}
 
+        # Reorders imported meshes for the GPU caches (results cached on disk, None = disabled)
+        self.mesh_optimizer: Optional[MeshOptimizer] = MeshOptimizer()
+
+        # Sprite atlas: images registered for packing, resulting pages & regions (Path -> AtlasRegion)
+        self.sprite_atlas_builder = SpriteAtlasBuilder()
+        self._atlas_sources: List[str] = []
+        self._atlas_pages: List[Texture] = []
+        self._atlas_regions: Dict[str, AtlasRegion] = {}
+
     def get_texture(self, path: str) -> Texture:
         """
         Returns a Texture. Loads it from disk if not already cached.
@@ -38,6 +89,66 @@ class AssetManager(Resource):
             self._textures[path] = Texture(path)
         
         return self._textures[path]
+
+    def get_texture_layer(self, path: str) -> Optional[Tuple[TextureArray, int]]:
+        """
+        Returns (page, layer): the image stored in a texture array page shared by every
+        texture of the same size. Loads it from disk if not already cached.
+        No OpenGL call: the page is uploaded the first time it is bound.
+        """
+        if path in self._texture_layers:
+            return self._texture_layers[path]
+
+        try:
+            # Same conventions as Texture: RGBA, bottom row first
+            image = Image.open(path).convert("RGBA").transpose(Image.FLIP_TOP_BOTTOM)
+        except IOError as e:
+            Logger.error(f"[ResourceManager] Failed to load texture '{path}': {e}")
+            return None
+
+        pages = self._texture_pages.setdefault(image.size, [])
+        if not pages or pages[-1].is_full:
+            pages.append(TextureArray(image.size[0], image.size[1], self.TEXTURE_ARRAY_LAYERS))
+
+        page = pages[-1]
+        layer = page.add_layer(image.tobytes())
+
+        Logger.info(f"[ResourceManager] Loading new texture layer: {path} ({image.size[0]}x{image.size[1]}, page {len(pages) - 1}, layer {layer})")
+        self._texture_layers[path] = (page, layer)
+        return page, layer
+    
+    def register_sprite(self, path: str) -> None:
+        """
+        Adds an image to the sprite atlas. Packing happens in build_sprite_atlas()
+        (or on the first get_sprite() call).
+        """
+        if path not in self._atlas_regions and path not in self._atlas_sources:
+            self._atlas_sources.append(path)
+
+    def build_sprite_atlas(self) -> None:
+        """
+        Packs every registered image into atlas pages (or loads the layout cached on disk).
+        Registering more images later rebuilds the atlas with all of them.
+        """
+        if not self._atlas_sources:
+            return
+
+        paths = list(self._atlas_regions) + self._atlas_sources
+        for page in self._atlas_pages:
+            page.destroy()
+
+        self._atlas_pages, self._atlas_regions = self.sprite_atlas_builder.build(paths)
+        self._atlas_sources = []
+
+    def get_sprite(self, path: str) -> AtlasRegion:
+        """
+        Returns the atlas region of an image (registers it and packs the atlas if needed).
+        Use region.texture in the Material and SpriteSheet(rows, cols, uv_rect=region.uv_rect).
+        """
+        if path not in self._atlas_regions:
+            self.register_sprite(path)
+            self.build_sprite_atlas()
+        return self._atlas_regions[path]
     
     def get_shader(self, vert_path: str, frag_path: str) -> ShaderProgram:
         """
@@ -52,11 +163,12 @@ class AssetManager(Resource):
             
         return self._shaders[key]
     
-    def load_model(self, obj_path: str, shader: ShaderProgram) -> List[Tuple[Mesh, Material]]:
+    def load_model(self, obj_path: str, shader: ShaderProgram, generate_lods: bool = True) -> List[Tuple[Mesh, Material]]:
         """
         Loads a complex model (OBJ + MTL).
         Returns a list of tuples: (Mesh, Material)
         You should create one Entity per tuple.
+        If generate_lods is True, simplified versions are stored in mesh.lods (see LODGroup).
         """
         parts = load_obj_model(obj_path)
         results = []
@@ -66,11 +178,17 @@ class AssetManager(Resource):
         base_dir = os.path.dirname(obj_path)
 
         for part in parts:
-            # 1. Create Mesh
-            mesh = Mesh(shader, part['vertices'])
+            # 1. Create Mesh (triangles & vertices reordered for the vertex cache and overdraw)
+            vertices, indices = part['vertices'], part['indices']
+            if self.mesh_optimizer:
+                vertices, indices = self.mesh_optimizer.optimize(vertices, indices, f"{obj_path}:{part['name']}")
+            mesh = Mesh(shader, vertices, indices, vertex_format=self.vertex_format)
+            if generate_lods:
+                self.generate_lods(mesh, shader)
             
             # 2. Determine Material
             texture = None
+            texture_layer = None
             tex_path_raw = part['texture_path']
             
             if tex_path_raw:
@@ -78,12 +196,19 @@ class AssetManager(Resource):
                 file_name = os.path.basename(tex_path_raw)
                 full_tex_path = os.path.join(base_dir, file_name)
                 
-                # Load texture (Cached automatically by get_texture)
-                texture = self.get_texture(full_tex_path)
+                # Load texture (Cached automatically by get_texture / get_texture_layer)
+                if self.texture_arrays:
+                    texture_layer = self.get_texture_layer(full_tex_path)
+                else:
+                    texture = self.get_texture(full_tex_path)
             
             # Create Material
             # If no texture found, it will be white (default color)
-            material = Material(shader, texture=texture)
+            if texture_layer:
+                page, layer = texture_layer
+                material = Material(shader, texture_page=page, texture_layer=layer)
+            else:
+                material = Material(shader, texture=texture)
             
             results.append((mesh, material))
             
@@ -96,17 +221,59 @@ class AssetManager(Resource):
         if path not in self._meshes:
             Logger.debug(f"Loading mesh from disk: {path}")
             
-            # 1. Parse Data
-            vertices = load_obj_model(path)
-            
+            # 1. Parse Data (one entry per material)
+            parts = load_obj_model(path)
+
             # 2. Create Mesh Object
-            # We use the base Mesh class since it takes raw vertices
-            mesh = Mesh(shader, vertices)
+            # Every part goes into the same mesh (materials are ignored, see load_model)
+            sizes = [len(part['vertices']) // 8 for part in parts]
+            offsets = np.cumsum([0] + sizes[:-1])
+            vertices = np.concatenate([part['vertices'] for part in parts]) if parts else np.zeros(0, dtype=np.float32)
+            indices = np.concatenate([part['indices'].astype(np.uint32) + offset for part, offset in zip(parts, offsets)]) if parts else np.zeros(0, dtype=np.uint32)
+
+            # Reordered for the vertex cache and overdraw, like the parts of load_model
+            if self.mesh_optimizer:
+                vertices, indices = self.mesh_optimizer.optimize(vertices, indices, path)
+            mesh = Mesh(shader, vertices, indices, vertex_format=self.vertex_format)
             
             self._meshes[path] = mesh
         
         return self._meshes[path]
     
+    def get_primitive(self, kind: str, shader: ShaderProgram, **params) -> Mesh:
+        """
+        Returns a procedural mesh (see PRIMITIVES), shared by every call with the same shader & parameters.
+        Example: get_primitive("sphere", shader, radius=0.5, sectors=32, stacks=16)
+        :param params: Arguments of the primitive class (radius, width, tile_u, vertex_format...).
+        """
+        if kind not in self.PRIMITIVES:
+            raise ValueError(f"Unknown primitive '{kind}' (expected one of {list(self.PRIMITIVES)})")
+
+        key = (kind, shader.id, tuple(sorted(params.items())))
+        if key not in self._primitives:
+            Logger.debug(f"[ResourceManager] Generating primitive: {kind} {params}")
+            self._primitives[key] = self.PRIMITIVES[kind](shader, **params)
+
+        return self._primitives[key]
+
+    def generate_lods(self, mesh: Mesh, shader: ShaderProgram, ratios: Sequence[float] = LOD_RATIOS) -> List[Mesh]:
+        """
+        Builds simplified versions of a mesh (quadric error metrics) and stores them in mesh.lods.
+        Works for any Mesh, including primitives (Sphere, Cylinder...).
+        Returns the list of LOD meshes (may be shorter than ratios if the mesh cannot be reduced further).
+        """
+        if mesh.lods:
+            return mesh.lods
+
+        if mesh.count // 3 < self.LOD_MIN_TRIANGLES:
+            return mesh.lods
+
+        levels = simplify(mesh.get_triangle_vertices(), ratios)
+        mesh.lods = [Mesh(shader, vertices, vertex_format=mesh.vertex_format) for vertices in levels]
+
+        Logger.debug(f"[ResourceManager] Generated {len(mesh.lods)} LODs: {mesh.count // 3} -> {[lod.count // 3 for lod in mesh.lods]} triangles")
+        return mesh.lods
+
     def get_font(self, path: str, size: int) -> Font:
         key = (path, size)
         if key not in self._fonts:
@@ -122,6 +289,17 @@ class AssetManager(Resource):
             texture.destroy()
         self._textures.clear()
 
+        for pages in self._texture_pages.values():
+            for page in pages:
+                page.destroy()
+        self._texture_pages.clear()
+        self._texture_layers.clear()
+
+        for page in self._atlas_pages:
+            page.destroy()
+        self._atlas_pages = []
+        self._atlas_regions.clear()
+
         for shader in self._shaders.values():
             shader.destroy()
         self._shaders.clear()
@@ -130,6 +308,10 @@ class AssetManager(Resource):
         for mesh in self._meshes.values():
             mesh.destroy()
         self._meshes.clear()
+
+        for mesh in self._primitives.values():
+            mesh.destroy()
+        self._primitives.clear()
         
         Logger.info("[ResourceManager] All resources cleared.")
         
\ No newline at end of file
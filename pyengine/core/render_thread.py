@@ -0,0 +1,94 @@
+import queue
+import threading
+from typing import Optional, TYPE_CHECKING
+from sdl2 import *
+from pyengine.core.logger import Logger
+from pyengine.ecs.scheduler import SchedulerType
+from pyengine.graphics.frame_packet import FramePacket
+
+if TYPE_CHECKING:
+    from pyengine.core.app import App
+
+
+# =============================================================================
+# CLASS: RenderThread
+# Owns the OpenGL context and submits frame N while the main thread simulates N+1.
+# =============================================================================
+class RenderThread:
+    """
+    Pipelined rendering:
+        main thread:   [update N] [extract N] [update N+1] [extract N+1] ...
+        render thread:                        [submit N + swap]  [submit N+1 + swap] ...
+
+    A packet is only handed over once the previous one has been submitted and swapped,
+    so the main thread is never more than one frame ahead (it waits in submit() otherwise).
+    Once started, the main thread must not call OpenGL anymore (the context is current on
+    this thread): GL objects should be created during startup or from Render systems.
+    The Render systems all run on this thread, after the packet has been handed to the RenderSystem.
+    """
+    def __init__(self, app: "App"):
+        self.app = app
+        self._packets: "queue.Queue[Optional[FramePacket]]" = queue.Queue(maxsize=1)
+
+        # Set while the render thread has no frame in flight (the queue is then empty)
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """Moves the GL context from the main thread to the render thread."""
+        SDL_GL_MakeCurrent(self.app.window, None)
+        self._thread = threading.Thread(target=self._run, name="RenderThread", daemon=True)
+        self._thread.start()
+        Logger.info("[RenderThread] Started")
+
+    def submit(self, packet: FramePacket) -> None:
+        """
+        Hands a frame to the render thread.
+        Blocks while the previous frame is still being submitted.
+        """
+        if self._error:
+            raise RuntimeError("Render thread crashed") from self._error
+
+        while not self._idle.wait(timeout=0.1):
+            # The thread may have died while we were waiting
+            if self._error or not self._thread.is_alive():
+                raise RuntimeError("Render thread stopped") from self._error
+
+        self._idle.clear()
+        self._packets.put(packet)
+
+    def stop(self) -> None:
+        """Waits for the last frame and gives the GL context back to the main thread."""
+        if self._thread is None:
+            return
+
+        if self._thread.is_alive():
+            self._packets.put(None)
+            self._thread.join()
+        self._thread = None
+
+        SDL_GL_MakeCurrent(self.app.window, self.app.context)
+        Logger.info("[RenderThread] Stopped")
+
+    def _run(self) -> None:
+        app = self.app
+        SDL_GL_MakeCurrent(app.window, app.context)
+
+        try:
+            while True:
+                packet = self._packets.get()
+                if packet is None:
+                    break
+
+                app.render_system.next_packet = packet
+                app.scheduler.execute(SchedulerType.Render, app.resources)
+                SDL_GL_SwapWindow(app.window)
+                self._idle.set()
+        except BaseException as e:
+            Logger.error(f"[RenderThread] {e}")
+            self._error = e
+        finally:
+            # Release the context so the main thread can take it back
+            SDL_GL_MakeCurrent(app.window, None)
@@ -12,6 +12,10 @@ class EntityManager(Resource):
         # Corrected key type from 'str' to 'Type[Component]' to match logic
         self.components: Dict[Type[Component], Dict[int, Component]] = {}
 
+        # Incremented every time a component of the type is added or removed.
+        # Lets systems cache data derived from a set of entities (e.g. static batching).
+        self.versions: Dict[Type[Component], int] = {}
+
     def create_entity(self) -> int:
         entity = self.next_id
         self.next_id += 1
@@ -24,6 +28,27 @@ class EntityManager(Resource):
             self.components[comp_type] = {}
 
         self.components[comp_type][entity] = component
+        self.versions[comp_type] = self.versions.get(comp_type, 0) + 1
+
+    def remove_component(self, entity: int, comp_type: Type[Component]) -> None:
+        store = self.components.get(comp_type)
+
+        if store and entity in store:
+            del store[entity]
+            self.versions[comp_type] = self.versions.get(comp_type, 0) + 1
+
+    def destroy_entity(self, entity: int) -> None:
+        """
+        Removes every component of the entity.
+        """
+        for comp_type in list(self.components):
+            self.remove_component(entity, comp_type)
+
+    def get_version(self, comp_type: Type[Component]) -> int:
+        """
+        Returns a counter that changes whenever a component of this type is added or removed.
+        """
+        return self.versions.get(comp_type, 0)
 
     def get_component(self, entity: int, comp_type: Type[T]) -> Optional[T]:
         """
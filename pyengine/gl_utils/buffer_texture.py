@@ -0,0 +1,51 @@
+import ctypes
+from OpenGL.GL import *
+import numpy as np
+from pyengine.gl_utils.gl_state import GLState
+
+# =============================================================================
+# CLASS: BufferTexture
+# A buffer object exposed to shaders as a 1D array (samplerBuffer / texelFetch).
+# Unlike uniform arrays, its size is only limited by GPU memory.
+# =============================================================================
+class BufferTexture:
+    def __init__(self, internal_format: int):
+        """
+        :param internal_format: Format of one element, e.g. GL_RGBA32F (vec4), GL_RG32UI (uvec2), GL_R32UI (uint).
+        """
+        self.internal_format = internal_format
+        self.buffer_id = glGenBuffers(1)
+        self.id = glGenTextures(1)
+        self.capacity = 0
+
+    def update(self, data_array: np.ndarray) -> None:
+        """
+        Replaces the content of the buffer (orphaning the previous storage).
+        The array dtype/shape must match the internal format (e.g. float32 (N, 4) for GL_RGBA32F).
+        """
+        # A zero-sized buffer cannot be attached to a texture
+        data_size = max(data_array.nbytes, 16)
+
+        GLState.bind_buffer(GL_TEXTURE_BUFFER, self.buffer_id)
+        if data_size > self.capacity:
+            self.capacity = max(data_size, self.capacity * 2)
+        glBufferData(GL_TEXTURE_BUFFER, self.capacity, None, GL_STREAM_DRAW)
+        if data_array.nbytes > 0:
+            glBufferSubData(GL_TEXTURE_BUFFER, 0, data_array.nbytes, data_array.ctypes.data_as(ctypes.c_void_p))
+
+        # (Re)attach the buffer storage to the texture
+        GLState.bind_texture(None, self.id, GL_TEXTURE_BUFFER)
+        glTexBuffer(GL_TEXTURE_BUFFER, self.internal_format, self.buffer_id)
+
+    def bind(self, slot: int) -> None:
+        """Binds the texture to a texture unit (the sampler uniform must use the same unit)."""
+        GLState.bind_texture(slot, self.id, GL_TEXTURE_BUFFER)
+
+    def destroy(self) -> None:
+        if self.id:
+            GLState.forget_texture(self.id)
+            GLState.forget_buffer(self.buffer_id)
+            glDeleteTextures(1, [self.id])
+            glDeleteBuffers(1, [self.buffer_id])
+            self.id = None
+            self.buffer_id = None
@@ -0,0 +1,149 @@
+import ctypes
+from OpenGL.GL import *
+import numpy as np
+from typing import List, Optional
+from pyengine.gl_utils.gl_state import GLState
+
+# =============================================================================
+# CLASS: DynamicVertexBuffer
+# Streams per-frame vertex data (sprite batches, particles, debug lines, text...)
+# without ever waiting for the GPU.
+# =============================================================================
+class DynamicVertexBuffer:
+    """
+    One GPU buffer split into `frames` regions used as a ring: frame N writes into region N % frames
+    while the GPU may still be reading the regions of the previous frames.
+
+    - Data is written with glMapBufferRange(GL_MAP_UNSYNCHRONIZED_BIT): the driver does not check
+      whether the GPU is using the memory, we do it ourselves with one fence per region.
+    - When a frame starts, the fence of its region is polled (timeout 0). If the GPU is still behind,
+      the whole buffer is orphaned (glBufferData with NULL) instead of blocking: the driver
+      allocates fresh memory and frees the old one when the GPU is done with it.
+
+    Usage (once per frame):
+        buffer.begin_frame()
+        first = buffer.write(vertices)        # vertex index to pass to glDrawArrays
+        ... draw calls reading the data ...
+        buffer.end_frame()
+    """
+    def __init__(self, stride: int, capacity: int = 65536, frames: int = 3):
+        """
+        :param stride: Size of one vertex in bytes. Writes are aligned on it so write() can
+                       return a vertex index.
+        :param capacity: Initial size of one region in bytes (grows when needed).
+        :param frames: Number of regions (= frames in flight before an orphan is needed).
+        """
+        self.stride = stride
+        self.frames = frames
+        self.region_size = self._align(capacity)
+
+        self.id = glGenBuffers(1)
+        self._fences: List[Optional[int]] = [None] * frames
+        self._region = 0
+        self._head = 0  # Write position inside the current region (bytes)
+
+        # Number of times the ring had to be orphaned (GPU too far behind or buffer growth)
+        self.orphan_count = 0
+
+        self._allocate()
+
+    def _align(self, size: int) -> int:
+        return ((size + self.stride - 1) // self.stride) * self.stride
+
+    def _allocate(self) -> None:
+        """(Re)allocates the storage. The previous one is orphaned, not waited for."""
+        self.bind()
+        glBufferData(GL_ARRAY_BUFFER, self.region_size * self.frames, None, GL_STREAM_DRAW)
+        self._delete_fences()
+
+    def _delete_fences(self) -> None:
+        for i, fence in enumerate(self._fences):
+            if fence is not None:
+                glDeleteSync(fence)
+                self._fences[i] = None
+
+    # =========================================================================
+    # FRAME API
+    # =========================================================================
+
+    def begin_frame(self) -> None:
+        """Moves to the next region of the ring."""
+        self._region = (self._region + 1) % self.frames
+        self._head = 0
+
+        fence = self._fences[self._region]
+        if fence is None:
+            return
+
+        # Poll only: a timeout of 0 never blocks
+        status = glClientWaitSync(fence, 0, 0)
+        if status in (GL_ALREADY_SIGNALED, GL_CONDITION_SATISFIED):
+            glDeleteSync(fence)
+            self._fences[self._region] = None
+        else:
+            # The GPU still reads this region: get new memory rather than waiting
+            self.orphan_count += 1
+            self._allocate()
+
+    def end_frame(self) -> None:
+        """Marks the end of the draw calls reading the current region."""
+        if self._head == 0:
+            return
+        if self._fences[self._region] is not None:
+            glDeleteSync(self._fences[self._region])
+        self._fences[self._region] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+    def write(self, data_array: np.ndarray) -> int:
+        """
+        Copies a NumPy array straight into GPU memory (no intermediate buffer).
+        Returns the index of its first vertex in the buffer (first argument of glDrawArrays).
+
+        If the region is full, the buffer grows: data written earlier in the same frame
+        must already have been drawn.
+        """
+        # Only copies if the array is not already contiguous
+        data_array = np.ascontiguousarray(data_array)
+        size = data_array.nbytes
+
+        if self._head + size > self.region_size:
+            self.region_size = self._align(max(size, self.region_size * 2))
+            self.orphan_count += 1
+            self._allocate()
+            self._head = 0
+
+        offset = self._region * self.region_size + self._head
+
+        self.bind()
+        if size > 0:
+            access = GL_MAP_WRITE_BIT | GL_MAP_UNSYNCHRONIZED_BIT | GL_MAP_INVALIDATE_RANGE_BIT
+            pointer = glMapBufferRange(GL_ARRAY_BUFFER, offset, size, access)
+            ctypes.memmove(pointer, data_array.ctypes.data, size)
+            glUnmapBuffer(GL_ARRAY_BUFFER)
+
+        self._head += self._align(size)
+        return offset // self.stride
+
+    # =========================================================================
+    # GL OBJECT
+    # =========================================================================
+
+    def bind(self) -> None:
+        """Binds this buffer as the current GL_ARRAY_BUFFER."""
+        GLState.bind_buffer(GL_ARRAY_BUFFER, self.id)
+
+    def unbind(self) -> None:
+        """Unbinds the current GL_ARRAY_BUFFER."""
+        GLState.bind_buffer(GL_ARRAY_BUFFER, 0)
+
+    def destroy(self) -> None:
+        """
+        Explicitly delete the buffer and its fences.
+        """
+        if self.id:
+            try:
+                self._delete_fences()
+                GLState.forget_buffer(self.id)
+                glDeleteBuffers(1, [self.id])
+                self.id = None
+            except:
+                pass
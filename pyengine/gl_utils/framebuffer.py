@@ -0,0 +1,89 @@
+from OpenGL.GL import *
+from pyengine.core.logger import Logger
+from pyengine.gl_utils.gl_state import GLState
+
+# =============================================================================
+# CLASS: Framebuffer (FBO)
+# Offscreen render target: a color texture and an optional depth renderbuffer.
+# =============================================================================
+class Framebuffer:
+    def __init__(self, width: int, height: int, depth: bool = True):
+        """
+        :param width: Width of the attachments in pixels.
+        :param height: Height of the attachments in pixels.
+        :param depth: Adds a 24-bit depth renderbuffer (needed for 3D rendering).
+        """
+        self.id = glGenFramebuffers(1)
+        self.color_texture = glGenTextures(1)
+        self.depth_buffer = glGenRenderbuffers(1) if depth else 0
+
+        self.width = 0
+        self.height = 0
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Reallocates the attachments. Does nothing if the size did not change.
+        """
+        width, height = max(1, int(width)), max(1, int(height))
+        if (width, height) == (self.width, self.height):
+            return
+        self.width, self.height = width, height
+
+        # Color: sampled with linear filtering when the target is scaled to the window
+        GLState.bind_texture(None, self.color_texture)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        GLState.bind_texture(None, 0)
+
+        if self.depth_buffer:
+            glBindRenderbuffer(GL_RENDERBUFFER, self.depth_buffer)
+            glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, width, height)
+            glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+        self.bind()
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.color_texture, 0)
+        if self.depth_buffer:
+            glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, self.depth_buffer)
+
+        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        if status != GL_FRAMEBUFFER_COMPLETE:
+            Logger.error(f"[Framebuffer] Incomplete framebuffer ({width}x{height}): status {status}")
+        self.unbind()
+
+    def bind(self) -> None:
+        """Redirects rendering into this framebuffer."""
+        GLState.bind_framebuffer(self.id)
+
+    def unbind(self) -> None:
+        """Renders to the window again."""
+        GLState.bind_framebuffer(0)
+
+    def blit_to_screen(self, src_width: int, src_height: int, dst_width: int, dst_height: int) -> None:
+        """
+        Copies the bottom-left (src_width x src_height) area of the color attachment to the whole
+        window, with linear filtering (upscaling). Leaves the window bound.
+        """
+        GLState.bind_framebuffer(self.id, GL_READ_FRAMEBUFFER)
+        GLState.bind_framebuffer(0, GL_DRAW_FRAMEBUFFER)
+        glBlitFramebuffer(0, 0, src_width, src_height, 0, 0, dst_width, dst_height, GL_COLOR_BUFFER_BIT, GL_LINEAR)
+        GLState.bind_framebuffer(0)
+
+    def destroy(self) -> None:
+        """
+        Explicitly delete the framebuffer and its attachments.
+        """
+        if self.id:
+            try:
+                GLState.forget_framebuffer(self.id)
+                glDeleteFramebuffers(1, [self.id])
+                GLState.forget_texture(self.color_texture)
+                glDeleteTextures(1, [self.color_texture])
+                if self.depth_buffer:
+                    glDeleteRenderbuffers(1, [self.depth_buffer])
+                self.id = None
+            except:
+                pass
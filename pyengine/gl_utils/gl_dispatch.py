@@ -0,0 +1,118 @@
+import os
+import sys
+import ctypes
+import OpenGL
+
+# PyOpenGL decides when OpenGL.GL is first imported whether every call is followed by a
+# glGetError() check and goes through its logging wrapper. This module is imported before
+# OpenGL.GL (see app.py & gl_state.py), so the environment variable applies to the whole engine:
+#   PYENGINE_GL_RELEASE=1  -> release mode: no per-call error checking or logging
+#   (unset / 0)            -> debug mode (default): PyOpenGL raises a GLError on the faulty call
+RELEASE = os.environ.get("PYENGINE_GL_RELEASE", "0") == "1"
+_FLAGS_APPLIED = "OpenGL.GL" not in sys.modules
+if _FLAGS_APPLIED:
+    OpenGL.ERROR_CHECKING = not RELEASE
+    OpenGL.ERROR_LOGGING = not RELEASE
+
+from OpenGL.GL import *
+from sdl2 import SDL_GL_GetProcAddress
+from pyengine.core.logger import Logger
+
+_GLenum = ctypes.c_uint
+_GLuint = ctypes.c_uint
+_GLint = ctypes.c_int
+_GLsizei = ctypes.c_int
+_GLfloat = ctypes.c_float
+_GLboolean = ctypes.c_ubyte
+_pointer = ctypes.c_void_p
+
+# OpenGL entry points use the stdcall convention on Windows (APIENTRY)
+_FUNCTYPE = ctypes.WINFUNCTYPE if sys.platform == "win32" else ctypes.CFUNCTYPE
+
+# Hot entry points (called per entity or per batch every frame): name -> argument types
+_SIGNATURES = {
+    "glUseProgram": (_GLuint,),
+    "glBindVertexArray": (_GLuint,),
+    "glBindBuffer": (_GLenum, _GLuint),
+    "glActiveTexture": (_GLenum,),
+    "glBindTexture": (_GLenum, _GLuint),
+    "glUniform1i": (_GLint, _GLint),
+    "glUniform1f": (_GLint, _GLfloat),
+    "glUniform2f": (_GLint, _GLfloat, _GLfloat),
+    "glUniform3f": (_GLint, _GLfloat, _GLfloat, _GLfloat),
+    "glUniform4f": (_GLint, _GLfloat, _GLfloat, _GLfloat, _GLfloat),
+    "glUniformMatrix4fv": (_GLint, _GLsizei, _GLboolean, _pointer),
+    "glDrawArrays": (_GLenum, _GLint, _GLsizei),
+    "glDrawArraysInstanced": (_GLenum, _GLint, _GLsizei, _GLsizei),
+    "glDrawElements": (_GLenum, _GLsizei, _GLenum, _pointer),
+}
+
+
+# =============================================================================
+# CLASS: GLDispatch
+# The OpenGL functions called in the render loop. In debug mode they are the
+# PyOpenGL ones; in release mode load() replaces them with ctypes function
+# pointers resolved through SDL_GL_GetProcAddress, which skip PyOpenGL's
+# wrapper, argument conversion and error checking layers.
+# =============================================================================
+class GLDispatch:
+    """
+    Static wrapper (like GLState): call GLDispatch.glDrawArrays(...) instead of glDrawArrays(...).
+
+    Raw pointers take plain values only: ints, floats, None or a ctypes pointer
+    (glm.value_ptr(matrix), array.ctypes.data_as(...)) where GL expects a pointer.
+    """
+    release = RELEASE
+
+    glUseProgram = staticmethod(glUseProgram)
+    glBindVertexArray = staticmethod(glBindVertexArray)
+    glBindBuffer = staticmethod(glBindBuffer)
+    glActiveTexture = staticmethod(glActiveTexture)
+    glBindTexture = staticmethod(glBindTexture)
+    glUniform1i = staticmethod(glUniform1i)
+    glUniform1f = staticmethod(glUniform1f)
+    glUniform2f = staticmethod(glUniform2f)
+    glUniform3f = staticmethod(glUniform3f)
+    glUniform4f = staticmethod(glUniform4f)
+    glUniformMatrix4fv = staticmethod(glUniformMatrix4fv)
+    glDrawArrays = staticmethod(glDrawArrays)
+    glDrawArraysInstanced = staticmethod(glDrawArraysInstanced)
+    glDrawElements = staticmethod(glDrawElements)
+
+    @staticmethod
+    def resolve(name: str):
+        """
+        Returns a ctypes function calling the driver's entry point directly, or None if
+        SDL cannot find it. Needs a current OpenGL context.
+        """
+        address = SDL_GL_GetProcAddress(name.encode("ascii"))
+        if not address:
+            return None
+
+        address = ctypes.cast(address, ctypes.c_void_p).value
+        return _FUNCTYPE(None, *_SIGNATURES[name])(address)
+
+    @staticmethod
+    def load() -> None:
+        """
+        Call once the OpenGL context has been created.
+        Release mode: swaps every hot entry point for its raw pointer (missing ones keep PyOpenGL).
+        """
+        if not GLDispatch.release:
+            Logger.info("[GLDispatch] Debug mode: PyOpenGL calls with error checking")
+            return
+
+        if not _FLAGS_APPLIED:
+            Logger.warning("[GLDispatch] OpenGL.GL was imported before gl_dispatch: PyOpenGL error checking stays on")
+
+        missing = []
+        for name in _SIGNATURES:
+            function = GLDispatch.resolve(name)
+            if function is None:
+                missing.append(name)
+            else:
+                setattr(GLDispatch, name, staticmethod(function))
+
+        if missing:
+            Logger.warning(f"[GLDispatch] No entry point for {', '.join(missing)}: using PyOpenGL")
+        Logger.info(f"[GLDispatch] Release mode: {len(_SIGNATURES) - len(missing)} raw GL entry points")
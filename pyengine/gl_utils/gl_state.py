@@ -0,0 +1,320 @@
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from OpenGL.GL import *
+from typing import Dict, Optional, Tuple
+from pyengine.core.logger import Logger
+
+
+# glGet* names used to read back each cached binding in debug mode
+_BUFFER_BINDING_QUERIES = {
+    GL_ARRAY_BUFFER: GL_ARRAY_BUFFER_BINDING,
+    GL_ELEMENT_ARRAY_BUFFER: GL_ELEMENT_ARRAY_BUFFER_BINDING,
+    GL_UNIFORM_BUFFER: GL_UNIFORM_BUFFER_BINDING,
+}
+
+_TEXTURE_BINDING_QUERIES = {
+    GL_TEXTURE_2D: GL_TEXTURE_BINDING_2D,
+    GL_TEXTURE_BUFFER: GL_TEXTURE_BINDING_BUFFER,
+    GL_TEXTURE_2D_ARRAY: GL_TEXTURE_BINDING_2D_ARRAY,
+}
+
+
+# =============================================================================
+# CLASS: GLState
+# Central cache of the OpenGL state. Every gl_utils wrapper goes through it,
+# so calls that would not change anything are never sent to the driver
+# (each PyOpenGL call is expensive, even when it is a no-op for the GPU).
+# =============================================================================
+class GLState:
+    """
+    Static wrapper (like Logger): there is a single OpenGL context per application.
+
+    Set GLState.debug = True to compare the cache with the real driver state (glGet*)
+    on every call. Mismatches are logged as errors: they mean some code called OpenGL directly.
+    """
+    debug = False
+
+    _program = 0
+    _vertex_array = 0
+    _read_framebuffer = 0
+    _draw_framebuffer = 0
+    _buffers: Dict[int, int] = {}                   # target -> buffer id
+    _buffer_bases: Dict[Tuple[int, int], int] = {}  # (target, binding index) -> buffer id
+    _active_texture_unit = 0
+    _textures: Dict[Tuple[int, int], int] = {}      # (unit, target) -> texture id
+    _capabilities: Dict[int, bool] = {}             # GL_BLEND, GL_DEPTH_TEST, ... -> enabled
+    _blend_func: Optional[Tuple[int, int, int, int]] = None  # (src, dst, src alpha, dst alpha)
+    _viewport: Optional[Tuple[int, int, int, int]] = None
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Forgets everything (the next call of each kind will always reach the driver).
+        Use it after code that changes the state behind GLState's back.
+        """
+        GLState._program = None
+        GLState._vertex_array = None
+        GLState._read_framebuffer = None
+        GLState._draw_framebuffer = None
+        GLState._buffers = {}
+        GLState._buffer_bases = {}
+        GLState._active_texture_unit = None
+        GLState._textures = {}
+        GLState._capabilities = {}
+        GLState._blend_func = None
+        GLState._viewport = None
+
+    # =========================================================================
+    # PROGRAMS & VERTEX ARRAYS
+    # =========================================================================
+
+    @staticmethod
+    def use_program(program_id: int) -> None:
+        if GLState.debug:
+            GLState._check(GL_CURRENT_PROGRAM, GLState._program, "program")
+
+        if GLState._program != program_id:
+            GLDispatch.glUseProgram(program_id)
+            GLState._program = program_id
+
+    @staticmethod
+    def bind_vertex_array(vao_id: int) -> None:
+        if GLState.debug:
+            GLState._check(GL_VERTEX_ARRAY_BINDING, GLState._vertex_array, "vertex array")
+
+        if GLState._vertex_array != vao_id:
+            GLDispatch.glBindVertexArray(vao_id)
+            GLState._vertex_array = vao_id
+            # The element buffer binding is part of the VAO state
+            GLState._buffers.pop(GL_ELEMENT_ARRAY_BUFFER, None)
+
+    # =========================================================================
+    # FRAMEBUFFERS
+    # =========================================================================
+
+    @staticmethod
+    def bind_framebuffer(framebuffer_id: int, target: int = GL_FRAMEBUFFER) -> None:
+        """
+        Binds a framebuffer (0 = the window).
+        GL_FRAMEBUFFER sets both the read and draw bindings, like in OpenGL.
+        """
+        if GLState.debug:
+            if target in (GL_FRAMEBUFFER, GL_DRAW_FRAMEBUFFER):
+                GLState._check(GL_DRAW_FRAMEBUFFER_BINDING, GLState._draw_framebuffer, "draw framebuffer")
+            if target in (GL_FRAMEBUFFER, GL_READ_FRAMEBUFFER):
+                GLState._check(GL_READ_FRAMEBUFFER_BINDING, GLState._read_framebuffer, "read framebuffer")
+
+        if target == GL_FRAMEBUFFER:
+            if GLState._read_framebuffer != framebuffer_id or GLState._draw_framebuffer != framebuffer_id:
+                glBindFramebuffer(GL_FRAMEBUFFER, framebuffer_id)
+                GLState._read_framebuffer = framebuffer_id
+                GLState._draw_framebuffer = framebuffer_id
+        elif target == GL_READ_FRAMEBUFFER:
+            if GLState._read_framebuffer != framebuffer_id:
+                glBindFramebuffer(GL_READ_FRAMEBUFFER, framebuffer_id)
+                GLState._read_framebuffer = framebuffer_id
+        elif GLState._draw_framebuffer != framebuffer_id:
+            glBindFramebuffer(GL_DRAW_FRAMEBUFFER, framebuffer_id)
+            GLState._draw_framebuffer = framebuffer_id
+
+    # =========================================================================
+    # BUFFERS
+    # =========================================================================
+
+    @staticmethod
+    def bind_buffer(target: int, buffer_id: int) -> None:
+        if GLState.debug and target in _BUFFER_BINDING_QUERIES:
+            GLState._check(_BUFFER_BINDING_QUERIES[target], GLState._buffers.get(target), "buffer")
+
+        if GLState._buffers.get(target) != buffer_id:
+            GLDispatch.glBindBuffer(target, buffer_id)
+            GLState._buffers[target] = buffer_id
+
+    @staticmethod
+    def bind_buffer_base(target: int, index: int, buffer_id: int) -> None:
+        """Indexed binding (uniform blocks). Also changes the generic binding of the target."""
+        if GLState._buffer_bases.get((target, index)) != buffer_id:
+            glBindBufferBase(target, index, buffer_id)
+            GLState._buffer_bases[(target, index)] = buffer_id
+            GLState._buffers[target] = buffer_id
+
+    # =========================================================================
+    # TEXTURES
+    # =========================================================================
+
+    @staticmethod
+    def active_texture(unit: int) -> None:
+        if GLState._active_texture_unit != unit:
+            GLDispatch.glActiveTexture(GL_TEXTURE0 + unit)
+            GLState._active_texture_unit = unit
+
+    @staticmethod
+    def bind_texture(unit: int, texture_id: int, target: int = GL_TEXTURE_2D) -> None:
+        """
+        Binds a texture to a texture unit (0 = GL_TEXTURE0).
+        Pass unit=None to use the currently active unit (e.g. when uploading data).
+        """
+        if unit is None:
+            unit = GLState._active_texture_unit if GLState._active_texture_unit is not None else 0
+
+        key = (unit, target)
+        if GLState._textures.get(key) == texture_id:
+            if GLState.debug and target in _TEXTURE_BINDING_QUERIES:
+                GLState.active_texture(unit)
+                GLState._check(_TEXTURE_BINDING_QUERIES[target], texture_id, "texture")
+            return
+
+        GLState.active_texture(unit)
+        GLDispatch.glBindTexture(target, texture_id)
+        GLState._textures[key] = texture_id
+
+    # =========================================================================
+    # FIXED-FUNCTION STATE
+    # =========================================================================
+
+    @staticmethod
+    def set_enabled(capability: int, enabled: bool) -> None:
+        if GLState.debug and capability in GLState._capabilities:
+            actual = bool(glIsEnabled(capability))
+            if actual != GLState._capabilities[capability]:
+                Logger.error(f"[GLState] Capability {capability} cache mismatch: cached={GLState._capabilities[capability]}, driver={actual}")
+
+        if GLState._capabilities.get(capability) != enabled:
+            if enabled:
+                glEnable(capability)
+            else:
+                glDisable(capability)
+            GLState._capabilities[capability] = enabled
+
+    @staticmethod
+    def enable(capability: int) -> None:
+        GLState.set_enabled(capability, True)
+
+    @staticmethod
+    def disable(capability: int) -> None:
+        GLState.set_enabled(capability, False)
+
+    @staticmethod
+    def blend_func(src: int, dst: int, src_alpha: Optional[int] = None, dst_alpha: Optional[int] = None) -> None:
+        """
+        Sets the blend factors. src_alpha / dst_alpha (optional) use different factors for the
+        alpha channel (glBlendFuncSeparate), e.g. to accumulate premultiplied alpha in a render target.
+        """
+        if src_alpha is None:
+            src_alpha, dst_alpha = src, dst
+
+        factors = (src, dst, src_alpha, dst_alpha)
+        if GLState._blend_func != factors:
+            if (src_alpha, dst_alpha) == (src, dst):
+                glBlendFunc(src, dst)
+            else:
+                glBlendFuncSeparate(src, dst, src_alpha, dst_alpha)
+            GLState._blend_func = factors
+
+    @staticmethod
+    def viewport(x: int, y: int, width: int, height: int) -> None:
+        if GLState.debug and GLState._viewport is not None:
+            actual = tuple(int(v) for v in glGetIntegerv(GL_VIEWPORT))
+            if actual != GLState._viewport:
+                Logger.error(f"[GLState] Viewport cache mismatch: cached={GLState._viewport}, driver={actual}")
+
+        viewport = (int(x), int(y), int(width), int(height))
+        if GLState._viewport != viewport:
+            glViewport(*viewport)
+            GLState._viewport = viewport
+
+    @staticmethod
+    def get_viewport() -> Tuple[int, int, int, int]:
+        """Returns the current viewport without a (slow, synchronous) glGetIntegerv when possible."""
+        if GLState._viewport is None:
+            GLState._viewport = tuple(int(v) for v in glGetIntegerv(GL_VIEWPORT))
+        return GLState._viewport
+
+    # =========================================================================
+    # DELETION (keep the cache valid when objects are destroyed)
+    # =========================================================================
+
+    @staticmethod
+    def forget_program(program_id: int) -> None:
+        if GLState._program == program_id:
+            GLState._program = None
+
+    @staticmethod
+    def forget_vertex_array(vao_id: int) -> None:
+        # Deleting the bound VAO reverts the binding to 0
+        if GLState._vertex_array == vao_id:
+            GLState._vertex_array = 0
+
+    @staticmethod
+    def forget_framebuffer(framebuffer_id: int) -> None:
+        # Deleting a bound framebuffer reverts the binding to 0 (the window)
+        if GLState._read_framebuffer == framebuffer_id:
+            GLState._read_framebuffer = 0
+        if GLState._draw_framebuffer == framebuffer_id:
+            GLState._draw_framebuffer = 0
+
+    @staticmethod
+    def forget_buffer(buffer_id: int) -> None:
+        for target, bound in list(GLState._buffers.items()):
+            if bound == buffer_id:
+                GLState._buffers[target] = 0
+        for key, bound in list(GLState._buffer_bases.items()):
+            if bound == buffer_id:
+                GLState._buffer_bases[key] = 0
+
+    @staticmethod
+    def forget_texture(texture_id: int) -> None:
+        for key, bound in list(GLState._textures.items()):
+            if bound == texture_id:
+                GLState._textures[key] = 0
+
+    # =========================================================================
+    # DEBUG
+    # =========================================================================
+
+    @staticmethod
+    def _check(pname: int, expected: Optional[int], label: str) -> bool:
+        """Compares one cached binding with the driver. Returns False (and logs) on mismatch."""
+        if expected is None:
+            return True
+        actual = int(glGetIntegerv(pname))
+        if actual != expected:
+            Logger.error(f"[GLState] {label} cache mismatch: cached={expected}, driver={actual}")
+            return False
+        return True
+
+    @staticmethod
+    def validate() -> bool:
+        """
+        Checks the whole cache against glGet* results. Returns True if everything matches.
+        Can be called at any time (e.g. once per frame) even when debug is off.
+        """
+        ok = GLState._check(GL_CURRENT_PROGRAM, GLState._program, "program")
+        ok &= GLState._check(GL_VERTEX_ARRAY_BINDING, GLState._vertex_array, "vertex array")
+        ok &= GLState._check(GL_DRAW_FRAMEBUFFER_BINDING, GLState._draw_framebuffer, "draw framebuffer")
+        ok &= GLState._check(GL_READ_FRAMEBUFFER_BINDING, GLState._read_framebuffer, "read framebuffer")
+
+        for target, buffer_id in GLState._buffers.items():
+            if target in _BUFFER_BINDING_QUERIES:
+                ok &= GLState._check(_BUFFER_BINDING_QUERIES[target], buffer_id, f"buffer {target}")
+
+        for capability, enabled in GLState._capabilities.items():
+            if bool(glIsEnabled(capability)) != enabled:
+                ok = False
+                Logger.error(f"[GLState] Capability {capability} cache mismatch: cached={enabled}")
+
+        if GLState._viewport is not None:
+            actual = tuple(int(v) for v in glGetIntegerv(GL_VIEWPORT))
+            if actual != GLState._viewport:
+                ok = False
+                Logger.error(f"[GLState] Viewport cache mismatch: cached={GLState._viewport}, driver={actual}")
+
+        # Texture bindings require switching units: check them last and restore the active unit
+        if GLState._active_texture_unit is not None:
+            ok &= GLState._check(GL_ACTIVE_TEXTURE, GL_TEXTURE0 + GLState._active_texture_unit, "active texture unit")
+            for (unit, target), texture_id in GLState._textures.items():
+                if target in _TEXTURE_BINDING_QUERIES:
+                    glActiveTexture(GL_TEXTURE0 + unit)
+                    ok &= GLState._check(_TEXTURE_BINDING_QUERIES[target], texture_id, f"texture unit {unit}")
+            glActiveTexture(GL_TEXTURE0 + GLState._active_texture_unit)
+
+        return ok
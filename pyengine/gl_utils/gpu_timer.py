@@ -0,0 +1,113 @@
+import ctypes
+from OpenGL.GL import *
+from typing import Dict, List, Optional, Tuple
+
+# =============================================================================
+# CLASS: GPUTimer
+# Measures how long the GPU spends on sections of a frame (GL_TIME_ELAPSED queries).
+# =============================================================================
+class GPUTimer:
+    """
+    Results are read `latency` frames after the queries were issued: by then the GPU is
+    (almost always) done with them, so reading never stalls the CPU. If a frame is still
+    not finished, its queries are dropped instead of waited for.
+
+    GL_TIME_ELAPSED queries cannot be nested: only one section can be open at a time.
+    Sections with the same name in a frame are summed.
+
+    Usage (once per frame, on the thread owning the GL context):
+        timer.begin_frame()          # collects the results of an old frame
+        timer.begin("world")
+        ... draw calls ...
+        timer.end()
+    """
+    POOL_GROWTH = 8
+
+    def __init__(self, latency: int = 3):
+        """
+        :param latency: Number of frames between issuing a query and reading its result.
+        """
+        self.latency = latency
+
+        # Queries issued per frame slot: [(name, query id), ...]
+        self._frames: List[List[Tuple[str, int]]] = [[] for _ in range(latency)]
+        self._slot = 0
+        self._free: List[int] = []
+        self._active: Optional[Tuple[str, int]] = None
+
+        # Reusable outputs for glGetQueryObject* (plain ctypes integers: PyOpenGL has no
+        # array type mapping for 64-bit unsigned results)
+        self._available = ctypes.c_int(0)
+        self._elapsed = ctypes.c_uint64(0)
+
+        # Milliseconds per section name, from the last completed frame
+        self.results: Dict[str, float] = {}
+
+        # The first frame is dropped: some drivers (Mesa llvmpipe) time the very first
+        # query from the creation of the context
+        self._warmed_up = False
+
+    def begin_frame(self) -> bool:
+        """
+        Moves to the next frame slot and reads the results it held.
+        Returns True if new results are available in self.results.
+        """
+        if self._active:
+            self.end()
+
+        self._slot = (self._slot + 1) % self.latency
+        pending = self._frames[self._slot]
+        if not pending:
+            return False
+        self._frames[self._slot] = []
+
+        # Queries complete in order: if the last one is ready, all of them are
+        glGetQueryObjectiv(pending[-1][1], GL_QUERY_RESULT_AVAILABLE, ctypes.byref(self._available))
+        if not self._available.value:
+            # The GPU is more than `latency` frames behind: never wait, drop this frame
+            glDeleteQueries(len(pending), [query for _, query in pending])
+            return False
+
+        results: Dict[str, float] = {}
+        for name, query in pending:
+            glGetQueryObjectui64v(query, GL_QUERY_RESULT, ctypes.byref(self._elapsed))
+            results[name] = results.get(name, 0.0) + self._elapsed.value / 1e6
+            self._free.append(query)
+
+        if not self._warmed_up:
+            self._warmed_up = True
+            return False
+
+        self.results = results
+        return True
+
+    def begin(self, name: str) -> None:
+        """Opens a section (closes the previous one if still open)."""
+        if self._active:
+            self.end()
+
+        if not self._free:
+            self._free.extend(int(query) for query in glGenQueries(self.POOL_GROWTH))
+
+        query = self._free.pop()
+        glBeginQuery(GL_TIME_ELAPSED, query)
+        self._active = (name, query)
+
+    def end(self) -> None:
+        """Closes the open section."""
+        if not self._active:
+            return
+        glEndQuery(GL_TIME_ELAPSED)
+        self._frames[self._slot].append(self._active)
+        self._active = None
+
+    def destroy(self) -> None:
+        queries = self._free + [query for frame in self._frames for _, query in frame]
+        if self._active:
+            glEndQuery(GL_TIME_ELAPSED)
+            queries.append(self._active[1])
+            self._active = None
+        if queries:
+            glDeleteQueries(len(queries), queries)
+        self._free = []
+        self._frames = [[] for _ in range(self.latency)]
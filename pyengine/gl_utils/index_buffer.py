@@ -0,0 +1,44 @@
+import ctypes
+from OpenGL.GL import *
+import numpy as np
+from pyengine.gl_utils.gl_state import GLState
+
+# =============================================================================
+# CLASS: IndexBuffer (EBO)
+# Stores the triangle indices of an indexed mesh on the GPU.
+# =============================================================================
+class IndexBuffer:
+    def __init__(self, indices: np.ndarray):
+        """
+        :param indices: Vertex indices (3 per triangle). Stored as 16-bit integers when every
+                        index fits (half the memory), 32-bit otherwise.
+        """
+        self.id = glGenBuffers(1)
+
+        if len(indices) == 0 or int(indices.max()) <= 0xFFFF:
+            data = np.ascontiguousarray(indices, dtype=np.uint16)
+            self.index_type = GL_UNSIGNED_SHORT
+        else:
+            data = np.ascontiguousarray(indices, dtype=np.uint32)
+            self.index_type = GL_UNSIGNED_INT
+
+        self.count = len(data)
+
+        # The GL_ELEMENT_ARRAY_BUFFER binding belongs to the bound VAO: upload through
+        # GL_ARRAY_BUFFER instead (buffers have no fixed type) so no VAO gets modified.
+        # The buffer is attached to its VAO with VertexArray.set_index_buffer().
+        GLState.bind_buffer(GL_ARRAY_BUFFER, self.id)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data.ctypes.data_as(ctypes.c_void_p), GL_STATIC_DRAW)
+        GLState.bind_buffer(GL_ARRAY_BUFFER, 0)
+
+    def destroy(self) -> None:
+        """
+        Explicitly delete the buffer.
+        """
+        if self.id:
+            try:
+                GLState.forget_buffer(self.id)
+                glDeleteBuffers(1, [self.id])
+                self.id = None
+            except:
+                pass
@@ -1,60 +1,163 @@
 import math
 import numpy as np
+from typing import List, Optional, Tuple
 from OpenGL.GL import *
+from pyengine.gl_utils.gl_dispatch import GLDispatch
 from pyengine.gl_utils.shader import ShaderProgram
 from pyengine.gl_utils.vertex_buffer import VertexBuffer
+from pyengine.gl_utils.index_buffer import IndexBuffer
 from pyengine.gl_utils.vertex_array import VertexArray
+from pyengine.gl_utils.vertex_format import VertexFormat
+from pyengine.gl_utils.mesh_optimizer import optimize_mesh
+
+def index_vertices(vertices: np.ndarray, floats_per_vertex: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merges identical vertices of a triangle list.
+    Returns (unique vertices as a flat float32 array, uint32 indices).
+    Vertices keep the order of their first occurrence (better locality than sorted order).
+    """
+    rows = np.asarray(vertices, dtype=np.float32).reshape(-1, floats_per_vertex)
+    if len(rows) == 0:
+        return rows.ravel(), np.zeros(0, dtype=np.uint32)
+
+    _, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+
+    # np.unique sorts the rows: renumber them by first occurrence
+    order = np.argsort(first)
+    remap = np.empty(len(order), dtype=np.uint32)
+    remap[order] = np.arange(len(order), dtype=np.uint32)
+
+    unique = np.ascontiguousarray(rows[first[order]]).ravel()
+    indices = remap[inverse.ravel()]
+    return unique, indices
+
 
 # =============================================================================
 # HIGH-LEVEL ABSTRACTION: MESH
 # This class encapsulates the geometry logic.
 # =============================================================================
 class Mesh:
-    def __init__(self, shader: ShaderProgram, vertices: np.ndarray):
+    def __init__(self, shader: ShaderProgram, vertices: np.ndarray, indices: Optional[np.ndarray] = None,
+                 texture_layers: Optional[np.ndarray] = None, vertex_format: Optional[VertexFormat] = None,
+                 optimize: bool = False):
         """
         Creates a Mesh object.
         :param vertices: A numpy array of float32 containing vertex data.
                          Format: [x, y, z, nx, ny, nz, u, v] (8 floats)
+        :param indices: Triangle indices into vertices. If None, vertices is a plain triangle list
+                        (3 vertices per triangle) and identical vertices are merged automatically.
+        :param texture_layers: Optional texture array layer of every vertex (requires indices).
+                               Lets one mesh use several layers of a page (see StaticBatcher).
+        :param vertex_format: GPU layout of the vertices (None = VertexFormat.FLOAT, 32 bytes per vertex).
+                              Quantized layouts store positions/UVs relative to the mesh bounds.
+        :param optimize: Reorder triangles & vertices for the GPU caches (see mesh_optimizer).
+                         Not cached: imported models go through AssetManager's MeshOptimizer instead.
         """
-        self.count = len(vertices) // 8
+        if indices is None:
+            vertices, indices = index_vertices(vertices)
 
-        # Create the VBO (Data)
-        self.vbo = VertexBuffer(vertices)
+        if optimize and texture_layers is None:
+            vertices, indices = optimize_mesh(vertices, indices)
 
-        # Create the VAO (Configuration)
-        self.vao = VertexArray()
+        # Number of indices drawn by glDrawElements
+        self.count = len(indices)
+
+        # CPU copy of the geometry (used to build simplified versions, static batches...)
+        self.vertices = vertices
+        self.indices = indices
+
+        # Simplified versions of this mesh, from the most to the least detailed
+        # (filled by AssetManager.generate_lods, used through the LODGroup component)
+        self.lods: List["Mesh"] = []
 
-        # Calculate stride: 8 floats * 4 bytes/float = 32 bytes
-        stride = 8 * 4 
+        # Local bounding volumes (used by the RenderSystem for frustum culling)
+        self._compute_bounds(vertices)
 
-        # 1. Position (Offset 0)
-        pos_loc = shader.get_attrib_location("a_position")
-        if pos_loc != -1:
-            self.vao.add_attribute(self.vbo, pos_loc, 3, stride, 0)
+        # GPU layout of the vertices (the CPU copy above stays in float32)
+        self.vertex_format = vertex_format or VertexFormat.FLOAT
+        encoding = self.vertex_format.encode(vertices)
 
-        # 2. Normal (Offset 3 floats * 4 = 12 bytes)
-        norm_loc = shader.get_attrib_location("a_normal")
-        if norm_loc != -1:
-            self.vao.add_attribute(self.vbo, norm_loc, 3, stride, 12)
-            
-        # 3. TexCoord (Offset 6 floats * 4 = 24 bytes)
-        tex_loc = shader.get_attrib_location("a_texcoord")
-        if tex_loc != -1:
-            self.vao.add_attribute(self.vbo, tex_loc, 2, stride, 24)
+        # Undo the quantization in the vertex shader (identity for the float layout)
+        self.position_scale = encoding.position_scale
+        self.position_offset = encoding.position_offset
+        self.uv_scale = encoding.uv_scale
+        self.uv_offset = encoding.uv_offset
+
+        # Create the VBO (Data) & the EBO (Indices, 16-bit when possible)
+        self.vbo = VertexBuffer(encoding.data)
+        self.ibo = IndexBuffer(indices)
+
+        # Create the VAO (Configuration)
+        self.vao = VertexArray()
+        self.vao.set_index_buffer(self.ibo)
+
+        # 1-3. Position, Normal & TexCoord (interleaved, see VertexFormat)
+        for attribute in self.vertex_format.attributes:
+            loc = shader.get_attrib_location(attribute.name)
+            if loc != -1:
+                self.vao.add_attribute(self.vbo, loc, attribute.count, self.vertex_format.stride, attribute.offset,
+                                       gl_type=attribute.gl_type, normalized=attribute.normalized)
+
+        # 4. Texture array layer (separate buffer, only for meshes mixing layers)
+        self.layer_vbo = None
+        if texture_layers is not None:
+            layer_loc = shader.get_attrib_location("a_texture_layer")
+            if layer_loc != -1:
+                self.layer_vbo = VertexBuffer(np.asarray(texture_layers, dtype=np.float32))
+                self.vao.add_attribute(self.layer_vbo, layer_loc, 1, 4, 0)
+
+    def get_triangle_vertices(self) -> np.ndarray:
+        """
+        Returns the geometry as a plain triangle list (3 vertices per triangle, no indices).
+        """
+        return self.vertices.reshape(-1, 8)[self.indices].ravel()
+
+    def _compute_bounds(self, vertices: np.ndarray) -> None:
+        """
+        Calculates the local Axis-Aligned Bounding Box and a bounding sphere
+        from the position columns of the vertex array.
+        """
+        positions = np.asarray(vertices, dtype=np.float32).reshape(-1, 8)[:, :3]
+
+        if len(positions) == 0:
+            self.aabb_min = np.zeros(3, dtype=np.float32)
+            self.aabb_max = np.zeros(3, dtype=np.float32)
+        else:
+            self.aabb_min = positions.min(axis=0)
+            self.aabb_max = positions.max(axis=0)
+
+        # Sphere centered on the box, enclosing every vertex
+        self.bounding_center = (self.aabb_min + self.aabb_max) * 0.5
+        if len(positions) == 0:
+            self.bounding_radius = 0.0
+        else:
+            self.bounding_radius = float(np.sqrt(((positions - self.bounding_center) ** 2).sum(axis=1).max()))
 
     def bind(self) -> None:
         self.vao.bind()
 
+    def draw(self) -> None:
+        """Binds the VAO and draws every triangle."""
+        self.vao.bind()
+        GLDispatch.glDrawElements(GL_TRIANGLES, self.count, self.ibo.index_type, None)
+
     def unbind(self) -> None:
         self.vao.unbind()
 
     def destroy(self) -> None:
+        for lod in self.lods:
+            lod.destroy()
+        self.lods = []
+
         self.vao.destroy()
         self.vbo.destroy()
+        self.ibo.destroy()
+        if self.layer_vbo:
+            self.layer_vbo.destroy()
 
 
 class Triangle(Mesh):
-    def __init__(self, shader: ShaderProgram):
+    def __init__(self, shader: ShaderProgram, vertex_format: Optional[VertexFormat] = None):
         # Normal points towards +Z (0, 0, 1)
         vertices = np.array([
             -0.5, -0.5, 0.0,   0.0, 0.0, 1.0,   0.0, 0.0,  # Bottom Left
@@ -62,11 +165,11 @@ class Triangle(Mesh):
              0.0,  0.5, 0.0,   0.0, 0.0, 1.0,   0.5, 1.0   # Top Center
         ], dtype=np.float32)
 
-        super().__init__(shader, vertices)
+        super().__init__(shader, vertices, vertex_format=vertex_format)
 
 
 class Rectangle(Mesh):
-    def __init__(self, shader: ShaderProgram):
+    def __init__(self, shader: ShaderProgram, vertex_format: Optional[VertexFormat] = None):
         # Normal points towards +Z (0, 0, 1)
         vertices = np.array([
             # First Triangle
@@ -80,11 +183,11 @@ class Rectangle(Mesh):
             -0.5,  0.5, 0.0,   0.0, 0.0, 1.0,   0.0, 1.0
         ], dtype=np.float32)
 
-        super().__init__(shader, vertices)
+        super().__init__(shader, vertices, vertex_format=vertex_format)
 
 
 class Cube(Mesh):
-    def __init__(self, shader: ShaderProgram):
+    def __init__(self, shader: ShaderProgram, vertex_format: Optional[VertexFormat] = None):
         vertices = np.array([
             # Back face (Normal: 0, 0, -1)
             -0.5, -0.5, -0.5,  0.0, 0.0, -1.0,  0.0, 0.0,
@@ -135,7 +238,7 @@ class Cube(Mesh):
             -0.5,  0.5, -0.5,  0.0, 1.0, 0.0,   0.0, 1.0
         ], dtype=np.float32)
 
-        super().__init__(shader, vertices)
+        super().__init__(shader, vertices, vertex_format=vertex_format)
 
 
 class Plane(Mesh):
@@ -143,7 +246,7 @@ class Plane(Mesh):
     A flat plane on the XZ axis (Ground).
     Normal points UP (0, 1, 0).
     """
-    def __init__(self, shader: ShaderProgram, width: float = 10.0, depth: float = 10.0, tile_u: float = 1.0, tile_v: float = 1.0):
+    def __init__(self, shader: ShaderProgram, width: float = 10.0, depth: float = 10.0, tile_u: float = 1.0, tile_v: float = 1.0, vertex_format: Optional[VertexFormat] = None):
         w = width / 2.0
         d = depth / 2.0
         
@@ -160,92 +263,107 @@ class Plane(Mesh):
             -w, 0.0, -d,   0.0, 1.0, 0.0,   0.0,    tile_v
         ], dtype=np.float32)
 
-        super().__init__(shader, vertices)
+        super().__init__(shader, vertices, vertex_format=vertex_format)
+
+
+def grid_triangles(rows: int, cols: int) -> np.ndarray:
+    """
+    Triangles of a (rows + 1) x (cols + 1) vertex grid stored row by row.
+    Returns a (rows, cols, 2, 3) index array: per quad (TL, TR, BL) & (TR, BR, BL).
+    Row-major order keeps the vertices of the previous row in the vertex cache.
+    """
+    top_left = (np.arange(rows)[:, None] * (cols + 1) + np.arange(cols)[None, :])
+    top_right = top_left + 1
+    bottom_left = top_left + cols + 1
+    bottom_right = bottom_left + 1
+
+    return np.stack([
+        np.stack([top_left, top_right, bottom_left], axis=-1),
+        np.stack([top_right, bottom_right, bottom_left], axis=-1),
+    ], axis=2).astype(np.uint32)
 
 
 class Sphere(Mesh):
-    def __init__(self, shader: ShaderProgram, radius: float = 0.5, sectors: int = 36, stacks: int = 18):
-        vertices = []
-        
-        def get_data(stack_idx, sector_idx):
-            stack_angle = math.pi / 2 - stack_idx * math.pi / stacks
-            sector_angle = sector_idx * 2 * math.pi / sectors
-            
-            # Position
-            x = radius * math.cos(stack_angle) * math.cos(sector_angle)
-            y = radius * math.sin(stack_angle)
-            z = radius * math.cos(stack_angle) * math.sin(sector_angle)
-            
-            # Normal (Normalized position for a sphere at origin)
-            nx = x / radius
-            ny = y / radius
-            nz = z / radius
-            
-            # UV
-            u = sector_idx / sectors
-            v = stack_idx / stacks
-            
-            return x, y, z, nx, ny, nz, u, v
-
-        for i in range(stacks):
-            for j in range(sectors):
-                # Quad corners
-                d1 = get_data(i, j)         # TL
-                d2 = get_data(i, j+1)       # TR
-                d3 = get_data(i+1, j)       # BL
-                d4 = get_data(i+1, j+1)     # BR
-                
-                # Triangle 1
-                vertices.extend(d1 + d2 + d3)
-                # Triangle 2
-                vertices.extend(d2 + d4 + d3)
-
-        super().__init__(shader, np.array(vertices, dtype=np.float32))
+    """
+    UV sphere. The poles are repeated once per sector (each copy has its own U).
+    """
+    def __init__(self, shader: ShaderProgram, radius: float = 0.5, sectors: int = 36, stacks: int = 18,
+                 vertex_format: Optional[VertexFormat] = None, optimize: bool = False):
+        """
+        :param optimize: Reorder with the mesh optimizer (the generated grid order is already cache friendly).
+        """
+        # Angles of every grid row (from the north pole down) & column
+        stack_angles = math.pi / 2 - np.arange(stacks + 1) * math.pi / stacks
+        sector_angles = np.arange(sectors + 1) * 2 * math.pi / sectors
+
+        # Normal (Normalized position for a sphere at origin), shape (stacks + 1, sectors + 1)
+        cos_stack = np.cos(stack_angles)[:, None]
+        vertices = np.empty((stacks + 1, sectors + 1, 8), dtype=np.float32)
+        vertices[:, :, 3] = cos_stack * np.cos(sector_angles)[None, :]
+        vertices[:, :, 4] = np.sin(stack_angles)[:, None]
+        vertices[:, :, 5] = cos_stack * np.sin(sector_angles)[None, :]
+
+        # Position
+        vertices[:, :, 0:3] = vertices[:, :, 3:6] * radius
+
+        # UV
+        vertices[:, :, 6] = (np.arange(sectors + 1) / sectors)[None, :]
+        vertices[:, :, 7] = (np.arange(stacks + 1) / stacks)[:, None]
+
+        # Skip the zero-area triangles of the quads touching a pole
+        triangles = grid_triangles(stacks, sectors)
+        keep = np.ones((stacks, sectors, 2), dtype=bool)
+        keep[0, :, 0] = False
+        keep[-1, :, 1] = False
+
+        super().__init__(shader, vertices.ravel(), triangles[keep].ravel(), vertex_format=vertex_format, optimize=optimize)
 
 
 class Cylinder(Mesh):
-    def __init__(self, shader: ShaderProgram, radius: float = 0.5, height: float = 1.0, segments: int = 32):
-        vertices = []
+    def __init__(self, shader: ShaderProgram, radius: float = 0.5, height: float = 1.0, segments: int = 32,
+                 vertex_format: Optional[VertexFormat] = None, optimize: bool = False):
+        """
+        :param optimize: Reorder with the mesh optimizer (the generated order is already cache friendly).
+        """
         half_h = height / 2.0
-        
-        for i in range(segments):
-            theta = 2.0 * math.pi * i / segments
-            next_theta = 2.0 * math.pi * (i + 1) / segments
-            
-            c, s = math.cos(theta), math.sin(theta)
-            nc, ns = math.cos(next_theta), math.sin(next_theta)
-            
-            u = i / segments
-            nu = (i + 1) / segments
-            
-            # --- SIDE WALLS ---
-            # Normals for side point horizontally outwards (c, 0, s)
-            
-            # Top-Left (x, y, z, nx, ny, nz, u, v)
-            p1 = (radius * c,  half_h, radius * s,   c, 0.0, s,   u, 1.0)
-            # Top-Right
-            p2 = (radius * nc, half_h, radius * ns,  nc, 0.0, ns, nu, 1.0)
-            # Bot-Left
-            p3 = (radius * c, -half_h, radius * s,   c, 0.0, s,   u, 0.0)
-            # Bot-Right
-            p4 = (radius * nc,-half_h, radius * ns,  nc, 0.0, ns, nu, 0.0)
-            
-            vertices.extend(p1 + p2 + p3)
-            vertices.extend(p2 + p4 + p3)
-            
-            # --- TOP CAP ---
-            # Normal: (0, 1, 0)
-            tc = (0.0, half_h, 0.0,             0.0, 1.0, 0.0,  0.5, 0.5) 
-            tr1 = (radius * c,  half_h, radius * s,  0.0, 1.0, 0.0,  0.5 + 0.5*c, 0.5 + 0.5*s)
-            tr2 = (radius * nc, half_h, radius * ns, 0.0, 1.0, 0.0,  0.5 + 0.5*nc, 0.5 + 0.5*ns)
-            vertices.extend(tc + tr2 + tr1)
-            
-            # --- BOTTOM CAP ---
-            # Normal: (0, -1, 0)
-            bc = (0.0, -half_h, 0.0,              0.0, -1.0, 0.0,  0.5, 0.5)
-            br1 = (radius * c,  -half_h, radius * s,  0.0, -1.0, 0.0,  0.5 + 0.5*c, 0.5 + 0.5*s)
-            br2 = (radius * nc, -half_h, radius * ns, 0.0, -1.0, 0.0,  0.5 + 0.5*nc, 0.5 + 0.5*ns)
-            vertices.extend(bc + br1 + br2)
-
-        super().__init__(shader, np.array(vertices, dtype=np.float32))
-        
\ No newline at end of file
+
+        theta = 2.0 * math.pi * np.arange(segments + 1) / segments
+        c, s = np.cos(theta), np.sin(theta)
+
+        # --- SIDE WALLS ---
+        # 2 rows (top, bottom) of segments + 1 vertices, normals point horizontally outwards (c, 0, s)
+        side = np.zeros((2, segments + 1, 8), dtype=np.float32)
+        side[:, :, 0] = radius * c
+        side[0, :, 1] = half_h
+        side[1, :, 1] = -half_h
+        side[:, :, 2] = radius * s
+        side[:, :, 3] = c
+        side[:, :, 5] = s
+        side[:, :, 6] = np.arange(segments + 1) / segments
+        side[0, :, 7] = 1.0
+
+        # --- CAPS ---
+        # Center vertex followed by the rim, UVs map the disc into the unit square
+        def cap(y: float, ny: float) -> np.ndarray:
+            disc = np.zeros((segments + 2, 8), dtype=np.float32)
+            disc[0] = (0.0, y, 0.0, 0.0, ny, 0.0, 0.5, 0.5)
+            disc[1:, 0] = radius * c
+            disc[1:, 1] = y
+            disc[1:, 2] = radius * s
+            disc[1:, 4] = ny
+            disc[1:, 6] = 0.5 + 0.5 * c
+            disc[1:, 7] = 0.5 + 0.5 * s
+            return disc
+
+        top_base = side.shape[0] * side.shape[1]
+        bottom_base = top_base + segments + 2
+        rim = np.arange(segments, dtype=np.uint32)
+
+        # Top faces up (center, next, current), bottom faces down (center, current, next)
+        top = np.stack([np.full(segments, top_base), top_base + 2 + rim, top_base + 1 + rim], axis=1)
+        bottom = np.stack([np.full(segments, bottom_base), bottom_base + 1 + rim, bottom_base + 2 + rim], axis=1)
+
+        vertices = np.concatenate([side.reshape(-1, 8), cap(half_h, 1.0), cap(-half_h, -1.0)])
+        indices = np.concatenate([grid_triangles(1, segments).ravel(), top.ravel(), bottom.ravel()]).astype(np.uint32)
+
+        super().__init__(shader, vertices.ravel(), indices, vertex_format=vertex_format, optimize=optimize)
@@ -0,0 +1,353 @@
+import hashlib
+import os
+import numpy as np
+from typing import List, Optional, Tuple
+from pyengine.core.logger import Logger
+
+# Vertex Format: [x, y, z, nx, ny, nz, u, v]
+FLOATS_PER_VERTEX = 8
+
+# Size of the LRU cache modeled by the triangle ordering (covers the post-transform caches of current GPUs)
+VERTEX_CACHE_SIZE = 32
+
+# FIFO cache used to measure ACMR / ATVR (the classic hardware model)
+ANALYZE_CACHE_SIZE = 16
+
+# Clusters may get this much worse (ACMR) in exchange for a better overdraw order
+OVERDRAW_THRESHOLD = 1.05
+
+# Forsyth scoring constants
+_CACHE_DECAY_POWER = 1.5
+_LAST_TRIANGLE_SCORE = 0.75
+_VALENCE_BOOST_SCALE = 2.0
+_VALENCE_BOOST_POWER = 0.5
+
+
+# =============================================================================
+# MESH OPTIMIZATION
+# Reorders indexed triangle lists for the GPU, without changing what is drawn:
+# 1. Vertex cache: triangles sharing vertices are emitted close to each other
+#    (Forsyth, "Linear-Speed Vertex Cache Optimisation"), so the vertex shader
+#    runs fewer times per triangle.
+# 2. Overdraw: the ordered list is cut into clusters at cache-friendly boundaries
+#    and the clusters facing outwards are drawn first, so more hidden fragments
+#    fail the depth test (Sander et al., "Fast Triangle Reordering").
+# 3. Vertex fetch: vertices are renumbered in the order they are first used.
+# =============================================================================
+
+def analyze_vertex_cache(indices: np.ndarray, vertex_count: int, cache_size: int = ANALYZE_CACHE_SIZE) -> Tuple[float, float]:
+    """
+    Simulates a FIFO post-transform cache.
+    Returns (ACMR, ATVR): vertex shader invocations per triangle (0.5 - 3.0, lower is better)
+    and per referenced vertex (1.0 is optimal).
+    """
+    indices = np.asarray(indices).ravel()
+    if len(indices) < 3:
+        return 0.0, 0.0
+
+    timestamps = [-cache_size - 1] * vertex_count
+    timestamp = 0
+    misses = 0
+    for v in indices.tolist():
+        if timestamp - timestamps[v] > cache_size:
+            timestamps[v] = timestamp
+            timestamp += 1
+            misses += 1
+
+    referenced = len(np.unique(indices))
+    return misses / (len(indices) // 3), misses / referenced
+
+
+def optimize_vertex_cache(indices: np.ndarray, vertex_count: int, cache_size: int = VERTEX_CACHE_SIZE) -> np.ndarray:
+    """
+    Reorders the triangles for the vertex cache (Forsyth). Returns the new uint32 indices.
+    """
+    triangles = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    face_count = len(triangles)
+    if face_count == 0:
+        return np.zeros(0, dtype=np.uint32)
+
+    # Vertex -> triangles around it (CSR). The first live_count[v] entries are the triangles not emitted yet.
+    flat = triangles.ravel()
+    valence = np.bincount(flat, minlength=vertex_count)
+    offsets = np.concatenate([[0], np.cumsum(valence)]).tolist()
+    adjacency = (np.argsort(flat, kind="stable") // 3).tolist()
+    live_count = valence.tolist()
+
+    # Score tables
+    cache_scores = [_LAST_TRIANGLE_SCORE] * 3 + [
+        (1.0 - (i - 3) / (cache_size - 3)) ** _CACHE_DECAY_POWER for i in range(3, cache_size)
+    ]
+    max_valence = int(valence.max())
+    valence_scores = [0.0] + [_VALENCE_BOOST_SCALE * count ** -_VALENCE_BOOST_POWER for count in range(1, max_valence + 1)]
+
+    def vertex_score(v: int, position: int) -> float:
+        if live_count[v] == 0:
+            # No triangle left to use it
+            return -1.0
+        score = cache_scores[position] if position >= 0 else 0.0
+        return score + valence_scores[live_count[v]]
+
+    tris = triangles.tolist()
+    cache_position = [-1] * vertex_count
+    vertex_scores = [vertex_score(v, -1) for v in range(vertex_count)]
+    triangle_scores = [vertex_scores[a] + vertex_scores[b] + vertex_scores[c] for a, b, c in tris]
+    emitted = [False] * face_count
+
+    order: List[int] = []
+    cache: List[int] = []
+    best = max(range(face_count), key=triangle_scores.__getitem__)
+    cursor = 0
+
+    while best >= 0:
+        order.append(best)
+        emitted[best] = True
+        corners = tris[best]
+
+        # The emitted triangle no longer counts in the valence of its vertices
+        for v in corners:
+            start = offsets[v]
+            end = start + live_count[v] - 1
+            for i in range(start, end + 1):
+                if adjacency[i] == best:
+                    adjacency[i], adjacency[end] = adjacency[end], adjacency[i]
+                    break
+            live_count[v] -= 1
+
+        # LRU: the 3 vertices go to the front, the oldest ones fall out
+        new_cache = list(corners) + [v for v in cache if v not in corners]
+        for v in new_cache[cache_size:]:
+            cache_position[v] = -1
+            vertex_scores[v] = vertex_score(v, -1)
+        touched = new_cache
+        new_cache = new_cache[:cache_size]
+        for position, v in enumerate(new_cache):
+            cache_position[v] = position
+            vertex_scores[v] = vertex_score(v, position)
+        cache = new_cache
+
+        # Rescore the triangles around every vertex whose score changed, pick the best one
+        best = -1
+        best_score = -1.0
+        for v in touched:
+            start = offsets[v]
+            for i in range(start, start + live_count[v]):
+                face = adjacency[i]
+                a, b, c = tris[face]
+                score = vertex_scores[a] + vertex_scores[b] + vertex_scores[c]
+                triangle_scores[face] = score
+                if score > best_score:
+                    best, best_score = face, score
+
+        # Dead end (nothing left around the cache): continue with the next triangle in input order
+        if best < 0:
+            while cursor < face_count and emitted[cursor]:
+                cursor += 1
+            best = cursor if cursor < face_count else -1
+
+    return triangles[order].ravel().astype(np.uint32)
+
+
+def _update_cache(timestamps: List[int], timestamp: int, corners, cache_size: int) -> Tuple[int, int]:
+    """FIFO cache step for one triangle: returns (misses, new timestamp)."""
+    misses = 0
+    for v in corners:
+        if timestamp - timestamps[v] > cache_size:
+            timestamps[v] = timestamp
+            timestamp += 1
+            misses += 1
+    return misses, timestamp
+
+
+def _cluster_starts(tris: List[List[int]], vertex_count: int, cache_size: int, threshold: float) -> List[int]:
+    """
+    Cuts a cache-optimized triangle list into clusters.
+    Hard boundaries: triangles missing the cache on all 3 vertices (a new patch starts).
+    Soft boundaries: inside a patch, the earliest points where the cache efficiency so far is
+    within `threshold` of the whole patch (reordering there costs almost nothing).
+    """
+    timestamps = [-cache_size - 1] * vertex_count
+    timestamp = 0
+    hard = []
+    for face, corners in enumerate(tris):
+        misses, timestamp = _update_cache(timestamps, timestamp, corners, cache_size)
+        if face == 0 or misses == 3:
+            hard.append(face)
+    hard.append(len(tris))
+
+    # Emptying the cache = moving the clock past the lifetime of every entry (no O(V) reset per patch)
+    flush = cache_size + 1
+
+    starts = []
+    for start, end in zip(hard[:-1], hard[1:]):
+        # ACMR of the whole patch
+        timestamp += flush
+        patch_misses = 0
+        for face in range(start, end):
+            misses, timestamp = _update_cache(timestamps, timestamp, tris[face], cache_size)
+            patch_misses += misses
+        patch_threshold = threshold * patch_misses / (end - start)
+
+        timestamp += flush
+        cluster_start = start
+        cluster_misses = 0
+        starts.append(start)
+        for face in range(start, end):
+            misses, timestamp = _update_cache(timestamps, timestamp, tris[face], cache_size)
+            cluster_misses += misses
+            if face + 1 < end and cluster_misses / (face + 1 - cluster_start) <= patch_threshold:
+                # Next cluster starts with a cold cache, like the hardware would see it after a reorder
+                cluster_start = face + 1
+                cluster_misses = 0
+                timestamp += flush
+                starts.append(cluster_start)
+
+    return starts
+
+
+def optimize_overdraw(indices: np.ndarray, positions: np.ndarray, threshold: float = OVERDRAW_THRESHOLD,
+                      cache_size: int = ANALYZE_CACHE_SIZE) -> np.ndarray:
+    """
+    Reorders the clusters of a cache-optimized index list so the outer surfaces are drawn first.
+    :param positions: (V, 3) vertex positions.
+    :param threshold: Maximum ACMR increase accepted inside a cluster (1.05 = 5%).
+    """
+    triangles = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    if len(triangles) < 2:
+        return triangles.ravel().astype(np.uint32)
+
+    starts = _cluster_starts(triangles.tolist(), len(positions), cache_size, threshold)
+    if len(starts) < 2:
+        return triangles.ravel().astype(np.uint32)
+
+    # Area-weighted centroid & normal of every cluster
+    p0, p1, p2 = (positions[triangles[:, i]].astype(np.float64) for i in range(3))
+    cross = np.cross(p1 - p0, p2 - p0)
+    areas = np.linalg.norm(cross, axis=1) * 0.5
+    centers = (p0 + p1 + p2) / 3.0
+
+    bounds = np.array(starts + [len(triangles)])
+    cluster_areas = np.add.reduceat(areas, starts)
+    cluster_centers = np.add.reduceat(centers * areas[:, None], starts) / np.maximum(cluster_areas, 1e-12)[:, None]
+    cluster_normals = np.add.reduceat(cross, starts)
+    cluster_normals /= np.maximum(np.linalg.norm(cluster_normals, axis=1, keepdims=True), 1e-12)
+
+    mesh_center = (centers * areas[:, None]).sum(axis=0) / max(areas.sum(), 1e-12)
+
+    # Clusters facing away from the mesh center are likely in front: draw them first
+    sort_keys = ((cluster_centers - mesh_center) * cluster_normals).sum(axis=1)
+    cluster_order = np.argsort(-sort_keys, kind="stable")
+
+    faces = np.concatenate([np.arange(bounds[c], bounds[c + 1]) for c in cluster_order])
+    return triangles[faces].ravel().astype(np.uint32)
+
+
+def optimize_vertex_fetch(vertices: np.ndarray, indices: np.ndarray, floats_per_vertex: int = FLOATS_PER_VERTEX) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Renumbers the vertices in the order the indices first reference them
+    (unreferenced vertices are dropped). Returns (vertices, indices).
+    """
+    rows = np.asarray(vertices, dtype=np.float32).reshape(-1, floats_per_vertex)
+    indices = np.asarray(indices, dtype=np.int64).ravel()
+    if len(indices) == 0:
+        return rows[:0].ravel(), np.zeros(0, dtype=np.uint32)
+
+    used, first = np.unique(indices, return_index=True)
+    order = used[np.argsort(first)]
+
+    remap = np.full(len(rows), -1, dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    return np.ascontiguousarray(rows[order]).ravel(), remap[indices].astype(np.uint32)
+
+
+def optimize_mesh(vertices: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs the whole pipeline (vertex cache, overdraw, vertex fetch) on an indexed mesh.
+    Returns (vertices, indices), drawing the same triangles.
+    """
+    rows = np.asarray(vertices, dtype=np.float32).reshape(-1, FLOATS_PER_VERTEX)
+    indices = optimize_vertex_cache(indices, len(rows))
+    indices = optimize_overdraw(indices, rows[:, 0:3])
+    return optimize_vertex_fetch(rows, indices)
+
+
+# =============================================================================
+# CLASS: MeshOptimizer
+# optimize_mesh() with ACMR/ATVR reporting & an on-disk cache, for imported meshes.
+# =============================================================================
+class MeshOptimizer:
+    """
+    The optimization is deterministic: its result is cached in cache_dir under a key
+    derived from the input geometry, so later startups only hash the mesh and load it.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = ".cache/mesh_optimizer"):
+        """
+        :param cache_dir: Directory of the on-disk cache (None = always optimize).
+        """
+        self.cache_dir = cache_dir
+
+    def optimize(self, vertices: np.ndarray, indices: np.ndarray, name: str = "mesh") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the optimized (vertices, indices) and logs the cache efficiency before & after.
+        """
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        indices = np.ascontiguousarray(indices, dtype=np.uint32)
+        if len(indices) < 3:
+            return vertices, indices
+
+        key = self._cache_key(vertices, indices)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+
+        vertex_count = len(vertices) // FLOATS_PER_VERTEX
+        acmr_before, atvr_before = analyze_vertex_cache(indices, vertex_count)
+
+        optimized_vertices, optimized_indices = optimize_mesh(vertices, indices)
+
+        acmr_after, atvr_after = analyze_vertex_cache(optimized_indices, len(optimized_vertices) // FLOATS_PER_VERTEX)
+        Logger.info(f"[MeshOptimizer] {name}: ACMR {acmr_before:.3f} -> {acmr_after:.3f}, ATVR {atvr_before:.3f} -> {atvr_after:.3f}")
+
+        self._save(key, optimized_vertices, optimized_indices)
+        return optimized_vertices, optimized_indices
+
+    # =========================================================================
+    # DISK CACHE
+    # =========================================================================
+
+    def _cache_key(self, vertices: np.ndarray, indices: np.ndarray) -> str:
+        digest = hashlib.sha1()
+        digest.update(f"{self.CACHE_VERSION}:{VERTEX_CACHE_SIZE}:{ANALYZE_CACHE_SIZE}:{OVERDRAW_THRESHOLD}".encode())
+        digest.update(vertices.tobytes())
+        digest.update(b"|")
+        digest.update(indices.tobytes())
+        return digest.hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _load(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        if not self.cache_dir or not os.path.exists(self._cache_path(key)):
+            return None
+        try:
+            with np.load(self._cache_path(key)) as data:
+                return data["vertices"].astype(np.float32), data["indices"].astype(np.uint32)
+        except (OSError, ValueError, KeyError) as e:
+            Logger.warning(f"[MeshOptimizer] Ignoring unreadable mesh cache: {e}")
+            return None
+
+    def _save(self, key: str, vertices: np.ndarray, indices: np.ndarray) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Written under a temporary name first: a cache file is always complete
+            temp_path = self._cache_path(key) + ".tmp"
+            with open(temp_path, "wb") as f:
+                np.savez(f, vertices=vertices, indices=indices)
+            os.replace(temp_path, self._cache_path(key))
+        except OSError as e:
+            Logger.warning(f"[MeshOptimizer] Could not write the mesh cache: {e}")
@@ -0,0 +1,233 @@
+import heapq
+import numpy as np
+from typing import List, Sequence, Tuple
+
+# Vertex Format: [x, y, z, nx, ny, nz, u, v]
+FLOATS_PER_VERTEX = 8
+
+# Positions closer than this are considered the same vertex (OBJ files duplicate them per face)
+WELD_EPSILON = 1e-5
+
+# Weight of the planes that keep open borders and UV/normal seams in place
+BOUNDARY_WEIGHT = 1000.0
+
+# A collapse is rejected if it rotates a triangle normal by more than ~80 degrees (or flips it)
+MIN_NORMAL_DOT = 0.2
+
+
+# =============================================================================
+# MESH SIMPLIFICATION (Quadric Error Metrics, Garland & Heckbert 1997)
+# Works on the non-indexed vertex arrays used by Mesh:
+# - Vertices sharing a position are welded to rebuild the topology.
+# - Every position accumulates the quadrics (squared distances to planes) of its triangles.
+# - Edges are collapsed one by one, cheapest first, onto the endpoint with the smallest error.
+# Collapsing onto an existing endpoint keeps the silhouette on the original surface and lets
+# every triangle corner keep its own normal & UV.
+# =============================================================================
+
+def _weld(vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns (positions (V, 3), triangles (F, 3) of position ids, corner attributes (F, 3, 5)).
+    Triangles that become degenerate after welding are dropped.
+    """
+    corners = np.asarray(vertices, dtype=np.float32).reshape(-1, 3, FLOATS_PER_VERTEX)
+
+    keys = np.round(corners[:, :, 0:3].reshape(-1, 3) / WELD_EPSILON).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+    positions = corners[:, :, 0:3].reshape(-1, 3)[first].astype(np.float64)
+    triangles = inverse.reshape(-1, 3)
+
+    valid = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2])
+    return positions, triangles[valid], corners[valid, :, 3:8]
+
+
+def _plane_quadrics(normals: np.ndarray, points: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted quadrics (N, 4, 4) of the planes through `points` with unit `normals`."""
+    planes = np.concatenate([normals, -(normals * points).sum(axis=1, keepdims=True)], axis=1)
+    return planes[:, :, None] * planes[:, None, :] * weights[:, None, None]
+
+
+def _vertex_quadrics(positions: np.ndarray, triangles: np.ndarray, attributes: np.ndarray) -> np.ndarray:
+    """
+    Sums the quadrics of the triangles around every vertex (area weighted),
+    plus heavy perpendicular planes along borders and attribute seams.
+    """
+    quadrics = np.zeros((len(positions), 4, 4), dtype=np.float64)
+
+    p0, p1, p2 = (positions[triangles[:, i]] for i in range(3))
+    cross = np.cross(p1 - p0, p2 - p0)
+    lengths = np.linalg.norm(cross, axis=1)
+    face_normals = cross / np.maximum(lengths, 1e-20)[:, None]
+
+    face_quadrics = _plane_quadrics(face_normals, p0, lengths * 0.5)
+    for i in range(3):
+        np.add.at(quadrics, triangles[:, i], face_quadrics)
+
+    # Half-edges: (face, a -> b) for the 3 sides of every triangle
+    side_start = np.array([0, 1, 2])
+    side_end = np.array([1, 2, 0])
+    a = triangles[:, side_start].ravel()
+    b = triangles[:, side_end].ravel()
+    faces = np.repeat(np.arange(len(triangles)), 3)
+    attr_a = attributes[:, side_start].reshape(-1, 5)
+    attr_b = attributes[:, side_end].reshape(-1, 5)
+
+    # Orient every half-edge attribute pair as (attribute at min id, attribute at max id)
+    swap = a > b
+    lo = np.where(swap, b, a)
+    hi = np.where(swap, a, b)
+    attr_lo = np.where(swap[:, None], attr_b, attr_a)
+    attr_hi = np.where(swap[:, None], attr_a, attr_b)
+
+    _, edge_ids, counts = np.unique(np.stack([lo, hi], axis=1), axis=0, return_inverse=True, return_counts=True)
+    edge_ids = edge_ids.ravel()
+
+    # Border edges (a single triangle) are always constrained
+    constrained = counts[edge_ids] == 1
+
+    # Seams: the two triangles of an edge disagree on the normal/UV of an endpoint
+    order = np.argsort(edge_ids, kind="stable")
+    sorted_ids = edge_ids[order]
+    pair = np.flatnonzero((sorted_ids[1:] == sorted_ids[:-1]) & (counts[sorted_ids[1:]] == 2))
+    first, second = order[pair], order[pair + 1]
+    seam = (np.abs(attr_lo[first] - attr_lo[second]).max(axis=1) > 1e-4) | \
+           (np.abs(attr_hi[first] - attr_hi[second]).max(axis=1) > 1e-4)
+    constrained[first[seam]] = True
+    constrained[second[seam]] = True
+
+    if constrained.any():
+        ca, cb, cf = a[constrained], b[constrained], faces[constrained]
+        edges = positions[cb] - positions[ca]
+        normals = np.cross(edges, face_normals[cf])
+        normal_lengths = np.linalg.norm(normals, axis=1)
+        normals /= np.maximum(normal_lengths, 1e-20)[:, None]
+
+        weights = BOUNDARY_WEIGHT * (edges ** 2).sum(axis=1)
+        border_quadrics = _plane_quadrics(normals, positions[ca], weights)
+        np.add.at(quadrics, ca, border_quadrics)
+        np.add.at(quadrics, cb, border_quadrics)
+
+    return quadrics
+
+
+def _build_output(positions: np.ndarray, triangles: np.ndarray, attributes: np.ndarray, alive: np.ndarray) -> np.ndarray:
+    """Rebuilds a flat [x, y, z, nx, ny, nz, u, v] array from the remaining triangles."""
+    kept = np.flatnonzero(alive)
+    out = np.empty((len(kept), 3, FLOATS_PER_VERTEX), dtype=np.float32)
+    out[:, :, 0:3] = positions[triangles[kept]]
+    out[:, :, 3:8] = attributes[kept]
+    return out.ravel()
+
+
+def simplify(vertices: np.ndarray, ratios: Sequence[float]) -> List[np.ndarray]:
+    """
+    Builds simplified versions of a triangle list.
+    :param vertices: Flat float32 array, 8 floats per vertex, 3 vertices per triangle.
+    :param ratios: Target triangle counts as fractions of the original, in decreasing order (e.g. [0.5, 0.25]).
+    :return: One vertex array per ratio. Levels that could not be reduced any further are omitted.
+    """
+    positions, triangles, attributes = _weld(vertices)
+    face_count = len(triangles)
+    if face_count == 0:
+        return []
+
+    quadrics = _vertex_quadrics(positions, triangles, attributes)
+
+    # Vertex -> triangles around it
+    vertex_faces: List[set] = [set() for _ in range(len(positions))]
+    for face, tri in enumerate(triangles.tolist()):
+        for v in tri:
+            vertex_faces[v].add(face)
+
+    alive = np.ones(face_count, dtype=bool)
+    live_faces = face_count
+    removed = np.zeros(len(positions), dtype=bool)
+    version = [0] * len(positions)
+    homogeneous = np.concatenate([positions, np.ones((len(positions), 1))], axis=1)
+
+    def collapse_cost(u: int, v: int) -> Tuple[float, int, int]:
+        """Returns (error, kept vertex, removed vertex) for the edge u-v."""
+        q = quadrics[u] + quadrics[v]
+        pu, pv = homogeneous[u], homogeneous[v]
+        cost_u = float(pu @ q @ pu)
+        cost_v = float(pv @ q @ pv)
+        if cost_u <= cost_v:
+            return cost_u, u, v
+        return cost_v, v, u
+
+    def push_edge(u: int, v: int) -> None:
+        cost, keep, remove = collapse_cost(u, v)
+        heapq.heappush(heap, (cost, keep, remove, version[keep], version[remove]))
+
+    # Initial edges
+    heap: List[Tuple[float, int, int, int, int]] = []
+    edges = np.sort(np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]]), axis=1)
+    for u, v in np.unique(edges, axis=0).tolist():
+        push_edge(u, v)
+
+    def collapse_flips(keep: int, remove: int) -> bool:
+        """True if moving `remove` onto `keep` would flip or squash one of its other triangles."""
+        for face in vertex_faces[remove]:
+            tri = triangles[face]
+            if keep in tri:
+                continue  # Disappears with the collapse
+            p = positions[tri]
+            before = np.cross(p[1] - p[0], p[2] - p[0])
+            p[tri == remove] = positions[keep]
+            after = np.cross(p[1] - p[0], p[2] - p[0])
+            length = np.linalg.norm(before) * np.linalg.norm(after)
+            if length <= 1e-20 or np.dot(before, after) < MIN_NORMAL_DOT * length:
+                return True
+        return False
+
+    results: List[np.ndarray] = []
+    targets = [max(1, int(face_count * ratio)) for ratio in ratios]
+    target_index = 0
+
+    while heap and target_index < len(targets):
+        # Snapshot every level reached
+        while target_index < len(targets) and live_faces <= targets[target_index]:
+            results.append(_build_output(positions, triangles, attributes, alive))
+            target_index += 1
+        if target_index >= len(targets):
+            break
+
+        cost, keep, remove, keep_version, remove_version = heapq.heappop(heap)
+        if removed[keep] or removed[remove] or version[keep] != keep_version or version[remove] != remove_version:
+            continue  # Outdated entry
+        if collapse_flips(keep, remove):
+            continue
+
+        # Collapse: triangles sharing the edge vanish, the others are rewired onto `keep`
+        for face in list(vertex_faces[remove]):
+            tri = triangles[face]
+            if keep in tri:
+                alive[face] = False
+                live_faces -= 1
+                for v in tri.tolist():
+                    vertex_faces[v].discard(face)
+            else:
+                tri[tri == remove] = keep
+                vertex_faces[keep].add(face)
+
+        vertex_faces[remove].clear()
+        removed[remove] = True
+        quadrics[keep] += quadrics[remove]
+        version[keep] += 1
+
+        # The cost of every edge around `keep` changed
+        neighbours = set()
+        for face in vertex_faces[keep]:
+            neighbours.update(triangles[face].tolist())
+        neighbours.discard(keep)
+        for n in neighbours:
+            push_edge(keep, n)
+
+    # Levels the mesh could not reach: keep the most simplified result once
+    if target_index < len(targets):
+        last = _build_output(positions, triangles, attributes, alive)
+        if live_faces < face_count and (not results or len(last) < len(results[-1])):
+            results.append(last)
+
+    return results
@@ -2,15 +2,17 @@ import os
 import numpy as np
 import pywavefront
 from pyengine.core.logger import Logger
+from pyengine.gl_utils.mesh import index_vertices
 
 def load_obj_model(file_path: str):
     """
     Loads an OBJ file and robustly standardizes geometry data.
-    Returns a list of dictionaries: [{'vertices': np.array, 'texture_path': str|None}, ...]
+    Returns a list of dictionaries: [{'vertices': np.array, 'indices': np.array, 'texture_path': str|None}, ...]
     
     Output Format guarantees:
     - 8 floats per vertex: Position (3) | Normal (3) | UV (2)
     - Layout: X, Y, Z, NX, NY, NZ, U, V
+    - Identical vertices are merged: 'indices' holds 3 indices per triangle
     """
     if not os.path.exists(file_path):
         Logger.error(f"OBJ File not found: {file_path}")
@@ -89,11 +91,12 @@ def load_obj_model(file_path: str):
             # --- Combine into standardized format: Pos(3), Norm(3), UV(2) ---
             # Order: X, Y, Z, NX, NY, NZ, U, V
             combined = np.hstack((positions, normals, uvs))
-            vertices_flat = combined.flatten()
+            vertices_flat, indices = index_vertices(combined.flatten())
 
             model_parts.append({
                 "name": name,
                 "vertices": vertices_flat,
+                "indices": indices,
                 "texture_path": texture_path
             })
                 
@@ -1,14 +1,34 @@
 import sys
 import glm
+import ctypes
+import numpy as np
 from sdl2 import *
 from OpenGL.GL import *
 from OpenGL.GL import shaders
 from pyengine.core.logger import Logger
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from pyengine.gl_utils.gl_state import GLState
 
 # =============================================================================
 # Handles the compilation, linking, and management of GLSL shaders.
 # =============================================================================
 class ShaderProgram:
+    # Binding point of every uniform block known by the engine.
+    # Any shader declaring one of these blocks is attached to it automatically after linking.
+    UNIFORM_BLOCK_BINDINGS = {
+        "Camera": 0,
+        "Lights": 1,
+    }
+
+    # Texture unit of every engine-owned sampler (unit 0 is left to the material texture).
+    # Assigned once after linking, like the uniform blocks.
+    SAMPLER_UNITS = {
+        "u_light_data": 1,
+        "u_cluster_data": 2,
+        "u_light_indices": 3,
+        "u_texture_array": 4,
+    }
+
     def __init__(self, vertex_code: str, fragment_code: str):
         """
         Standard constructor taking raw GLSL strings.
@@ -16,6 +36,7 @@ class ShaderProgram:
         """
         self.id = None
         self.uniforms = {}
+        self.attributes = {}
         self._compile(vertex_code, fragment_code)
 
     @classmethod
@@ -49,44 +70,93 @@ class ShaderProgram:
             vs = shaders.compileShader(vertex_code, GL_VERTEX_SHADER)
             fs = shaders.compileShader(fragment_code, GL_FRAGMENT_SHADER)
 
-            # Link them together into a program
-            self.id = shaders.compileProgram(vs, fs)
+            # Link them together into a program.
+            # Not validated yet: until _bind_samplers() runs, every sampler (sampler2D, samplerBuffer,
+            # sampler2DArray...) points at unit 0, which fails validation on strict drivers (Mesa).
+            self.id = shaders.compileProgram(vs, fs, validate=False)
 
             # Shaders are now linked into the program, we can delete the individual objects
             # to free up memory.
             glDeleteShader(vs)
             glDeleteShader(fs)
-        except shaders.ShaderCompilationError as e:
+        except (shaders.ShaderCompilationError, shaders.ShaderLinkError) as e:
             Logger.info(f"Shader Compilation Error: {e}")
             sys.exit(1)
 
+        self._bind_uniform_blocks()
+        self._bind_samplers()
+
+        # Validation depends on the current GL state: a failure is reported, not fatal
+        try:
+            self.id.check_validate()
+        except shaders.ShaderValidationError as e:
+            Logger.warning(f"Shader Validation Error: {e}")
+
+    def _bind_uniform_blocks(self) -> None:
+        """
+        Connects the uniform blocks declared by this program (e.g. 'Camera', 'Lights')
+        to their engine-wide binding points.
+        """
+        for block_name, binding in self.UNIFORM_BLOCK_BINDINGS.items():
+            block_index = glGetUniformBlockIndex(self.id, block_name.encode())
+            if block_index != GL_INVALID_INDEX:
+                glUniformBlockBinding(self.id, block_index, binding)
+
+    def _bind_samplers(self) -> None:
+        """
+        Sampler uniforms keep their value for the lifetime of the program,
+        so the engine-owned ones are assigned to their texture unit only once.
+        """
+        for sampler_name, unit in self.SAMPLER_UNITS.items():
+            loc = self.get_uniform_location(sampler_name)
+            if loc != -1:
+                GLState.use_program(self.id)
+                glUniform1i(loc, unit)
+
     def use(self) -> None:
         """Activates this shader program for subsequent rendering commands."""
-        glUseProgram(self.id)
+        GLState.use_program(self.id)
 
     def unuse(self) -> None:
         """Deactivates the current shader program."""
-        glUseProgram(0)
+        GLState.use_program(0)
 
     def get_attrib_location(self, attrib_name: str) -> int:
         """
         Retrieves the location ID of a specific attribute variable (e.g., 'a_position')
-        from the compiled shader program.
+        from the compiled shader program. Cached like the uniform locations.
+        """
+        loc = self.attributes.get(attrib_name)
+        if loc is None:
+            loc = glGetAttribLocation(self.id, attrib_name)
+            self.attributes[attrib_name] = loc
+        return loc
+
+    def get_uniform_location(self, name: str) -> int:
+        """
+        Retrieves the location of a uniform (-1 if the program does not use it).
+        Cached per program: the driver is only queried the first time a name is asked for.
         """
-        return glGetAttribLocation(self.id, attrib_name)
+        loc = self.uniforms.get(name)
+        if loc is None:
+            loc = glGetUniformLocation(self.id, name)
+            self.uniforms[name] = loc
+        return loc
     
     def set_uniform_matrix(self, name, matrix) -> None:
         """
-        Sends a GLM 4x4 matrix to the shader.
+        Sends a 4x4 matrix to the shader: a GLM matrix or a column-major (4, 4) float32 array
+        (a row of compose_matrices()).
         """
-        if name not in self.uniforms:
-            self.uniforms[name] = glGetUniformLocation(self.id, name)
-        
-        loc = self.uniforms[name]
+        loc = self.get_uniform_location(name)
         if loc != -1:
             # GL_FALSE because GLM is already Column-Major (OpenGL standard).
             # We use glm.value_ptr to get the raw C pointer of the matrix.
-            glUniformMatrix4fv(loc, 1, GL_FALSE, glm.value_ptr(matrix))
+            if isinstance(matrix, np.ndarray):
+                matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+                GLDispatch.glUniformMatrix4fv(loc, 1, GL_FALSE, matrix.ctypes.data_as(ctypes.POINTER(ctypes.c_float)))
+            else:
+                GLDispatch.glUniformMatrix4fv(loc, 1, GL_FALSE, glm.value_ptr(matrix))
     
     def destroy(self) -> None:
         """
@@ -94,6 +164,7 @@ class ShaderProgram:
         Must be called before the OpenGL context is destroyed.
         """
         if self.id:
+            GLState.forget_program(self.id)
             glDeleteProgram(self.id)
             self.id = None
             
\ No newline at end of file
@@ -1,11 +1,22 @@
 import sys
 import ctypes
+import numpy as np
 from OpenGL.GL import *
 from PIL import Image
 from pyengine.core.logger import Logger
+from pyengine.gl_utils.gl_state import GLState
 from typing import Optional
 
 
+def surface_pixels(surface) -> np.ndarray:
+    """
+    Returns a (height, pitch) uint8 view of the pixels of an SDL2 Surface (no copy).
+    Rows are top-first, as stored by SDL; pitch includes the row padding.
+    """
+    pixels_ptr = ctypes.cast(surface.pixels, ctypes.POINTER(ctypes.c_ubyte))
+    return np.ctypeslib.as_array(pixels_ptr, shape=(surface.h, surface.pitch))
+
+
 class Texture:
     def __init__(self, filepath: Optional[str] = None):
         # Generate a unique OpenGL texture identifier
@@ -20,8 +31,21 @@ class Texture:
         """
         Loads a standard image file (PNG, JPG) using Pillow.
         """
+        try:
+            # Load image using Pillow and force RGBA (Red, Green, Blue, Alpha)
+            image = Image.open(filepath).convert("RGBA")
+        except IOError as e:
+            Logger.info(f"Failed to load texture '{filepath}': {e}")
+            sys.exit(1)
+
+        self.load_image(image)
+
+    def load_image(self, image: Image.Image):
+        """
+        Uploads a Pillow image (e.g. an atlas page built in memory).
+        """
         # Bind the texture ID as the current active 2D texture
-        glBindTexture(GL_TEXTURE_2D, self.id)
+        GLState.bind_texture(None, self.id)
 
         # Set texture wrapping: Repeat the image if UV coordinates are > 1.0
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
@@ -31,50 +55,44 @@ class Texture:
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
 
-        try:
-            # Load image using Pillow and force RGBA (Red, Green, Blue, Alpha)
-            image = Image.open(filepath).convert("RGBA")
+        image = image.convert("RGBA")
             
-            # Flip image vertically. 
-            # OpenGL expects origin (0,0) at Bottom-Left, but images are stored Top-Left.
-            image = image.transpose(Image.FLIP_TOP_BOTTOM)
-            
-            img_data = image.tobytes()
-            self.width, self.height = image.size
-
-            # Upload texture data to the GPU
-            glTexImage2D(
-                GL_TEXTURE_2D,    # Target
-                0,                # Mipmap level (0 = base level)
-                GL_RGBA,          # Internal format (how GPU stores it)
-                self.width, self.height, 
-                0,                # Border (must be 0)
-                GL_RGBA,          # Format of the input data
-                GL_UNSIGNED_BYTE, # Data type of the pixel data
-                img_data          # The actual pixel bytes
-            )
-            
-            # Generate mipmaps (smaller versions of texture for optimization at distance)
-            glGenerateMipmap(GL_TEXTURE_2D)
-            
-        except IOError as e:
-            Logger.info(f"Failed to load texture '{filepath}': {e}")
-            sys.exit(1)
+        # Flip image vertically. 
+        # OpenGL expects origin (0,0) at Bottom-Left, but images are stored Top-Left.
+        image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        
+        img_data = image.tobytes()
+        self.width, self.height = image.size
+
+        # Upload texture data to the GPU
+        glTexImage2D(
+            GL_TEXTURE_2D,    # Target
+            0,                # Mipmap level (0 = base level)
+            GL_RGBA,          # Internal format (how GPU stores it)
+            self.width, self.height, 
+            0,                # Border (must be 0)
+            GL_RGBA,          # Format of the input data
+            GL_UNSIGNED_BYTE, # Data type of the pixel data
+            img_data          # The actual pixel bytes
+        )
+        
+        # Generate mipmaps (smaller versions of texture for optimization at distance)
+        glGenerateMipmap(GL_TEXTURE_2D)
 
         # Unbind the texture to prevent accidental modification
-        glBindTexture(GL_TEXTURE_2D, 0)
+        GLState.bind_texture(None, 0)
     
     def bind(self, slot: int = 0):
         """
         Binds the texture to a specific texture unit slot (e.g., GL_TEXTURE0).
         """
-        glActiveTexture(GL_TEXTURE0 + slot)
-        glBindTexture(GL_TEXTURE_2D, self.id)
+        GLState.bind_texture(slot, self.id)
 
-    def unbind(self):
-        glBindTexture(GL_TEXTURE_2D, 0)
+    def unbind(self, slot: int = 0):
+        GLState.bind_texture(slot, 0)
 
     def destroy(self):
+        GLState.forget_texture(self.id)
         glDeleteTextures(1, [self.id])
 
     @staticmethod
@@ -93,38 +111,17 @@ class Texture:
         texture.height = surface.h
 
         # =================================================================
-        # STEP 1: IN-MEMORY VERTICAL FLIP
+        # STEP 1: VERTICAL FLIP
         # =================================================================
-        # Since we cannot easily "transpose" a raw C pointer like a Pillow image,
-        # we manually swap the rows in memory using ctypes.
-        
-        pitch = surface.pitch       # Length of one row in bytes (includes padding)
-        height = surface.h
-        pixels_ptr = surface.pixels # Raw C pointer to the pixel data
-
-        # Create a temporary buffer to hold one row during the swap
-        temp_row_buffer = ctypes.create_string_buffer(pitch)
-
-        # Iterate over the top half of the image
-        for i in range(height // 2):
-            # Pointer to the current top row
-            top_row_ptr = pixels_ptr + (i * pitch)
-            # Pointer to the corresponding bottom row
-            bottom_row_ptr = pixels_ptr + ((height - i - 1) * pitch)
-
-            # Perform the swap:
-            # 1. Copy Top row -> Temp buffer
-            ctypes.memmove(temp_row_buffer, top_row_ptr, pitch)
-            # 2. Copy Bottom row -> Top row location
-            ctypes.memmove(top_row_ptr, bottom_row_ptr, pitch)
-            # 3. Copy Temp buffer (old Top) -> Bottom row location
-            ctypes.memmove(bottom_row_ptr, temp_row_buffer, pitch)
-            
+        # A reversed NumPy view of the rows, copied once into a contiguous array
+        # (the surface itself is left untouched).
+        pixel_data = np.ascontiguousarray(surface_pixels(surface)[::-1])
+
         # =================================================================
         # STEP 2: UPLOAD TO GPU
         # =================================================================
 
-        glBindTexture(GL_TEXTURE_2D, texture.id)
+        GLState.bind_texture(None, texture.id)
         
         # Handle SDL Pitch (Padding):
         # Calculate the exact row length in pixels (including padding).
@@ -136,10 +133,6 @@ class Texture:
         # Set alignment to 1 byte to prevent artifacts on odd-width images
         glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
 
-        # Get the raw bytes from the (now flipped) surface pointer
-        data_size = surface.pitch * surface.h
-        pixel_data = ctypes.string_at(surface.pixels, data_size)
-
         # SDL Surfaces usually use BGRA layout on standard architectures
         input_format = GL_BGRA
 
@@ -164,7 +157,7 @@ class Texture:
         glPixelStorei(GL_UNPACK_ROW_LENGTH, 0)
         glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
 
-        glBindTexture(GL_TEXTURE_2D, 0)
+        GLState.bind_texture(None, 0)
         
         return texture
     
\ No newline at end of file
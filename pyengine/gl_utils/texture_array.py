@@ -0,0 +1,118 @@
+from OpenGL.GL import *
+from typing import List, Optional
+from pyengine.gl_utils.gl_state import GLState
+
+
+# =============================================================================
+# CLASS: TextureArray
+# A GL_TEXTURE_2D_ARRAY "page": many same-size RGBA textures behind a single
+# texture binding, selected in the shader by a layer index.
+# =============================================================================
+class TextureArray:
+    """
+    Layers are added on the CPU (no GL call, safe from any thread) and uploaded the first
+    time the page is bound. When more layers are added after that, the GPU storage grows
+    (existing layers are read back and re-uploaded).
+
+    Draws using different layers of the same page need no texture change in between:
+    only the layer index changes (a uniform/attribute, or a per-vertex value in merged meshes).
+    """
+    INITIAL_CAPACITY = 4
+
+    def __init__(self, width: int, height: int, max_layers: int = 64):
+        """
+        :param width: Width of every layer in pixels.
+        :param height: Height of every layer in pixels.
+        :param max_layers: Number of layers the page accepts before it is full.
+        """
+        self.id = None
+        self.width = width
+        self.height = height
+        self.max_layers = max_layers
+
+        # Layers added so far (uploaded or not)
+        self.layer_count = 0
+
+        # Layers allocated on the GPU
+        self._capacity = 0
+
+        # RGBA pixels (rows bottom-first) waiting for upload: [(layer, bytes), ...]
+        self._pending: List[tuple] = []
+
+    @property
+    def is_full(self) -> bool:
+        return self.layer_count >= self.max_layers
+
+    def add_layer(self, pixels: bytes) -> Optional[int]:
+        """
+        Queues a width x height RGBA image (OpenGL row order: bottom row first).
+        Returns its layer index, or None if the page is full.
+        """
+        if self.is_full:
+            return None
+        if len(pixels) != self.width * self.height * 4:
+            raise ValueError(f"Layer size mismatch: expected {self.width}x{self.height} RGBA")
+
+        layer = self.layer_count
+        self._pending.append((layer, pixels))
+        self.layer_count += 1
+        return layer
+
+    def upload(self) -> None:
+        """
+        Sends the queued layers to the GPU (called by bind(), on the thread owning the GL context).
+        """
+        if not self._pending:
+            return
+
+        if self.id is None:
+            self.id = glGenTextures(1)
+
+        GLState.bind_texture(None, self.id, GL_TEXTURE_2D_ARRAY)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+
+        if self.layer_count > self._capacity:
+            self._grow()
+
+        for layer, pixels in self._pending:
+            glTexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, 0, 0, layer, self.width, self.height, 1,
+                            GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+        self._pending = []
+
+        # Mipmaps are computed per layer (no bleeding between textures)
+        glGenerateMipmap(GL_TEXTURE_2D_ARRAY)
+
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
+        GLState.bind_texture(None, 0, GL_TEXTURE_2D_ARRAY)
+
+    def _grow(self) -> None:
+        """Re-allocates the storage with room for every layer (the page must be bound)."""
+        uploaded = self._capacity
+        old_pixels = None
+        if uploaded > 0:
+            old_pixels = glGetTexImage(GL_TEXTURE_2D_ARRAY, 0, GL_RGBA, GL_UNSIGNED_BYTE)
+
+        self._capacity = min(self.max_layers, max(self.layer_count, self._capacity * 2, self.INITIAL_CAPACITY))
+        glTexImage3D(GL_TEXTURE_2D_ARRAY, 0, GL_RGBA8, self.width, self.height, self._capacity, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, None)
+
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_S, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_T, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+
+        if old_pixels is not None:
+            glTexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, 0, 0, 0, self.width, self.height, uploaded,
+                            GL_RGBA, GL_UNSIGNED_BYTE, old_pixels)
+
+    def bind(self, slot: int) -> None:
+        """Uploads pending layers if needed and binds the page to a texture unit."""
+        self.upload()
+        GLState.bind_texture(slot, self.id, GL_TEXTURE_2D_ARRAY)
+
+    def destroy(self) -> None:
+        if self.id:
+            GLState.forget_texture(self.id)
+            glDeleteTextures(1, [self.id])
+            self.id = None
+        self._pending = []
@@ -0,0 +1,47 @@
+import ctypes
+from OpenGL.GL import *
+import numpy as np
+from pyengine.gl_utils.gl_state import GLState
+
+# =============================================================================
+# CLASS: UniformBuffer (UBO)
+# A GPU buffer holding the values of a GLSL "uniform block".
+# The same buffer is shared by every shader that declares the block.
+# =============================================================================
+class UniformBuffer:
+    def __init__(self, size: int, binding: int):
+        """
+        :param size: Size of the block in bytes (std140 layout).
+        :param binding: The binding point the block is attached to
+                        (see ShaderProgram.UNIFORM_BLOCK_BINDINGS).
+        """
+        self.id = glGenBuffers(1)
+        self.size = size
+        self.binding = binding
+
+        # Allocate the storage once, it is only updated afterwards
+        GLState.bind_buffer(GL_UNIFORM_BUFFER, self.id)
+        glBufferData(GL_UNIFORM_BUFFER, size, None, GL_DYNAMIC_DRAW)
+
+    def update(self, data_array: np.ndarray, offset: int = 0) -> None:
+        """
+        Uploads new content (a NumPy array already packed with the std140 rules).
+        """
+        GLState.bind_buffer(GL_UNIFORM_BUFFER, self.id)
+        glBufferSubData(GL_UNIFORM_BUFFER, offset, data_array.nbytes, data_array.ctypes.data_as(ctypes.c_void_p))
+
+    def bind(self) -> None:
+        """Attaches this buffer to its binding point. Every shader declaring the block will read from it."""
+        GLState.bind_buffer_base(GL_UNIFORM_BUFFER, self.binding, self.id)
+
+    def destroy(self) -> None:
+        """
+        Explicitly delete the buffer.
+        """
+        if self.id:
+            try:
+                GLState.forget_buffer(self.id)
+                glDeleteBuffers(1, [self.id])
+                self.id = None
+            except:
+                pass
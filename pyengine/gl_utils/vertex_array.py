@@ -2,6 +2,7 @@ import ctypes
 from sdl2 import *
 from OpenGL.GL import *
 from pyengine.gl_utils.vertex_buffer import VertexBuffer
+from pyengine.gl_utils.gl_state import GLState
 
 # =============================================================================
 # CLASS: VertexArray (VAO)
@@ -14,13 +15,14 @@ class VertexArray:
 
     def bind(self) -> None:
         """Binds this VAO. All subsequent VBO configs will be stored in this VAO."""
-        glBindVertexArray(self.id)
+        GLState.bind_vertex_array(self.id)
 
     def unbind(self) -> None:
         """Unbinds the current VAO."""
-        glBindVertexArray(0)
+        GLState.bind_vertex_array(0)
 
-    def add_attribute(self, vbo: VertexBuffer, shader_attrib_loc, count, stride=0, offset=0) -> None:
+    def add_attribute(self, vbo: VertexBuffer, shader_attrib_loc, count, stride=0, offset=0, divisor=0,
+                      gl_type=GL_FLOAT, normalized=False) -> None:
         """
         Configures an attribute (like position or color) for this VAO.
         
@@ -29,26 +31,43 @@ class VertexArray:
         :param count: Number of components per vertex (e.g., 3 for x,y,z).
         :param stride: Byte offset between consecutive attributes (0 = tightly packed).
         :param offset: Offset of the first component in the array.
+        :param divisor: 0 = one value per vertex, 1 = one value per instance (instanced drawing).
+        :param gl_type: Type of the stored components (GL_FLOAT, GL_HALF_FLOAT, GL_SHORT, GL_INT_2_10_10_10_REV...).
+                        The shader always reads floats: integer types are converted by the GPU.
+        :param normalized: Integer types only: map the integer range to [-1, 1] (signed) or [0, 1] (unsigned)
+                           instead of converting the value as is.
         """
         self.bind()
         vbo.bind()
 
         # Define the array of generic vertex attribute data
-        glVertexAttribPointer(shader_attrib_loc, count, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(offset))
+        glVertexAttribPointer(shader_attrib_loc, count, gl_type, GL_TRUE if normalized else GL_FALSE, stride, ctypes.c_void_p(offset))
         
         # Enable the generic vertex attribute array
         glEnableVertexAttribArray(shader_attrib_loc)
 
+        # Advance per vertex (0) or per instance (1)
+        glVertexAttribDivisor(shader_attrib_loc, divisor)
+
         # Unbind the VBO and VAO to keep state clean
         vbo.unbind()
         self.unbind()
 
+    def set_index_buffer(self, ibo) -> None:
+        """
+        Attaches an IndexBuffer to this VAO (the element buffer binding is part of the VAO state).
+        """
+        self.bind()
+        GLState.bind_buffer(GL_ELEMENT_ARRAY_BUFFER, ibo.id)
+        self.unbind()
+
     def destroy(self) -> None:
         """
         Explicitly delete the VAO.
         """
         if self.id:
             try:
+                GLState.forget_vertex_array(self.id)
                 glDeleteVertexArrays(1, [self.id])
                 self.id = None
             except:
@@ -2,35 +2,62 @@ import ctypes
 from sdl2 import *
 from OpenGL.GL import *
 import numpy as np
+from pyengine.gl_utils.gl_state import GLState
 
 # =============================================================================
 # CLASS: VertexBuffer (VBO)
 # Manages raw memory buffers on the GPU (vertices, colors, etc.).
 # =============================================================================
 class VertexBuffer:
-    def __init__(self, data_array: np.ndarray):
+    def __init__(self, data_array: np.ndarray, usage=GL_STATIC_DRAW):
+        """
+        :param data_array: The initial data to upload.
+        :param usage: GL_STATIC_DRAW for geometry uploaded once,
+                      GL_STREAM_DRAW for data rewritten every frame (see update()).
+        """
         # Generate 1 buffer ID
         self.id = glGenBuffers(1)
+        self.usage = usage
         self.bind()
 
         # Convert numpy array to a C-style void pointer for OpenGL
         data_ptr = data_array.ctypes.data_as(ctypes.c_void_p)
         data_size = data_array.nbytes
 
-        # Upload data to the GPU. 
+        # Upload data to the GPU.
         # GL_STATIC_DRAW indicates that data will be modified once and used many times.
-        glBufferData(GL_ARRAY_BUFFER, data_size, data_ptr, GL_STATIC_DRAW)
-        
+        glBufferData(GL_ARRAY_BUFFER, data_size, data_ptr, usage)
+        self.capacity = data_size
+
         # Unbind to prevent accidental modification
         self.unbind()
 
+    def update(self, data_array: np.ndarray) -> None:
+        """
+        Replaces the content of the buffer with new data.
+        The previous storage is "orphaned" (glBufferData with NULL) so the driver can hand us
+        fresh memory instead of waiting for the GPU to finish reading the old one.
+        The buffer grows if the new data does not fit.
+        """
+        data_ptr = data_array.ctypes.data_as(ctypes.c_void_p)
+        data_size = data_array.nbytes
+
+        self.bind()
+        if data_size > self.capacity:
+            # Grow geometrically to avoid reallocating every frame
+            self.capacity = max(data_size, self.capacity * 2)
+
+        glBufferData(GL_ARRAY_BUFFER, self.capacity, None, self.usage)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, data_size, data_ptr)
+        self.unbind()
+
     def bind(self) -> None:
         """Binds this buffer as the current GL_ARRAY_BUFFER."""
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        GLState.bind_buffer(GL_ARRAY_BUFFER, self.id)
 
     def unbind(self) -> None:
         """Unbinds the current GL_ARRAY_BUFFER."""
-        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        GLState.bind_buffer(GL_ARRAY_BUFFER, 0)
 
     def destroy(self) -> None:
         """
@@ -39,8 +66,8 @@ class VertexBuffer:
         """
         if self.id:
             try:
+                GLState.forget_buffer(self.id)
                 glDeleteBuffers(1, [self.id])
                 self.id = None
             except:
                 pass
-            
\ No newline at end of file
@@ -0,0 +1,214 @@
+import numpy as np
+from OpenGL.GL import *
+from typing import List
+
+
+class VertexAttribute:
+    """How one attribute is stored in the vertex buffer (arguments of VertexArray.add_attribute)."""
+    def __init__(self, name: str, count: int, gl_type: int, normalized: bool, offset: int):
+        self.name = name
+        self.count = count
+        self.gl_type = gl_type
+        self.normalized = normalized
+        self.offset = offset
+
+
+class VertexEncoding:
+    """
+    Result of VertexFormat.encode(): the GPU bytes & the per-mesh values undoing the quantization.
+    position = stored * position_scale + position_offset
+    uv       = stored * uv_scale + uv_offset
+    """
+    def __init__(self, data: np.ndarray, position_scale=(1.0, 1.0, 1.0), position_offset=(0.0, 0.0, 0.0),
+                 uv_scale=(1.0, 1.0), uv_offset=(0.0, 0.0)):
+        self.data = data
+        self.position_scale = position_scale
+        self.position_offset = position_offset
+        self.uv_scale = uv_scale
+        self.uv_offset = uv_offset
+
+
+# =============================================================================
+# CLASS: VertexFormat
+# GPU layout of the [x, y, z, nx, ny, nz, u, v] vertices of a Mesh.
+# =============================================================================
+class VertexFormat:
+    """
+    Positions:
+        "float"   - 3 x float32 (12 bytes)
+        "half"    - 3 x float16 relative to the mesh center (8 bytes with padding)
+        "snorm16" - 3 x int16 normalized to the mesh bounding box (8 bytes with padding)
+    Normals:
+        "float"           - 3 x float32 (12 bytes)
+        "oct16"           - octahedral encoding, 2 x int16 (4 bytes, decoded in mesh.vert)
+        "int_2_10_10_10"  - GL_INT_2_10_10_10_REV, 10 bits per axis (4 bytes)
+    UVs:
+        "float"   - 2 x float32 (8 bytes)
+        "unorm16" - 2 x uint16 normalized to the mesh UV range (4 bytes)
+
+    FLOAT is the original 32-byte layout, COMPACT takes 16 bytes per vertex.
+    The CPU copy of the mesh (Mesh.vertices) always stays in float32.
+    """
+    POSITION_FORMATS = ("float", "half", "snorm16")
+    NORMAL_FORMATS = ("float", "oct16", "int_2_10_10_10")
+    UV_FORMATS = ("float", "unorm16")
+
+    # Size in bytes of each encoding
+    _SIZES = {
+        ("position", "float"): 12, ("position", "half"): 8, ("position", "snorm16"): 8,
+        ("normal", "float"): 12, ("normal", "oct16"): 4, ("normal", "int_2_10_10_10"): 4,
+        ("uv", "float"): 8, ("uv", "unorm16"): 4,
+    }
+
+    # (component count, GL type, normalized)
+    _GL_TYPES = {
+        ("position", "float"): (3, GL_FLOAT, False),
+        ("position", "half"): (3, GL_HALF_FLOAT, False),
+        ("position", "snorm16"): (3, GL_SHORT, True),
+        ("normal", "float"): (3, GL_FLOAT, False),
+        ("normal", "oct16"): (2, GL_SHORT, True),
+        ("normal", "int_2_10_10_10"): (4, GL_INT_2_10_10_10_REV, True),
+        ("uv", "float"): (2, GL_FLOAT, False),
+        ("uv", "unorm16"): (2, GL_UNSIGNED_SHORT, True),
+    }
+
+    def __init__(self, position: str = "float", normal: str = "float", uv: str = "float"):
+        if position not in self.POSITION_FORMATS:
+            raise ValueError(f"Unknown position format '{position}' (expected one of {self.POSITION_FORMATS})")
+        if normal not in self.NORMAL_FORMATS:
+            raise ValueError(f"Unknown normal format '{normal}' (expected one of {self.NORMAL_FORMATS})")
+        if uv not in self.UV_FORMATS:
+            raise ValueError(f"Unknown uv format '{uv}' (expected one of {self.UV_FORMATS})")
+
+        self.position = position
+        self.normal = normal
+        self.uv = uv
+
+        # Interleaved layout: position, normal, uv (every offset stays 4-byte aligned)
+        self.attributes: List[VertexAttribute] = []
+        offset = 0
+        for shader_name, kind, encoding in (("a_position", "position", position), ("a_normal", "normal", normal), ("a_texcoord", "uv", uv)):
+            count, gl_type, normalized = self._GL_TYPES[(kind, encoding)]
+            self.attributes.append(VertexAttribute(shader_name, count, gl_type, normalized, offset))
+            offset += self._SIZES[(kind, encoding)]
+        self.stride = offset
+
+    @property
+    def is_float(self) -> bool:
+        """True for the original layout (the float32 vertices are uploaded as they are)."""
+        return self.position == "float" and self.normal == "float" and self.uv == "float"
+
+    @property
+    def octahedral_normals(self) -> bool:
+        return self.normal == "oct16"
+
+    def __repr__(self) -> str:
+        return f"VertexFormat(position={self.position!r}, normal={self.normal!r}, uv={self.uv!r}, stride={self.stride})"
+
+    # =========================================================================
+    # ENCODING
+    # =========================================================================
+
+    def encode(self, vertices: np.ndarray) -> VertexEncoding:
+        """
+        Quantizes float32 [x, y, z, nx, ny, nz, u, v] vertices into this layout.
+        """
+        rows = np.asarray(vertices, dtype=np.float32).reshape(-1, 8)
+        if self.is_float:
+            return VertexEncoding(np.ascontiguousarray(rows).ravel())
+
+        data = np.zeros((len(rows), self.stride), dtype=np.uint8)
+        encoding = VertexEncoding(data)
+
+        columns = (
+            self._encode_positions(rows[:, 0:3], encoding),
+            self._encode_normals(rows[:, 3:6]),
+            self._encode_uvs(rows[:, 6:8], encoding),
+        )
+        for attribute, column in zip(self.attributes, columns):
+            column = np.ascontiguousarray(column).view(np.uint8).reshape(len(rows), -1)
+            data[:, attribute.offset:attribute.offset + column.shape[1]] = column
+
+        return encoding
+
+    def _encode_positions(self, positions: np.ndarray, encoding: VertexEncoding) -> np.ndarray:
+        if self.position == "float":
+            return positions
+
+        if len(positions):
+            low, high = positions.min(axis=0), positions.max(axis=0)
+        else:
+            low = high = np.zeros(3, dtype=np.float32)
+        center = (low + high) * 0.5
+        encoding.position_offset = tuple(center.tolist())
+
+        if self.position == "half":
+            # Relative to the center: float16 is most precise near 0
+            padded = np.zeros((len(positions), 4), dtype=np.float16)
+            padded[:, 0:3] = positions - center
+            return padded
+
+        # snorm16: the bounding box is mapped to [-1, 1]
+        extent = np.maximum((high - low) * 0.5, 1e-8)
+        encoding.position_scale = tuple(extent.tolist())
+        padded = np.zeros((len(positions), 4), dtype=np.int16)
+        padded[:, 0:3] = np.round(np.clip((positions - center) / extent, -1.0, 1.0) * 32767.0)
+        return padded
+
+    def _encode_normals(self, normals: np.ndarray) -> np.ndarray:
+        if self.normal == "float":
+            return normals
+
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = normals / np.maximum(lengths, 1e-12)
+
+        if self.normal == "oct16":
+            return np.round(octahedral_encode(normals) * 32767.0).astype(np.int16)
+
+        # GL_INT_2_10_10_10_REV: x in bits 0-9, y in 10-19, z in 20-29 (signed, normalized), w = 0
+        quantized = np.round(np.clip(normals, -1.0, 1.0) * 511.0).astype(np.int32) & 0x3FF
+        packed = quantized[:, 0] | (quantized[:, 1] << 10) | (quantized[:, 2] << 20)
+        return packed.astype(np.uint32)
+
+    def _encode_uvs(self, uvs: np.ndarray, encoding: VertexEncoding) -> np.ndarray:
+        if self.uv == "float":
+            return uvs
+
+        # The UV range of the mesh (tiled UVs can exceed [0, 1]) is mapped to [0, 65535]
+        if len(uvs):
+            low, high = uvs.min(axis=0), uvs.max(axis=0)
+        else:
+            low = high = np.zeros(2, dtype=np.float32)
+        extent = np.maximum(high - low, 1e-8)
+        encoding.uv_scale = tuple(extent.tolist())
+        encoding.uv_offset = tuple(low.tolist())
+        return np.round((uvs - low) / extent * 65535.0).astype(np.uint16)
+
+
+def octahedral_encode(normals: np.ndarray) -> np.ndarray:
+    """
+    Maps unit vectors (N, 3) onto the [-1, 1] square (N, 2) of an octahedron unfolded flat.
+    Inverse of the decoding in mesh.vert.
+    """
+    projected = normals[:, 0:2] / np.maximum(np.abs(normals).sum(axis=1, keepdims=True), 1e-12)
+
+    # Lower hemisphere: fold the triangles over the diagonals
+    lower = normals[:, 2] < 0.0
+    signs = np.where(projected[lower] >= 0.0, 1.0, -1.0)
+    projected[lower] = (1.0 - np.abs(projected[lower][:, ::-1])) * signs
+    return projected
+
+
+def octahedral_decode(encoded: np.ndarray) -> np.ndarray:
+    """NumPy version of the mesh.vert decoding (N, 2) -> (N, 3) unit vectors."""
+    normals = np.zeros((len(encoded), 3), dtype=np.float32)
+    normals[:, 0:2] = encoded
+    normals[:, 2] = 1.0 - np.abs(encoded).sum(axis=1)
+    t = np.maximum(-normals[:, 2], 0.0)
+    normals[:, 0:2] += np.where(normals[:, 0:2] >= 0.0, -t[:, None], t[:, None])
+    return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+
+# Original 32-byte layout & the 16-byte one (50% smaller)
+VertexFormat.FLOAT = VertexFormat()
+VertexFormat.COMPACT = VertexFormat(position="snorm16", normal="int_2_10_10_10", uv="unorm16")
@@ -1,16 +1,30 @@
 from pyengine.ecs.entity_manager import EntityManager
 from pyengine.graphics.sprite import SpriteSheet, Animator
+from pyengine.graphics.packed_animation import PackedAnimations
 from pyengine.core.time_manager import TimeManager
 from pyengine.ecs.system import System
 from pyengine.ecs.resource import ResourceManager
 
 class Animation2dSystem(System):
+    def __init__(self, packed: bool = True):
+        """
+        :param packed: Advance all animations in one vectorized step (see PackedAnimations).
+                       False: one Python iteration per animated entity.
+        """
+        self.packed = packed
+        self.animations = PackedAnimations()
+
     def update(self, resource: ResourceManager):
         entity_manager: EntityManager = resource.get(EntityManager)
         time_manager: TimeManager = resource.get(TimeManager)
 
         dt = time_manager.delta_time
 
+        if self.packed:
+            self.animations.sync(entity_manager)
+            self.animations.advance(dt)
+            return
+
         for _, (sprite, animator) in entity_manager.get_entities_with(SpriteSheet, Animator):
             if not animator.is_playing or not animator.current_anim_name:
                 continue
@@ -23,6 +23,10 @@ class Camera2D(Component):
         # e.g., if set to 10.0, the screen will show 10 units from bottom to top.
         self.ortho_size = ortho_size
 
+        # Depth range of the projection (view-space distances along -Z)
+        self.near = -1.0
+        self.far = 100.0
+
     def resize(self, width: int, height: int) -> None:
         """
         Updates the camera dimensions when the window is resized.
@@ -58,7 +62,7 @@ class Camera2D(Component):
         bottom = -vertical_size / 2.0
         top = vertical_size / 2.0
         
-        return glm.ortho(left, right, bottom, top, -1.0, 100.0)
+        return glm.ortho(left, right, bottom, top, self.near, self.far)
     
 
 class Camera3D(Component):
@@ -70,6 +74,10 @@ class Camera3D(Component):
         self.width = width
         self.height = height
         self.fov = fov # Field of View in degrees
+
+        # Clipping planes distances
+        self.near = 0.1
+        self.far = 100.0
         
         # Orientation vectors
         # Front is initialized pointing towards negative Z (into the screen)
@@ -124,7 +132,7 @@ class Camera3D(Component):
         Returns Perspective Matrix.
         """
         aspect_ratio = self.width / self.height
-        return glm.perspective(glm.radians(self.fov), aspect_ratio, 0.1, 100.0)
+        return glm.perspective(glm.radians(self.fov), aspect_ratio, self.near, self.far)
 
     def get_view_matrix(self, transform: Transform) -> glm.mat4:
         """
@@ -0,0 +1,190 @@
+import glm
+import numpy as np
+from OpenGL.GL import *
+from typing import List, Tuple
+from pyengine.gl_utils.buffer_texture import BufferTexture
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.graphics.light import PointLight
+from pyengine.physics.transform import Transform
+
+
+# Depth slicing modes (stored in u_cluster_grid.w, must match shaders/mesh.frag)
+CLUSTERS_DISABLED = 0
+CLUSTERS_LOGARITHMIC = 1  # Perspective cameras: slices get thicker with distance
+CLUSTERS_LINEAR = 2       # Orthographic cameras
+
+
+# =============================================================================
+# CLASS: ClusteredLighting
+# Clustered forward shading: the view frustum is split into a 3D grid of clusters
+# and every point light is assigned to the clusters its sphere of influence touches.
+# Each fragment then only evaluates the lights of its own cluster.
+# =============================================================================
+class ClusteredLighting:
+    """
+    GPU data (buffer textures, read with texelFetch in shaders/mesh.frag):
+    - u_light_data    (RGBA32F, 3 texels per light): position+range, color+intensity, attenuation
+    - u_cluster_data  (RG32UI, 1 texel per cluster): offset & count in the index list
+    - u_light_indices (R32UI): light indices of every cluster, stored one cluster after another
+
+    Cluster index = x + grid_x * (y + grid_y * slice)
+    """
+    TEXELS_PER_LIGHT = 3
+
+    def __init__(self, grid: Tuple[int, int, int] = (16, 9, 24)):
+        self.grid = grid
+
+        self.light_data = BufferTexture(GL_RGBA32F)
+        self.cluster_data = BufferTexture(GL_RG32UI)
+        self.light_indices = BufferTexture(GL_R32UI)
+
+        # Cluster bounds only depend on the projection: cached until it changes
+        self._bounds_key = None
+        self._cluster_min = None
+        self._cluster_max = None
+
+        # Parameters of the last assignment (uploaded through the Lights uniform block)
+        self.mode = CLUSTERS_DISABLED
+        self.depth_scale = 0.0
+        self.depth_bias = 0.0
+
+        # Statistics of the last assignment
+        self.light_count = 0
+        self.max_lights_per_cluster = 0
+
+    # =========================================================================
+    # CLUSTER GEOMETRY
+    # =========================================================================
+
+    def _slice_depths(self, near: float, far: float, logarithmic: bool) -> np.ndarray:
+        """Returns the (slices + 1) view-space depths delimiting the depth slices."""
+        slices = self.grid[2]
+        k = np.arange(slices + 1, dtype=np.float64) / slices
+        if logarithmic:
+            return near * (far / near) ** k
+        return near + (far - near) * k
+
+    def _update_cluster_bounds(self, projection: glm.mat4, near: float, far: float, logarithmic: bool) -> None:
+        """
+        Computes the view-space AABB of every cluster (vectorized over the whole grid).
+        """
+        key = (tuple(np.array(projection).ravel()), near, far, logarithmic, self.grid)
+        if key == self._bounds_key:
+            return
+        self._bounds_key = key
+
+        grid_x, grid_y, grid_z = self.grid
+        inverse = np.linalg.inv(np.array(projection, dtype=np.float64))
+
+        # NDC coordinates of the tile corners: (grid_y + 1, grid_x + 1)
+        xs = np.linspace(-1.0, 1.0, grid_x + 1)
+        ys = np.linspace(-1.0, 1.0, grid_y + 1)
+        ndc_x, ndc_y = np.meshgrid(xs, ys)
+
+        def unproject(ndc_z):
+            points = np.stack([ndc_x, ndc_y, np.full_like(ndc_x, ndc_z), np.ones_like(ndc_x)], axis=-1)
+            view = points @ inverse.T
+            return view[..., :3] / view[..., 3:4]
+
+        # Every tile corner defines a line from the near plane to the far plane
+        near_points = unproject(-1.0)
+        far_points = unproject(1.0)
+
+        # Point of each corner line at each slice depth: (slices + 1, grid_y + 1, grid_x + 1, 3)
+        depths = self._slice_depths(near, far, logarithmic)
+        near_depth = -near_points[..., 2]
+        far_depth = -far_points[..., 2]
+        t = (depths[:, None, None] - near_depth[None]) / (far_depth - near_depth)[None]
+        points = near_points[None] + t[..., None] * (far_points - near_points)[None]
+
+        # The 8 corners of a cluster: 4 tile corners at the 2 slice depths
+        corners = np.stack([
+            points[:-1, :-1, :-1], points[:-1, :-1, 1:], points[:-1, 1:, :-1], points[:-1, 1:, 1:],
+            points[1:, :-1, :-1], points[1:, :-1, 1:], points[1:, 1:, :-1], points[1:, 1:, 1:],
+        ], axis=0)
+
+        # (clusters, 3) in (slice, y, x) order = cluster index order
+        self._cluster_min = corners.min(axis=0).reshape(-1, 3).astype(np.float32)
+        self._cluster_max = corners.max(axis=0).reshape(-1, 3).astype(np.float32)
+
+    # =========================================================================
+    # LIGHT ASSIGNMENT
+    # =========================================================================
+
+    @classmethod
+    def pack_lights(cls, point_lights: List[Tuple[PointLight, Transform]]) -> np.ndarray:
+        """
+        Copies the point lights into the GPU layout: (lights, 3 texels, 4 floats).
+        Done on the CPU side only (can be called while extracting a frame).
+        """
+        data = np.zeros((len(point_lights), cls.TEXELS_PER_LIGHT, 4), dtype=np.float32)
+        for i, (light, transform) in enumerate(point_lights):
+            data[i, 0] = (*transform.position, light.get_range())
+            data[i, 1] = (*light.color, light.intensity)
+            data[i, 2, 0:3] = (light.constant, light.linear, light.quadratic)
+        return data
+
+    def assign(self, light_data: np.ndarray, view: glm.mat4, projection: glm.mat4,
+               near: float, far: float, perspective: bool) -> None:
+        """
+        Assigns the lights to the clusters of the given camera and uploads the result.
+        :param light_data: Lights packed by pack_lights().
+        """
+        logarithmic = perspective and near > 0.0
+        self.mode = CLUSTERS_LOGARITHMIC if logarithmic else CLUSTERS_LINEAR
+        self._update_cluster_bounds(projection, near, far, logarithmic)
+
+        slices = self.grid[2]
+        if logarithmic:
+            log_ratio = np.log(far / near)
+            self.depth_scale = slices / log_ratio
+            self.depth_bias = slices * np.log(near) / log_ratio
+        else:
+            self.depth_scale = slices / (far - near)
+            self.depth_bias = near * self.depth_scale
+
+        # 1. Light data (already packed)
+        data = light_data
+        count = len(data)
+        self.light_count = count
+
+        # 2. Sphere vs cluster AABB test for every (cluster, light) pair
+        cluster_count = len(self._cluster_min)
+        if count > 0:
+            world = np.concatenate([data[:, 0, 0:3], np.ones((count, 1), dtype=np.float32)], axis=1)
+            centers = (world @ np.array(view, dtype=np.float32).T)[:, 0:3]
+            radii_sq = data[:, 0, 3] ** 2
+
+            # Squared distance from each sphere center to each box, accumulated axis by axis: (clusters, lights)
+            dist_sq = np.zeros((cluster_count, count), dtype=np.float32)
+            for axis in range(3):
+                c = centers[None, :, axis]
+                excess = np.maximum(self._cluster_min[:, None, axis] - c, 0.0) + np.maximum(c - self._cluster_max[:, None, axis], 0.0)
+                dist_sq += excess * excess
+
+            cluster_ids, light_ids = np.nonzero(dist_sq <= radii_sq[None, :])
+            counts = np.bincount(cluster_ids, minlength=cluster_count).astype(np.uint32)
+            indices = light_ids.astype(np.uint32)
+        else:
+            counts = np.zeros(cluster_count, dtype=np.uint32)
+            indices = np.zeros(0, dtype=np.uint32)
+
+        # np.nonzero walks the mask row by row: indices are already grouped by cluster
+        offsets = (np.cumsum(counts) - counts).astype(np.uint32)
+        self.max_lights_per_cluster = int(counts.max()) if cluster_count else 0
+
+        # 3. Upload
+        self.light_data.update(data.reshape(-1, 4))
+        self.cluster_data.update(np.stack([offsets, counts], axis=1))
+        self.light_indices.update(indices)
+
+    def bind(self) -> None:
+        """Binds the buffer textures to the units expected by the shaders."""
+        self.light_data.bind(ShaderProgram.SAMPLER_UNITS["u_light_data"])
+        self.cluster_data.bind(ShaderProgram.SAMPLER_UNITS["u_cluster_data"])
+        self.light_indices.bind(ShaderProgram.SAMPLER_UNITS["u_light_indices"])
+
+    def destroy(self) -> None:
+        self.light_data.destroy()
+        self.cluster_data.destroy()
+        self.light_indices.destroy()
@@ -0,0 +1,71 @@
+import math
+from pyengine.ecs.resource import Resource
+
+
+class DynamicResolution(Resource):
+    """
+    Controls the resolution scale of the world pass to hold a frame time budget.
+
+    The world is rendered at (scale * window size) into an offscreen target, then upscaled
+    to the window. The UI is always drawn at native resolution.
+    The cost of fill-rate bound frames is roughly proportional to the pixel count (scale^2),
+    so the scale is corrected by sqrt(budget / measured time), smoothed and quantized to avoid
+    visible resolution changes every frame.
+
+    The measured time is the rendering cost (GPU time of the passes, or CPU time of the submit),
+    not the frame delta: with V-Sync the delta never drops below the refresh interval.
+    """
+    def __init__(self, target_frame_time: float = 1.0 / 60.0, min_scale: float = 0.5, max_scale: float = 1.0,
+                 enabled: bool = True):
+        """
+        :param target_frame_time: Budget in seconds (1/60 = 60 FPS).
+        :param min_scale: Lowest allowed scale (0.5 = half width and half height).
+        :param max_scale: Highest allowed scale (1.0 = native resolution).
+        :param enabled: When False, the world is rendered directly into the window.
+        """
+        self.enabled = enabled
+        self.target_frame_time = target_frame_time
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+
+        # Changes smaller than this step are ignored (quantization)
+        self.step = 0.05
+
+        # Weight of the newest measurement in the moving average
+        self.smoothing = 0.1
+
+        # Scaling up is slower than scaling down (drop quickly on spikes, recover carefully)
+        self.headroom = 0.85
+
+        self.scale = max_scale
+        self.average_frame_time = target_frame_time
+
+    def update(self, frame_time: float) -> float:
+        """
+        Feeds the last measured render (GPU or CPU submit) time in seconds. Returns the new scale.
+        """
+        if frame_time <= 0.0:
+            return self.scale
+
+        self.average_frame_time += (frame_time - self.average_frame_time) * self.smoothing
+        ratio = self.target_frame_time / self.average_frame_time
+
+        if ratio < 1.0:
+            # Over budget: shrink
+            wanted = self.scale * math.sqrt(ratio)
+        elif ratio > 1.0 / self.headroom:
+            # Well under budget: grow
+            wanted = self.scale * math.sqrt(ratio * self.headroom)
+        else:
+            return self.scale
+
+        wanted = min(self.max_scale, max(self.min_scale, wanted))
+        if abs(wanted - self.scale) >= self.step:
+            quantized = round(wanted / self.step) * self.step
+            self.scale = min(self.max_scale, max(self.min_scale, quantized))
+
+        return self.scale
+
+    def get_render_size(self, width: int, height: int):
+        """Returns the size in pixels of the world pass for a window of the given size."""
+        return max(1, int(width * self.scale)), max(1, int(height * self.scale))
@@ -0,0 +1,80 @@
+import glm
+import numpy as np
+from typing import List, Optional, Tuple
+from pyengine.gl_utils.mesh import Mesh
+from pyengine.graphics.light import DirectionalLight
+from pyengine.graphics.material import MaterialState
+from pyengine.graphics.occlusion_culling import OccluderItem
+from pyengine.gui.font import Font
+
+
+class UIBoxItem:
+    """Snapshot of a UIBox and its position."""
+    def __init__(self, position: glm.vec3, width: float, height: float, color: tuple, border_radius: float,
+                 material: Optional[MaterialState], z_order: int = 0):
+        self.position = position
+        self.width = width
+        self.height = height
+        self.color = color
+        self.border_radius = border_radius
+        self.material = material
+        self.z_order = z_order
+
+
+class TextItem:
+    """
+    Snapshot of a TextRenderer. The entity identifies the string between frames
+    (the render side keeps its per-string texture).
+    """
+    def __init__(self, entity: int, font: Font, text: str, color: tuple, dirty: bool,
+                 position: glm.vec3, scale: glm.vec3, material: Optional[MaterialState]):
+        self.entity = entity
+        self.font = font
+        self.text = text
+        self.color = color
+        self.dirty = dirty
+        self.position = position
+        self.scale = scale
+        self.material = material
+
+
+# =============================================================================
+# CLASS: FramePacket
+# Everything the RenderSystem needs to draw one frame, copied out of the ECS
+# at the end of Update (extract phase). The submit phase only reads the packet,
+# so it can run on another thread while the next frame is simulated.
+# =============================================================================
+class FramePacket:
+    def __init__(self):
+        # Camera (has_camera = False: only the clear color & the UI are drawn)
+        self.has_camera = False
+        self.is_3d = False
+        self.view = glm.mat4(1.0)
+        self.projection = glm.mat4(1.0)
+        self.camera_position = glm.vec3(0.0)
+        self.near = 0.0
+        self.far = 1.0
+
+        # Lights: a copy of the directional light & point lights packed by ClusteredLighting.pack_lights()
+        self.dir_light: Optional[DirectionalLight] = None
+        self.point_lights: np.ndarray = np.zeros((0, 3, 4), dtype=np.float32)
+
+        # World draw items (parallel lists). uv_transforms[i] is None for entities without a SpriteSheet.
+        # models[i] is the column-major model matrix of meshes[i] (see Transform.get_matrices).
+        # Materials are snapshots: entities sharing a Material share the same MaterialState.
+        self.meshes: List[Mesh] = []
+        self.materials: List[MaterialState] = []
+        self.models: np.ndarray = np.zeros((0, 4, 4), dtype=np.float32)
+        self.uv_transforms: List[Optional[Tuple[float, float, float, float]]] = []
+
+        # Geometry rasterized by the OcclusionCuller (3D only)
+        self.occluders: List[OccluderItem] = []
+
+        # Static geometry to upload when the set of Static entities changed (see StaticBatcher.prepare)
+        # & the current state of the material of every static batch
+        self.static_geometry = None
+        self.static_materials: List[MaterialState] = []
+
+        # UI
+        self.ui_boxes: List[UIBoxItem] = []
+        self.texts: List[TextItem] = []
@@ -0,0 +1,118 @@
+import glm
+import numpy as np
+from typing import Optional, Tuple
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.gl_utils.uniform_buffer import UniformBuffer
+from pyengine.graphics.light import DirectionalLight
+from pyengine.graphics.clustered_lighting import ClusteredLighting
+
+
+def _mat4_to_std140(matrix: glm.mat4) -> np.ndarray:
+    # np.array() gives the mathematical layout (rows), GLSL expects columns
+    return np.array(matrix, dtype=np.float32).T.ravel()
+
+
+# =============================================================================
+# CLASS: FrameUniforms
+# Owns the uniform buffers shared by all shaders (camera & lights).
+# They are uploaded once per frame instead of once per drawn entity.
+# =============================================================================
+class FrameUniforms:
+    """
+    std140 layouts (must match the blocks declared in shaders/mesh.vert & mesh.frag):
+
+    layout(std140) uniform Camera {     // 208 bytes
+        mat4 u_view;
+        mat4 u_projection;
+        mat4 u_view_projection;
+        vec4 u_camera_position;         // xyz
+    };
+
+    layout(std140) uniform Lights {     // 96 bytes
+        vec4 u_ambient_color;           // rgb
+        vec4 u_dir_light_direction;     // xyz
+        vec4 u_dir_light_color;         // rgb, a = intensity (0 = no directional light)
+        ivec4 u_cluster_grid;           // xyz = cluster counts, w = depth slicing mode (0 = no point lights)
+        vec4 u_cluster_depth;           // x = scale, y = bias (slice = f(depth) * scale - bias)
+        vec4 u_viewport;                // x, y, width, height (to find the tile of gl_FragCoord)
+    };
+
+    Point lights themselves live in buffer textures (see ClusteredLighting).
+    """
+    CAMERA_BLOCK_SIZE = 3 * 64 + 16
+    LIGHTS_BLOCK_SIZE = 6 * 16
+
+    AMBIENT_COLOR = (0.1, 0.1, 0.1)
+
+    def __init__(self):
+        camera_binding = ShaderProgram.UNIFORM_BLOCK_BINDINGS["Camera"]
+        lights_binding = ShaderProgram.UNIFORM_BLOCK_BINDINGS["Lights"]
+
+        # World camera/lights (updated every frame) and UI versions (screen-space ortho, unlit)
+        self.world_camera = UniformBuffer(self.CAMERA_BLOCK_SIZE, camera_binding)
+        self.world_lights = UniformBuffer(self.LIGHTS_BLOCK_SIZE, lights_binding)
+        self.ui_camera = UniformBuffer(self.CAMERA_BLOCK_SIZE, camera_binding)
+        self.ui_lights = UniformBuffer(self.LIGHTS_BLOCK_SIZE, lights_binding)
+
+        # UI is never lit: full ambient, no directional light, clusters disabled
+        self.ui_lights.update(self.pack_lights(None, ambient=(1.0, 1.0, 1.0)))
+
+    # =========================================================================
+    # PACKING (std140)
+    # =========================================================================
+
+    @staticmethod
+    def pack_camera(view: glm.mat4, projection: glm.mat4, camera_position: glm.vec3) -> np.ndarray:
+        data = np.zeros(FrameUniforms.CAMERA_BLOCK_SIZE // 4, dtype=np.float32)
+        data[0:16] = _mat4_to_std140(view)
+        data[16:32] = _mat4_to_std140(projection)
+        data[32:48] = _mat4_to_std140(projection * view)
+        data[48:51] = tuple(camera_position)
+        data[51] = 1.0
+        return data
+
+    @classmethod
+    def pack_lights(cls, dir_light: Optional[DirectionalLight], clusters: Optional[ClusteredLighting] = None,
+                    viewport: Tuple[int, int, int, int] = (0, 0, 1, 1), ambient=AMBIENT_COLOR) -> np.ndarray:
+        data = np.zeros(cls.LIGHTS_BLOCK_SIZE // 4, dtype=np.float32)
+        data[0:3] = ambient
+
+        if dir_light:
+            data[4:7] = tuple(dir_light.direction)
+            data[8:11] = tuple(dir_light.color)
+            data[11] = dir_light.intensity
+
+        # ivec4 u_cluster_grid: written through an int32 view of the same memory
+        if clusters:
+            data.view(np.int32)[12:16] = (*clusters.grid, clusters.mode)
+            data[16:18] = (clusters.depth_scale, clusters.depth_bias)
+
+        data[20:24] = viewport
+        return data
+
+    # =========================================================================
+    # PER-FRAME API
+    # =========================================================================
+
+    def update_world(self, view: glm.mat4, projection: glm.mat4, camera_position: glm.vec3,
+                     dir_light: Optional[DirectionalLight], clusters: Optional[ClusteredLighting],
+                     viewport: Tuple[int, int, int, int]) -> None:
+        """Uploads the camera & lights used by the world pass (once per frame)."""
+        self.world_camera.update(self.pack_camera(view, projection, camera_position))
+        self.world_lights.update(self.pack_lights(dir_light, clusters, viewport))
+
+    def update_ui(self, projection: glm.mat4) -> None:
+        """Uploads the screen-space camera used by the UI pass."""
+        self.ui_camera.update(self.pack_camera(glm.mat4(1.0), projection, glm.vec3(0.0)))
+
+    def bind_world(self) -> None:
+        self.world_camera.bind()
+        self.world_lights.bind()
+
+    def bind_ui(self) -> None:
+        self.ui_camera.bind()
+        self.ui_lights.bind()
+
+    def destroy(self) -> None:
+        for buffer in (self.world_camera, self.world_lights, self.ui_camera, self.ui_lights):
+            buffer.destroy()
@@ -0,0 +1,73 @@
+import glm
+import numpy as np
+
+
+class Frustum:
+    """
+    The 6 clipping planes of a camera, extracted from its Projection x View matrix
+    (Gribb/Hartmann method). Works for both perspective (Camera3D) and orthographic (Camera2D) cameras.
+
+    All tests are vectorized: they take arrays of N bounding volumes and return a boolean mask.
+    """
+    def __init__(self, view_projection: glm.mat4):
+        # np.array() on a glm matrix gives the mathematical layout: m[row][col]
+        m = np.array(view_projection, dtype=np.float32)
+
+        # Plane equation: a*x + b*y + c*z + d >= 0 for points inside
+        planes = np.array([
+            m[3] + m[0],  # Left
+            m[3] - m[0],  # Right
+            m[3] + m[1],  # Bottom
+            m[3] - m[1],  # Top
+            m[3] + m[2],  # Near
+            m[3] - m[2],  # Far
+        ], dtype=np.float32)
+
+        # Normalize so that the plane equation returns real distances
+        lengths = np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        self.planes = planes / np.maximum(lengths, 1e-8)
+
+    def test_aabbs(self, centers: np.ndarray, extents: np.ndarray) -> np.ndarray:
+        """
+        Tests world-space boxes against the frustum.
+        :param centers: (N, 3) box centers.
+        :param extents: (N, 3) box half-sizes.
+        :return: (N,) boolean mask, True if the box is (at least partially) inside.
+        """
+        normals = self.planes[:, :3]
+
+        # Signed distance from each center to each plane: (N, 6)
+        distances = centers @ normals.T + self.planes[:, 3]
+
+        # Projected "radius" of the box on each plane normal: (N, 6)
+        radii = extents @ np.abs(normals).T
+
+        # Outside if fully behind at least one plane
+        return np.all(distances + radii >= 0.0, axis=1)
+
+    def test_spheres(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """
+        Tests world-space spheres against the frustum.
+        :param centers: (N, 3) sphere centers.
+        :param radii: (N,) sphere radii.
+        :return: (N,) boolean mask, True if the sphere is (at least partially) inside.
+        """
+        distances = centers @ self.planes[:, :3].T + self.planes[:, 3]
+        return np.all(distances + radii[:, None] >= 0.0, axis=1)
+
+
+def transform_aabbs(models: np.ndarray, local_min: np.ndarray, local_max: np.ndarray):
+    """
+    Transforms local boxes by their model matrices (Arvo's method).
+    :param models: (N, 4, 4) model matrices in mathematical layout (as given by np.array(glm.mat4)).
+    :param local_min: (N, 3) local box minimums.
+    :param local_max: (N, 3) local box maximums.
+    :return: (centers, extents), both (N, 3), of the world-space boxes enclosing the transformed boxes.
+    """
+    local_center = (local_min + local_max) * 0.5
+    local_extent = (local_max - local_min) * 0.5
+
+    linear = models[:, :3, :3]
+    centers = np.einsum("nij,nj->ni", linear, local_center) + models[:, :3, 3]
+    extents = np.einsum("nij,nj->ni", np.abs(linear), local_extent)
+    return centers, extents
@@ -0,0 +1,43 @@
+from typing import Dict
+from pyengine.ecs.resource import Resource
+
+
+class GPUProfile(Resource):
+    """
+    GPU time spent in each render pass, in milliseconds (filled by the RenderSystem).
+    Values are a few frames old (see GPUTimer): read them for display or logging, not for
+    decisions that must match the current frame.
+
+    Pass names: "clear", "world", "ui".
+    With profile_buckets enabled, the world pass is also split into "world/material N"
+    (runs of draws sharing a material, N = order of first appearance) and "world/sprites".
+
+    Disabled by default (timer queries cost a few GL calls per pass): set enabled = True,
+    e.g. resources.get(GPUProfile).enabled = True, to start collecting timings.
+    """
+    def __init__(self, enabled: bool = False, profile_buckets: bool = False):
+        self.enabled = enabled
+        self.profile_buckets = profile_buckets
+
+        # Section name -> GPU milliseconds
+        self.pass_ms: Dict[str, float] = {}
+
+        # Sum of the passes (not including the buckets twice)
+        self.total_ms = 0.0
+
+    def set_results(self, results: Dict[str, float]) -> None:
+        """
+        Stores the results of a GPUTimer frame.
+        Bucket timings are summed into "world" (timer queries cannot be nested).
+        """
+        pass_ms = dict(results)
+        buckets = [ms for name, ms in results.items() if name.startswith("world/")]
+        if buckets:
+            pass_ms["world"] = pass_ms.get("world", 0.0) + sum(buckets)
+
+        self.pass_ms = pass_ms
+        self.total_ms = sum(ms for name, ms in pass_ms.items() if "/" not in name)
+
+    def get(self, name: str) -> float:
+        """Returns the GPU milliseconds of a section (0.0 if unknown)."""
+        return self.pass_ms.get(name, 0.0)
@@ -1,3 +1,4 @@
+import math
 import glm
 from pyengine.ecs.component import Component
 
@@ -27,4 +28,23 @@ class PointLight:
         self.constant = 1.0
         self.linear = 0.09
         self.quadratic = 0.032
+
+    def get_range(self, threshold: float = 1.0 / 256.0) -> float:
+        """
+        Distance at which the light's contribution (brightest channel * intensity * attenuation)
+        falls below `threshold` (1/256: less than one step of an 8-bit color).
+        Used by clustered lighting to know which clusters the light touches; the falloff itself
+        is unchanged, so skipping the light beyond this distance has no visible effect.
+        """
+        peak = max(self.color) * self.intensity / threshold
+        if peak <= self.constant:
+            return 0.0
+
+        # Solve constant + linear * d + quadratic * d^2 = peak
+        c = self.constant - peak
+        if self.quadratic > 0.0:
+            return (-self.linear + math.sqrt(self.linear * self.linear - 4.0 * self.quadratic * c)) / (2.0 * self.quadratic)
+        if self.linear > 0.0:
+            return -c / self.linear
+        return math.inf
         
\ No newline at end of file
@@ -0,0 +1,57 @@
+from typing import List, Optional, Sequence
+from pyengine.ecs.component import Component
+from pyengine.gl_utils.mesh import Mesh
+
+
+class LODGroup(Component):
+    """
+    Level of detail: swaps the mesh of the entity's MeshRenderer depending on its size on screen.
+
+    The screen size is the projected diameter of the bounding sphere divided by the screen height
+    (1.0 = the object fills the screen vertically).
+    Level i + 1 is used once the screen size drops below screen_sizes[i].
+
+    To avoid popping back and forth around a threshold, a level only changes when the size is
+    beyond the threshold by a margin: (1 - hysteresis) to get coarser, (1 + hysteresis) to get finer.
+    """
+    # Default thresholds for 4 levels (full mesh + 3 LODs)
+    DEFAULT_SCREEN_SIZES = (0.25, 0.12, 0.05)
+
+    def __init__(self, levels: List[Mesh], screen_sizes: Optional[Sequence[float]] = None, hysteresis: float = 0.1):
+        """
+        :param levels: Meshes from the most detailed (level 0) to the least detailed.
+        :param screen_sizes: Decreasing thresholds, one per transition (len(levels) - 1 values).
+        :param hysteresis: Relative margin around each threshold.
+        """
+        self.levels = levels
+
+        if screen_sizes is None:
+            screen_sizes = self.DEFAULT_SCREEN_SIZES[:len(levels) - 1]
+        self.screen_sizes = list(screen_sizes)
+        self.hysteresis = hysteresis
+
+        # Level currently displayed (updated by the RenderSystem)
+        self.current_level = 0
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh, screen_sizes: Optional[Sequence[float]] = None, hysteresis: float = 0.1) -> "LODGroup":
+        """Creates a group from a mesh and the LODs generated by AssetManager.generate_lods()."""
+        return cls([mesh] + mesh.lods, screen_sizes, hysteresis)
+
+    def select_level(self, screen_size: float) -> int:
+        """
+        Updates current_level from the current screen size and returns it.
+        """
+        level = self.current_level
+        last = min(len(self.levels) - 1, len(self.screen_sizes))
+
+        # Coarser: the object became smaller than the threshold of the current level
+        while level < last and screen_size < self.screen_sizes[level] * (1.0 - self.hysteresis):
+            level += 1
+
+        # Finer: the object became bigger than the threshold of the previous level
+        while level > 0 and screen_size > self.screen_sizes[level - 1] * (1.0 + self.hysteresis):
+            level -= 1
+
+        self.current_level = level
+        return level
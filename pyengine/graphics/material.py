@@ -1,11 +1,40 @@
 from typing import Optional, Tuple
 from pyengine.gl_utils.shader import ShaderProgram
 from pyengine.gl_utils.texture import Texture
+from pyengine.gl_utils.texture_array import TextureArray
 
 
 class Material:
-    def __init__(self, shader: ShaderProgram, texture: Optional[Texture] = None, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)):
+    def __init__(self, shader: ShaderProgram, texture: Optional[Texture] = None, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), blend: bool = True,
+                 texture_page: Optional[TextureArray] = None, texture_layer: int = 0):
         self.shader = shader
         self.texture = texture
         self.color = color
-        
\ No newline at end of file
+
+        # Alternative to texture: a layer of a texture array page (see AssetManager.get_texture_layer).
+        # Materials sharing a page are drawn without changing textures, and can be merged by the StaticBatcher.
+        self.texture_page = texture_page
+        self.texture_layer = texture_layer
+
+        # Alpha blending on/off. Sprite batches are split whenever this changes.
+        self.blend = blend
+
+    def snapshot(self) -> "MaterialState":
+        """Copy of the render state, safe to read from the render thread."""
+        return MaterialState(self)
+
+
+class MaterialState:
+    """
+    Snapshot of a Material, copied into the FramePacket during extract.
+    The render thread draws with it while the main thread may already be changing the Material.
+    Same attributes as Material; treat them as read-only.
+    """
+    def __init__(self, material: Material):
+        self.shader = material.shader
+        self.texture = material.texture
+        self.color = tuple(material.color)
+        self.texture_page = material.texture_page
+        self.texture_layer = material.texture_layer
+        self.blend = material.blend
+        
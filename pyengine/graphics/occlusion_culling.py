@@ -0,0 +1,234 @@
+import glm
+import numpy as np
+from typing import List, Optional, Tuple
+from pyengine.ecs.component import Component
+from pyengine.gl_utils.mesh import Mesh
+
+
+class Occluder(Component):
+    """
+    Marks an entity whose geometry hides what is behind it (walls, big blocks, terrain...).
+    Occluders are drawn into the low-resolution depth buffer of the OcclusionCuller, then every
+    other candidate whose bounding box lies fully behind that depth is skipped.
+
+    The occluder mesh must stay inside the visible mesh (a simplified version, a slightly smaller
+    box...), otherwise objects visible around the visible mesh could be culled.
+    Only a few large occluders are worth it: every triangle is rasterized on the CPU each frame.
+    """
+    def __init__(self, mesh: Optional[Mesh] = None):
+        """
+        :param mesh: Geometry drawn into the occlusion buffer (None = the mesh of the entity's MeshRenderer).
+        """
+        self.mesh = mesh
+
+
+class OccluderItem:
+    """Snapshot of an occluder for the frame packet: local geometry & model matrix."""
+    def __init__(self, positions: np.ndarray, triangles: np.ndarray, model: np.ndarray):
+        self.positions = positions
+        self.triangles = triangles
+        self.model = model
+
+
+# =============================================================================
+# CLASS: OcclusionCuller
+# Software occlusion culling, entirely on the CPU (no GPU readback):
+# 1. The occluder triangles are rasterized into a small depth buffer (NumPy,
+#    all triangles at once).
+# 2. A hierarchical-Z pyramid keeps the farthest depth of every 2x2 block.
+# 3. Each candidate box is projected to a screen rectangle & its nearest depth,
+#    and compared to the pyramid level where the rectangle covers 2x2 texels.
+# =============================================================================
+class OcclusionCuller:
+    # Triangle pixels processed per NumPy pass (bounds the temporary arrays)
+    MAX_SAMPLES_PER_PASS = 1 << 20
+
+    # Points closer than this to the camera plane (clip w) are not rasterized / never culled
+    MIN_W = 1e-4
+
+    def __init__(self, width: int = 256, height: int = 128):
+        """
+        :param width: Width of the occlusion depth buffer in pixels.
+        :param height: Height of the occlusion depth buffer in pixels.
+        """
+        self.width = width
+        self.height = height
+
+        # Nearest occluder depth (NDC z, 1.0 = nothing) per pixel, row 0 at the bottom of the screen
+        self.depth = np.ones((height, width), dtype=np.float32)
+
+        # Hierarchical-Z: level i stores the farthest depth of 2^i x 2^i pixel blocks
+        self.pyramid: List[np.ndarray] = [self.depth]
+
+        self._view_projection = np.identity(4, dtype=np.float32)
+
+        # Triangles rasterized during the last render()
+        self.triangle_count = 0
+
+    # =========================================================================
+    # OCCLUDER RASTERIZATION
+    # =========================================================================
+
+    def render(self, occluders: List[OccluderItem], view_projection: glm.mat4) -> None:
+        """Clears the buffer, rasterizes the occluders and builds the hierarchical-Z pyramid."""
+        self._view_projection = np.array(view_projection, dtype=np.float32)
+        self.depth = np.ones((self.height, self.width), dtype=np.float32)
+        self.triangle_count = 0
+
+        if occluders:
+            clip, triangles = self._transform_occluders(occluders)
+            self._rasterize(clip, triangles)
+
+        self._build_pyramid()
+
+    def _transform_occluders(self, occluders: List[OccluderItem]) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the clip-space positions of every occluder vertex & the triangles indexing them."""
+        clip = []
+        triangles = []
+        base = 0
+        for occluder in occluders:
+            positions = np.concatenate([occluder.positions, np.ones((len(occluder.positions), 1), dtype=np.float32)], axis=1)
+            clip.append(positions @ (self._view_projection @ occluder.model).T)
+            triangles.append(occluder.triangles + base)
+            base += len(positions)
+
+        return np.concatenate(clip), np.concatenate(triangles)
+
+    def _rasterize(self, clip: np.ndarray, triangles: np.ndarray) -> None:
+        # Triangles crossing the camera plane would need clipping: skipping them only culls less
+        w = clip[:, 3]
+        triangles = triangles[np.all(w[triangles] > self.MIN_W, axis=1)]
+        if len(triangles) == 0:
+            return
+
+        safe_w = np.maximum(w, self.MIN_W)[:, None]
+        ndc = clip[:, 0:3] / safe_w
+        screen = np.empty_like(ndc)
+        screen[:, 0] = (ndc[:, 0] * 0.5 + 0.5) * self.width
+        screen[:, 1] = (ndc[:, 1] * 0.5 + 0.5) * self.height
+        screen[:, 2] = ndc[:, 2]
+
+        v0, v1, v2 = (screen[triangles[:, i]] for i in range(3))
+
+        # Twice the signed area: both windings are drawn (no face culling in the world pass)
+        area = (v1[:, 0] - v0[:, 0]) * (v2[:, 1] - v0[:, 1]) - (v1[:, 1] - v0[:, 1]) * (v2[:, 0] - v0[:, 0])
+
+        # Pixels whose center lies in the bounding rectangle (pixel i covers [i, i + 1))
+        corners = np.stack([v0, v1, v2], axis=1)
+        x0 = np.maximum(np.ceil(corners[:, :, 0].min(axis=1) - 0.5), 0).astype(np.int64)
+        x1 = np.minimum(np.floor(corners[:, :, 0].max(axis=1) - 0.5), self.width - 1).astype(np.int64)
+        y0 = np.maximum(np.ceil(corners[:, :, 1].min(axis=1) - 0.5), 0).astype(np.int64)
+        y1 = np.minimum(np.floor(corners[:, :, 1].max(axis=1) - 0.5), self.height - 1).astype(np.int64)
+
+        keep = (np.abs(area) > 1e-12) & (x1 >= x0) & (y1 >= y0) & (corners[:, :, 2].min(axis=1) <= 1.0)
+        if not np.any(keep):
+            return
+        v0, v1, v2, area = v0[keep], v1[keep], v2[keep], area[keep]
+        x0, x1, y0, y1 = x0[keep], x1[keep], y0[keep], y1[keep]
+        self.triangle_count += len(area)
+
+        span = x1 - x0 + 1
+        counts = span * (y1 - y0 + 1)
+
+        # Process the triangles in groups of about MAX_SAMPLES_PER_PASS pixels
+        ends = np.cumsum(counts)
+        start = 0
+        while start < len(counts):
+            offset = ends[start - 1] if start > 0 else 0
+            stop = max(int(np.searchsorted(ends, offset + self.MAX_SAMPLES_PER_PASS, side="right")), start + 1)
+            self._rasterize_group(slice(start, stop), v0, v1, v2, area, x0, y0, span, counts)
+            start = stop
+
+    def _rasterize_group(self, group: slice, v0, v1, v2, area, x0, y0, span, counts) -> None:
+        counts = counts[group]
+        triangle = np.repeat(np.arange(len(counts)), counts)
+        first = np.cumsum(counts) - counts
+        local = np.arange(counts.sum()) - np.repeat(first, counts)
+
+        px = x0[group][triangle] + local % span[group][triangle]
+        py = y0[group][triangle] + local // span[group][triangle]
+        cx = px + 0.5
+        cy = py + 0.5
+
+        a, b, c = v0[group][triangle], v1[group][triangle], v2[group][triangle]
+        inv_area = 1.0 / area[group][triangle]
+
+        # Barycentric weights (positive inside for both windings once divided by the signed area)
+        w0 = ((c[:, 0] - b[:, 0]) * (cy - b[:, 1]) - (c[:, 1] - b[:, 1]) * (cx - b[:, 0])) * inv_area
+        w1 = ((a[:, 0] - c[:, 0]) * (cy - c[:, 1]) - (a[:, 1] - c[:, 1]) * (cx - c[:, 0])) * inv_area
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= 0.0) & (w1 >= 0.0) & (w2 >= 0.0)
+
+        # NDC z is linear in screen space: interpolate without perspective correction
+        z = w0 * a[:, 2] + w1 * b[:, 2] + w2 * c[:, 2]
+        inside &= z >= -1.0
+
+        pixels = py[inside] * self.width + px[inside]
+        np.minimum.at(self.depth.reshape(-1), pixels, z[inside].astype(np.float32))
+
+    def _build_pyramid(self) -> None:
+        self.pyramid = [self.depth]
+        level = self.depth
+        while level.shape[0] > 1 or level.shape[1] > 1:
+            # Odd sizes: pad with "far" (the padded texels never make a box look hidden)
+            h, w = level.shape
+            padded = np.ones((h + h % 2, w + w % 2), dtype=np.float32)
+            padded[:h, :w] = level
+            level = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2).max(axis=(1, 3))
+            self.pyramid.append(level)
+
+    # =========================================================================
+    # VISIBILITY TESTS
+    # =========================================================================
+
+    def test_aabbs(self, centers: np.ndarray, extents: np.ndarray) -> np.ndarray:
+        """
+        Tests world-space boxes against the occlusion buffer of the last render().
+        :param centers: (N, 3) box centers.
+        :param extents: (N, 3) box half-sizes.
+        :return: (N,) boolean mask, True if the box may be visible.
+        """
+        count = len(centers)
+        visible = np.ones(count, dtype=bool)
+        if count == 0 or self.triangle_count == 0:
+            return visible
+
+        # The 8 corners of every box in clip space: (N, 8, 4)
+        signs = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float32)
+        corners = centers[:, None, :] + extents[:, None, :] * signs[None, :, :]
+        clip = np.concatenate([corners, np.ones((count, 8, 1), dtype=np.float32)], axis=2) @ self._view_projection.T
+
+        # Boxes reaching behind the camera plane are kept
+        w = clip[:, :, 3]
+        testable = np.all(w > self.MIN_W, axis=1)
+        ndc = clip[:, :, 0:3] / np.maximum(w, self.MIN_W)[:, :, None]
+
+        # Screen rectangle (pixels) & nearest depth of every box
+        min_x = np.clip((ndc[:, :, 0].min(axis=1) * 0.5 + 0.5) * self.width, 0, self.width - 1)
+        max_x = np.clip((ndc[:, :, 0].max(axis=1) * 0.5 + 0.5) * self.width, 0, self.width - 1)
+        min_y = np.clip((ndc[:, :, 1].min(axis=1) * 0.5 + 0.5) * self.height, 0, self.height - 1)
+        max_y = np.clip((ndc[:, :, 1].max(axis=1) * 0.5 + 0.5) * self.height, 0, self.height - 1)
+        nearest = ndc[:, :, 2].min(axis=1)
+
+        # Level where the rectangle spans at most 2 texels per axis
+        size = np.maximum(max_x - min_x, max_y - min_y)
+        levels = np.clip(np.ceil(np.log2(np.maximum(size, 1.0))), 0, len(self.pyramid) - 1).astype(np.int64)
+
+        for level in np.unique(levels[testable]).tolist():
+            boxes = np.flatnonzero(testable & (levels == level))
+            texels = self.pyramid[level]
+            scale = float(1 << level)
+            tx0 = np.minimum((min_x[boxes] / scale).astype(np.int64), texels.shape[1] - 1)
+            tx1 = np.minimum((max_x[boxes] / scale).astype(np.int64), texels.shape[1] - 1)
+            ty0 = np.minimum((min_y[boxes] / scale).astype(np.int64), texels.shape[0] - 1)
+            ty1 = np.minimum((max_y[boxes] / scale).astype(np.int64), texels.shape[0] - 1)
+
+            farthest = np.maximum(
+                np.maximum(texels[ty0, tx0], texels[ty0, tx1]),
+                np.maximum(texels[ty1, tx0], texels[ty1, tx1]),
+            )
+
+            # Hidden only if the nearest point of the box is behind every occluder over its rectangle
+            visible[boxes] = nearest[boxes] <= farthest
+
+        return visible
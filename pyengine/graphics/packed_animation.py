@@ -0,0 +1,144 @@
+import numpy as np
+from typing import List, Tuple
+from pyengine.ecs.entity_manager import EntityManager
+from pyengine.graphics.sprite import Animation, Animator, SpriteSheet
+
+
+# =============================================================================
+# CLASS: PackedAnimations
+# The state of every (SpriteSheet, Animator) pair in flat NumPy arrays,
+# advanced for all entities at once.
+# =============================================================================
+class PackedAnimations:
+    """
+    While packed, the components keep their usual API: Animator.timer / loop / is_playing,
+    Animator.play() and SpriteSheet.current_frame read and write slot `_slot` of these arrays.
+
+    The arrays are rebuilt only when SpriteSheets or Animators are added or removed
+    (state is copied back into the components, then packed again).
+    """
+    def __init__(self):
+        self.sheets: List[SpriteSheet] = []
+        self.animators: List[Animator] = []
+
+        # Component versions the arrays were built from
+        self._versions: Tuple[int, int] = (-1, -1)
+
+        self._allocate(0)
+
+    def _allocate(self, count: int) -> None:
+        # Per-entity state (index = slot)
+        self.timer = np.zeros(count, dtype=np.float64)
+        self.frame = np.zeros(count, dtype=np.int64)
+        self.loop = np.zeros(count, dtype=bool)
+        self.playing = np.zeros(count, dtype=bool)
+
+        # Current animation of each entity
+        self.start_frame = np.zeros(count, dtype=np.int64)
+        self.end_frame = np.zeros(count, dtype=np.int64)
+        self.frame_duration = np.zeros(count, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.animators)
+
+    def sync(self, entity_manager: EntityManager) -> bool:
+        """
+        Rebuilds the arrays if the set of animated entities changed.
+        Returns True if they were rebuilt.
+        """
+        versions = (entity_manager.get_version(SpriteSheet), entity_manager.get_version(Animator))
+        if versions == self._versions:
+            return False
+        self._versions = versions
+
+        self._unpack()
+
+        pairs = [components for _, components in entity_manager.get_entities_with(SpriteSheet, Animator)]
+        self._pack(pairs)
+        return True
+
+    def _unpack(self) -> None:
+        """Hands the state back to the components (plain attributes again)."""
+        for slot, (sheet, animator) in enumerate(zip(self.sheets, self.animators)):
+            sheet._current_frame = int(self.frame[slot])
+            animator._timer = float(self.timer[slot])
+            animator._loop = bool(self.loop[slot])
+            animator._is_playing = bool(self.playing[slot])
+            sheet._packed = animator._packed = None
+            sheet._slot = animator._slot = -1
+
+        self.sheets = []
+        self.animators = []
+        self._allocate(0)
+
+    def _pack(self, pairs: List[Tuple[SpriteSheet, Animator]]) -> None:
+        count = len(pairs)
+        self._allocate(count)
+
+        for slot, (sheet, animator) in enumerate(pairs):
+            self.frame[slot] = sheet.current_frame
+            self.timer[slot] = animator.timer
+            self.loop[slot] = animator.loop
+            self.playing[slot] = animator.is_playing
+
+            animation = animator.animations.get(animator.current_anim_name) if animator.current_anim_name else None
+            if animation:
+                self.set_animation(slot, animation)
+            else:
+                # Nothing to play
+                self.playing[slot] = False
+
+            sheet._packed = animator._packed = self
+            sheet._slot = animator._slot = slot
+
+        self.sheets = [sheet for sheet, _ in pairs]
+        self.animators = [animator for _, animator in pairs]
+
+    def set_animation(self, slot: int, animation: Animation) -> None:
+        """Sets the frame range & speed of an entity (called by Animator.play())."""
+        self.start_frame[slot] = animation.start_frame
+        self.end_frame[slot] = animation.end_frame
+        self.frame_duration[slot] = animation.frame_duration_in_seconds
+
+    def advance(self, dt: float) -> None:
+        """
+        Moves every playing animation forward by dt seconds.
+        A large dt can skip several frames (and wrap around looping animations).
+        """
+        active = np.flatnonzero(self.playing)
+        if len(active) == 0:
+            return
+
+        timer = self.timer[active] + dt
+        duration = self.frame_duration[active]
+
+        # Whole frames elapsed (keep remainder for smooth playback).
+        # A zero duration advances one frame per update.
+        steps = np.ones(len(active), dtype=np.int64)
+        timed = duration > 0.0
+        steps[timed] = np.floor(timer[timed] / duration[timed]).astype(np.int64)
+        timer[timed] -= steps[timed] * duration[timed]
+        timer[~timed] = 0.0
+
+        frame = self.frame[active]
+        start = self.start_frame[active]
+        end = self.end_frame[active]
+
+        # Check bounds: the frame passes the end after `to_end` steps
+        # (one step if it is already past it, e.g. right after switching animation)
+        to_end = np.maximum(end - frame + 1, 1)
+        over = steps >= to_end
+        loop = self.loop[active]
+
+        frame = np.where(over, end, frame + steps)
+
+        # Looping: back to the start, then around the range for the remaining steps
+        wrap = over & loop
+        length = np.maximum(end - start + 1, 1)
+        frame[wrap] = start[wrap] + (steps[wrap] - to_end[wrap]) % length[wrap]
+
+        finished = over & ~loop
+
+        self.timer[active] = timer
+        self.frame[active] = frame
+        self.playing[active[finished]] = False
@@ -0,0 +1,47 @@
+from pyengine.ecs.resource import Resource
+
+
+class RenderStats(Resource):
+    """
+    Per-frame counters filled by the RenderSystem.
+    Useful to check how well batching is working (e.g. display them next to the FPS).
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clears all counters. Called by the RenderSystem at the start of every frame.
+        """
+        # Total number of glDraw* calls issued this frame
+        self.draw_calls = 0
+
+        # World entities kept / rejected by frustum culling
+        self.visible = 0
+        self.culled = 0
+
+        # Entities inside the frustum but hidden behind occluders & occluder triangles rasterized on the CPU
+        self.occluded = 0
+        self.occluder_triangles = 0
+
+        # Sprites drawn through the sprite batcher and number of batches used to draw them
+        self.sprites = 0
+        self.sprite_batches = 0
+
+        # UI boxes and the instanced draw calls used to draw them
+        self.ui_boxes = 0
+        self.ui_batches = 0
+
+        # Regions of the retained UI layer redrawn this frame (0 when nothing changed)
+        self.ui_regions = 0
+
+        # Glyphs drawn from the glyph atlases and the draw calls used to draw them
+        self.glyphs = 0
+        self.text_batches = 0
+
+        # Merged meshes of Static entities (drawn or culled like regular entities)
+        self.static_batches = 0
+
+        # Point lights sent to the clustered lighting and the most crowded cluster
+        self.point_lights = 0
+        self.max_lights_per_cluster = 0
@@ -1,54 +1,360 @@
 import glm
+import numpy as np
+from time import perf_counter
 from OpenGL.GL import *
-from pyengine.core.logger import Logger
 from pyengine.ecs.entity_manager import EntityManager
 from pyengine.gui.ui_box import UIBox
 from pyengine.physics.transform import Transform
 from pyengine.graphics.mesh_renderer import MeshRenderer
+from pyengine.graphics.lod_group import LODGroup
 from pyengine.graphics.camera import Camera2D, Camera3D, MainCamera
-from pyengine.graphics.material import Material
+from pyengine.graphics.material import Material, MaterialState
 from pyengine.graphics.sprite import SpriteSheet
 from pyengine.graphics.light import DirectionalLight, PointLight
+from pyengine.graphics.render_stats import RenderStats
+from pyengine.graphics.gpu_profile import GPUProfile
+from pyengine.graphics.frustum import Frustum, transform_aabbs
+from pyengine.graphics.frame_uniforms import FrameUniforms
+from pyengine.graphics.frame_packet import FramePacket, TextItem, UIBoxItem
+from pyengine.graphics.dynamic_resolution import DynamicResolution
+from pyengine.graphics.clustered_lighting import ClusteredLighting
+from pyengine.graphics.sprite_batch import SpriteBatcher
+from pyengine.graphics.static_batch import StaticBatcher
+from pyengine.graphics.occlusion_culling import Occluder, OccluderItem, OcclusionCuller
 from pyengine.gui.text_renderer import TextRenderer
-from pyengine.gl_utils.mesh import Rectangle
+from pyengine.gui.ui_batch import UIBatcher
+from pyengine.gui.text_batch import TextBatcher
+from pyengine.gui.ui_layer import UILayer
+from pyengine.gl_utils.mesh import Mesh, Rectangle
+from pyengine.gl_utils.gl_state import GLState
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.gl_utils.framebuffer import Framebuffer
+from pyengine.gl_utils.gpu_timer import GPUTimer
+from pyengine.core.asset_manager import AssetManager
 from pyengine.ecs.system import System
 from pyengine.ecs.resource import ResourceManager
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyengine.core.app import App
 
 class RenderSystem(System):
-    def __init__(self):
-        self.box_mesh = None  # Uses ui.vert (No Normals)
+    # Model matrix of static batches (their vertices are already in world space)
+    _IDENTITY = np.identity(4, dtype=np.float32)
+
+    def __init__(self, batch_sprites: bool = True, frustum_culling: bool = True, batch_static: bool = True,
+                 batch_text: bool = True, occlusion_culling: bool = True, retained_ui: bool = False):
         self.text_mesh = None # Uses mesh.vert (With Normals)
 
+        # Per-string textures (batch_text disabled), by entity. Only touched by the render side.
+        self._text_textures = {}
+
+        # Material snapshots of the frame being extracted, by id(Material)
+        self._material_states = {}
+
+        # Texts are laid out from glyph atlases and drawn together (one call per font).
+        # Disabled: every string is rasterized into its own texture when it changes.
+        self.batch_text = batch_text
+        self.text_batcher = None # Created on first use (needs the text shader)
+
+        # Every UIBox is drawn with instanced rendering (created on first use, needs the ui shader)
+        self.ui_batcher = None
+
+        # The UI is kept in an offscreen texture, redrawn only where it changed (created on first use)
+        self.retained_ui = retained_ui
+        self.ui_layer = None
+
+        # In 2D mode, entities with a SpriteSheet are drawn through the SpriteBatcher
+        # (one draw call per run of identical materials instead of one per sprite,
+        # same shader/lighting and draw order as the unbatched path).
+        self.batch_sprites = batch_sprites
+        self.sprite_batcher = None # Created on first use (needs a GL context)
+
+        # Entities tagged Static are merged into a few world-space meshes (rebuilt when the set changes)
+        self.batch_static = batch_static
+        self.static_batcher = StaticBatcher()
+
+        # Skip meshes whose bounding box is outside the camera view
+        self.frustum_culling = frustum_culling
+
+        # 3D: skip meshes hidden behind the entities tagged Occluder (CPU depth buffer, needs frustum culling)
+        self.occlusion_culling = occlusion_culling
+        self.occlusion_culler = OcclusionCuller()
+
+        # Camera & Lights uniform blocks, uploaded once per frame (created on first use)
+        self.frame_uniforms = None
+
+        # Point lights are assigned to a 3D grid of view-space clusters (created on first use)
+        self.clustered_lighting = None
+
+        # Packet extracted by the main thread, set by the RenderThread before running the Render systems
+        self.next_packet = None
+
+        # Per-frame counters (registered as a resource by the App)
+        self.stats = RenderStats()
+
+        # GPU time per pass (registered as a resource by the App), measured with timer queries
+        self.gpu_profile = GPUProfile()
+        self.gpu_timer = None # Created on first use
+
+        # CPU seconds spent in the last submit (see _measure_render_time)
+        self._submit_time = 0.0
+
+        # The world pass can be rendered at a lower resolution and upscaled (registered as a resource by the App)
+        self.dynamic_resolution = DynamicResolution(enabled=False)
+        self.world_target = None # Offscreen color+depth target (created on first use)
+        self._window_size = None # (width, height), set by resize() or read from the viewport
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Called by the App when the window is resized.
+        Only records the size: the viewport & render targets are updated by the next submit
+        (which may run on the render thread).
+        """
+        self._window_size = (width, height)
+
     def update(self, resources: ResourceManager):
         """
         Main rendering loop orchestration.
+        Single-threaded: extract & submit back to back.
+        Threaded (see RenderThread): the packet was extracted by the main thread at the end of Update.
         """
-        entity_manager: EntityManager = resources.get(EntityManager)
+        packet = self.next_packet
+        self.next_packet = None
 
-        # 1. Clear Screen
-        glClearColor(0.1, 0.1, 0.2, 1.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        if packet is None:
+            packet = self.extract(resources)
+
+        self.submit(packet, resources)
 
-        # 2. Find Camera & Determine Mode (2D vs 3D)
+    # =========================================================================
+    # EXTRACT (CPU ONLY: reads the ECS, never calls OpenGL)
+    # =========================================================================
+
+    def extract(self, resources: ResourceManager) -> FramePacket:
+        """
+        Copies everything needed to draw the frame into a FramePacket.
+        Runs on the main thread, after the Update systems.
+        """
+        entity_manager: EntityManager = resources.get(EntityManager)
+        packet = FramePacket()
+        self._material_states = {}
+
+        # 1. Camera & Mode (2D vs 3D)
         camera_data = self._find_active_camera(entity_manager)
-        if not camera_data:
-            return # Warning is logged inside _find_active_camera
+        if camera_data:
+            cam_component, cam_transform, is_3d_mode = camera_data
+            packet.has_camera = True
+            packet.is_3d = is_3d_mode
+            packet.view = cam_component.get_view_matrix(cam_transform)
+            packet.projection = cam_component.get_projection_matrix()
+            packet.camera_position = glm.vec3(cam_transform.position)
+            packet.near = cam_component.near
+            packet.far = cam_component.far
+
+            # 2. Lights
+            dir_light, point_lights = self._collect_lights(entity_manager)
+            if dir_light:
+                packet.dir_light = DirectionalLight(dir_light.color, dir_light.intensity, dir_light.direction)
+            packet.point_lights = ClusteredLighting.pack_lights(point_lights)
+
+            # 3. World
+            self._extract_world(entity_manager, packet)
+
+        # 4. UI
+        self._extract_ui(entity_manager, packet)
+        return packet
+
+    def _extract_world(self, entity_manager: EntityManager, packet: FramePacket):
+        # Pick the detail level of every LODGroup (swaps renderer.mesh)
+        self._select_lods(entity_manager, packet.view, packet.projection, packet.is_3d)
+
+        # Static geometry (only rebuilt when Static entities were added or removed)
+        static_batcher = self.static_batcher if self.batch_static else None
+        if static_batcher:
+            packet.static_geometry = static_batcher.prepare(entity_manager)
+            packet.static_materials = [self._material_state(material) for material in static_batcher.materials]
+
+        transforms = []
+        for entity, (transform, renderer) in entity_manager.get_entities_with(Transform, MeshRenderer):
+            if static_batcher and static_batcher.contains(entity):
+                continue
+
+            sprite_sheet = entity_manager.get_component(entity, SpriteSheet)
+
+            packet.meshes.append(renderer.mesh)
+            packet.materials.append(self._material_state(renderer.material))
+            transforms.append(transform)
+            packet.uv_transforms.append(sprite_sheet.get_uv_transform() if sprite_sheet else None)
+
+        # Every model matrix at once (only the moved entities are rebuilt, in one NumPy pass)
+        packet.models = Transform.get_matrices(transforms)
+
+        if self.occlusion_culling and packet.is_3d:
+            self._extract_occluders(entity_manager, packet)
+
+    def _extract_occluders(self, entity_manager: EntityManager, packet: FramePacket):
+        meshes = []
+        transforms = []
+        for entity, (transform, occluder) in entity_manager.get_entities_with(Transform, Occluder):
+            mesh = occluder.mesh
+            if mesh is None:
+                renderer = entity_manager.get_component(entity, MeshRenderer)
+                mesh = renderer.mesh if renderer else None
+            if mesh is None or mesh.count == 0:
+                continue
+
+            meshes.append(mesh)
+            transforms.append(transform)
+
+        # Math layout (rows), as expected by the occlusion culler
+        models = Transform.get_matrices(transforms).transpose(0, 2, 1)
+        for mesh, model in zip(meshes, models):
+            # The CPU copy of the mesh is only read (no copy until the culler transforms it)
+            packet.occluders.append(OccluderItem(
+                mesh.vertices.reshape(-1, 8)[:, 0:3],
+                mesh.indices.reshape(-1, 3),
+                model,
+            ))
+
+    def _material_state(self, material: Optional[Material]) -> Optional[MaterialState]:
+        """Snapshot of a material, taken once per frame (entities sharing a Material share its state)."""
+        if material is None:
+            return None
+
+        state = self._material_states.get(id(material))
+        if state is None:
+            state = material.snapshot()
+            self._material_states[id(material)] = state
+        return state
+
+    def _extract_ui(self, entity_manager: EntityManager, packet: FramePacket):
+        for _, (transform, ui_box) in entity_manager.get_entities_with(Transform, UIBox):
+            packet.ui_boxes.append(UIBoxItem(
+                glm.vec3(transform.position), ui_box.width, ui_box.height,
+                tuple(ui_box.color), ui_box.border_radius, self._material_state(ui_box.material), ui_box.z_order
+            ))
+
+        for entity, (transform, text_renderer) in entity_manager.get_entities_with(Transform, TextRenderer):
+            # The per-string texture path draws the texture with the material's shader
+            if not text_renderer.material and not self.batch_text: continue
+
+            # The flag is consumed here, the texture is rebuilt by the render side
+            dirty = text_renderer.is_dirty
+            text_renderer.is_dirty = False
+
+            packet.texts.append(TextItem(
+                entity, text_renderer.font, text_renderer.text, tuple(text_renderer.color), dirty,
+                glm.vec3(transform.position), glm.vec3(transform.scale), self._material_state(text_renderer.material)
+            ))
+
+    # =========================================================================
+    # SUBMIT (OPENGL ONLY: reads the packet, never the ECS)
+    # =========================================================================
+
+    def submit(self, packet: FramePacket, resources: ResourceManager):
+        """
+        Issues the OpenGL commands of a frame. Runs on the thread owning the GL context.
+        """
+        submit_start = perf_counter()
+        self.stats.reset()
 
-        cam_component, cam_transform, is_3d_mode = camera_data
+        if self.batch_sprites and self.sprite_batcher is None:
+            self.sprite_batcher = SpriteBatcher()
 
-        # 3. Collect Lights (shared for the whole frame)
-        lights = self._collect_lights(entity_manager)
+        if self.ui_batcher is None:
+            assets: AssetManager = resources.get(AssetManager)
+            if assets:
+                ui_shader = assets.get_shader("shaders/ui.vert", "shaders/ui.frag")
+                self.ui_batcher = UIBatcher(ui_shader)
+
+        if self.batch_text and self.text_batcher is None:
+            assets: AssetManager = resources.get(AssetManager)
+            if assets:
+                text_shader = assets.get_shader("shaders/text.vert", "shaders/text.frag")
+                self.text_batcher = TextBatcher(text_shader)
+
+        if self.retained_ui and self.ui_layer is None:
+            assets: AssetManager = resources.get(AssetManager)
+            if assets:
+                composite_shader = assets.get_shader("shaders/composite.vert", "shaders/composite.frag")
+                self.ui_layer = UILayer(composite_shader)
+
+        if self.frame_uniforms is None:
+            self.frame_uniforms = FrameUniforms()
+
+        if self.clustered_lighting is None:
+            self.clustered_lighting = ClusteredLighting()
+
+        if packet.static_geometry is not None:
+            self.static_batcher.upload(packet.static_geometry)
+
+        timer = self._begin_gpu_profiling()
+
+        # 1. Clear Screen (or the scaled offscreen target)
+        self._begin_world_target(self._measure_render_time())
+        if timer: timer.begin("clear")
+        glClearColor(0.1, 0.1, 0.2, 1.0)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        if timer: timer.end()
+
+        if packet.has_camera:
+            # 2. Lights & the per-frame uniform blocks (shared by every shader)
+            clusters = self.clustered_lighting
+            clusters.assign(packet.point_lights, packet.view, packet.projection, packet.near, packet.far, packet.is_3d)
+            clusters.bind()
+            self.stats.point_lights = clusters.light_count
+            self.stats.max_lights_per_cluster = clusters.max_lights_per_cluster
+
+            self.frame_uniforms.update_world(packet.view, packet.projection, packet.camera_position,
+                                             packet.dir_light, clusters, GLState.get_viewport())
+
+            # 3. RENDER WORLD (Meshes, Sprites, 3D Models)
+            # (With buckets, the world time is the sum of the buckets: queries cannot be nested)
+            buckets = timer is not None and self.gpu_profile.profile_buckets
+            if timer and not buckets: timer.begin("world")
+            self._render_world_pass(packet, timer if buckets else None)
+            if timer: timer.end()
+
+        # Upscale the world to the window (the UI is drawn at native resolution)
+        self._end_world_target()
+
+        # 4. RENDER UI (Text, Overlays)
+        if timer: timer.begin("ui")
+        self._render_ui_pass(packet)
+        if timer: timer.end()
+
+        # CPU cost of this submit (excludes the buffer swap, done by the caller)
+        self._submit_time = perf_counter() - submit_start
+
+    def _measure_render_time(self) -> float:
+        """
+        Cost of the last rendered frame in seconds, fed to the dynamic resolution.
+        GPU time of the passes when profiling, otherwise the CPU time of the last submit.
+        Never the frame delta: with V-Sync it is capped by the swap, and the scale would not recover.
+        """
+        if self.gpu_profile.enabled and self.gpu_profile.total_ms > 0.0:
+            return self.gpu_profile.total_ms / 1000.0
+        return self._submit_time
+
+    def _begin_gpu_profiling(self):
+        """
+        Collects the GPU timings of an old frame. Returns the GPUTimer to use this frame (or None).
+        """
+        if not self.gpu_profile.enabled:
+            if self.gpu_timer:
+                self.gpu_timer.destroy()
+                self.gpu_timer = None
+            return None
 
-        # 4. RENDER WORLD (Meshes, Sprites, 3D Models)
-        self._render_world_pass(entity_manager, cam_component, cam_transform, is_3d_mode, lights)
+        if self.gpu_timer is None:
+            self.gpu_timer = GPUTimer()
 
-        # 5. RENDER UI (Text, Overlays)
-        self._render_ui_pass(entity_manager)
+        if self.gpu_timer.begin_frame():
+            self.gpu_profile.set_results(self.gpu_timer.results)
+        return self.gpu_timer
 
     # =========================================================================
     # INTERNAL HELPERS (LOGIC SEPARATION)
@@ -81,117 +387,322 @@ class RenderSystem(System):
         point_lights = []
         for _, (l, t) in entity_manager.get_entities_with(PointLight, Transform):
             point_lights.append((l, t))
-            if len(point_lights) >= 4: break 
             
         return dir_light, point_lights
 
+    def _begin_world_target(self, frame_time: float):
+        """
+        With dynamic resolution, redirects the world pass into the bottom-left
+        (scale * window size) area of the offscreen target.
+        """
+        if self._window_size is None:
+            viewport = GLState.get_viewport()
+            self._window_size = (viewport[2], viewport[3])
+
+        # Window size set by resize() (possibly from another thread)
+        width, height = self._window_size
+        GLState.viewport(0, 0, width, height)
+
+        resolution = self.dynamic_resolution
+        if not resolution.enabled:
+            if self.world_target:
+                self.world_target.destroy()
+                self.world_target = None
+            return
+
+        resolution.update(frame_time)
+
+        target_width, target_height = width * resolution.max_scale, height * resolution.max_scale
+        if self.world_target is None:
+            self.world_target = Framebuffer(target_width, target_height)
+        else:
+            self.world_target.resize(target_width, target_height)
+
+        render_width, render_height = resolution.get_render_size(width, height)
+        self.world_target.bind()
+        GLState.viewport(0, 0, render_width, render_height)
+
+    def _end_world_target(self):
+        """
+        Upscales the offscreen target to the window and restores the native viewport.
+        """
+        if not self.world_target:
+            return
+
+        width, height = self._window_size
+        viewport = GLState.get_viewport()
+        self.world_target.blit_to_screen(viewport[2], viewport[3], width, height)
+        GLState.viewport(0, 0, width, height)
+
     # =========================================================================
     # RENDER PASSES
     # =========================================================================
 
-    def _render_world_pass(self, entity_manager, camera, cam_transform, is_3d, lights):
+    def _render_world_pass(self, packet: FramePacket, bucket_timer: GPUTimer = None):
         """
         Handles the rendering of the 3D/2D game world.
+        :param bucket_timer: If set, every run of draws sharing a material is timed separately.
         """
-        dir_light, point_lights = lights
-        
+        is_3d = packet.is_3d
+
         # Configure OpenGL for World
-        if is_3d:
-            glEnable(GL_DEPTH_TEST)
-        else:
-            glDisable(GL_DEPTH_TEST)
+        GLState.set_enabled(GL_DEPTH_TEST, is_3d)
+
+        # Camera & Lights blocks of the world
+        self.frame_uniforms.bind_world()
+
+        # Sprites are only batched in 2D (no depth test: the draw order decides what is on top)
+        use_sprite_batch = not is_3d and self.batch_sprites and self.sprite_batcher is not None
+        if use_sprite_batch:
+            self.sprite_batcher.begin()
+
+        # 1. Candidates: static batches (identity model, no sprite sheet) + extracted entities
+        meshes = packet.meshes
+        materials = packet.materials
+        models = packet.models
+        uv_transforms = packet.uv_transforms
+
+        # (static_materials is empty when static batching is off)
+        static_batches = self.static_batcher.batches if packet.static_materials else []
+        if static_batches:
+            meshes = [batch.mesh for batch in static_batches] + meshes
+            materials = packet.static_materials + materials
+            models = np.concatenate([np.broadcast_to(self._IDENTITY, (len(static_batches), 4, 4)), models])
+            uv_transforms = [None] * len(static_batches) + uv_transforms
+        self.stats.static_batches = len(static_batches)
+
+        # 2. Frustum & Occlusion Culling (before any uniform upload)
+        visible = self._cull_candidates(meshes, models, packet.projection * packet.view, packet.occluders)
+
+        # 3. Queue the sprites: each run of them becomes a batch, drawn where its first sprite was
+        draw_list = visible
+        if use_sprite_batch:
+            draw_list = []
+            for index in visible:
+                if uv_transforms[index] is None:
+                    self.sprite_batcher.break_batch()
+                    draw_list.append(index)
+                elif self.sprite_batcher.submit(models[index], uv_transforms[index], materials[index]):
+                    draw_list.append(None) # Next sprite batch
+
+            sprite_batches = iter(self.sprite_batcher.upload())
+            self.stats.sprite_batches += len(self.sprite_batcher.batches)
+            self.stats.sprites += self.sprite_batcher.sprite_count
+
+        # 4. Render Loop
+        bucket_material = None
+        bucket_names = {}
+        for index in draw_list:
+            if index is None:
+                if bucket_timer:
+                    bucket_material = None
+                    bucket_timer.begin("world/sprites")
+                self.sprite_batcher.draw(next(sprite_batches), self._bind_material)
+                self.stats.draw_calls += 1
+                continue
+
+            mesh = meshes[index]
+            material = materials[index]
+            model = models[index]
+            uv_transform = uv_transforms[index]
+            shader = material.shader
 
-        # Pre-calculate Matrices
-        view_matrix = camera.get_view_matrix(cam_transform)
-        proj_matrix = camera.get_projection_matrix()
+            if bucket_timer and material is not bucket_material:
+                bucket_material = material
+                name = bucket_names.setdefault(id(material), f"world/material {len(bucket_names)}")
+                bucket_timer.begin(name)
 
-        # Render Loop
-        for entity, (transform, renderer) in entity_manager.get_entities_with(Transform, MeshRenderer):
-            material = renderer.material
-            mesh = renderer.mesh
-            shader = material.shader
-            
             shader.use()
 
-            # 1. Bind Material (Texture/Color)
+            # 1. Bind Material (Texture/Color/Blend, same state as a sprite batch)
             self._bind_material(material)
+            GLState.set_enabled(GL_BLEND, material.blend)
 
-            # 2. Upload Lights
-            self._upload_lighting_uniforms(shader, dir_light, point_lights)
+            # 2. Handle SpriteSheet Animation & compressed vertex formats
+            self._upload_mesh_uniforms(shader, mesh, uv_transform)
 
-            # 3. Handle SpriteSheet Animation
-            self._upload_sprite_uniforms(entity_manager, entity, shader)
+            # 3. Upload Model Matrix (Camera & Lights come from the uniform blocks)
+            shader.set_uniform_matrix("u_model", model)
 
-            # 4. Upload Matrices
-            shader.set_uniform_matrix("u_view", view_matrix)
-            shader.set_uniform_matrix("u_projection", proj_matrix)
+            # 4. Draw
+            # (No unbind/unuse: GLState skips the rebind when the next entity uses the same mesh/shader)
+            mesh.draw()
+            self.stats.draw_calls += 1
 
-            model = self._calculate_model_matrix(transform)
-            shader.set_uniform_matrix("u_model", model)
+        if use_sprite_batch:
+            self.sprite_batcher.end()
+
+        # Restore the application default (blending on) for the passes that follow
+        GLState.enable(GL_BLEND)
+
+    def _select_lods(self, entity_manager, view_matrix, proj_matrix, is_3d):
+        """
+        Estimates the screen size of every LODGroup entity (bounding sphere projected on the screen)
+        and assigns the mesh of the selected level to its MeshRenderer.
+        """
+        groups = []
+        transforms = []
+        for entity, (transform, renderer, lod_group) in entity_manager.get_entities_with(Transform, MeshRenderer, LODGroup):
+            if len(lod_group.levels) > 1:
+                groups.append((renderer, lod_group))
+                transforms.append(transform)
+
+        if not groups:
+            return
+
+        # (N, 4, 4) model matrices in math layout & the level 0 bounding sphere of each group
+        models = Transform.get_matrices(transforms).transpose(0, 2, 1)
+        centers = np.array([lod_group.levels[0].bounding_center for _, lod_group in groups], dtype=np.float32)
+        radii = np.array([lod_group.levels[0].bounding_radius for _, lod_group in groups], dtype=np.float32)
+
+        # World radius: the largest axis scale of each model matrix
+        radii = radii * np.linalg.norm(models[:, 0:3, 0:3], axis=1).max(axis=1)
+
+        # Projected diameter / screen height
+        scale_y = proj_matrix[1][1]
+        if is_3d:
+            world_centers = np.einsum("nij,nj->ni", models[:, 0:3, 0:3], centers) + models[:, 0:3, 3]
+            view = np.array(view_matrix, dtype=np.float32)
+            depths = -(world_centers @ view[2, 0:3] + view[2, 3])
+            screen_sizes = radii * scale_y / np.maximum(depths, 1e-4)
+        else:
+            screen_sizes = radii * scale_y
 
-            # 5. Draw
-            mesh.bind()
-            glDrawArrays(GL_TRIANGLES, 0, mesh.count)
-            mesh.unbind()
-            shader.unuse()
+        for (renderer, lod_group), screen_size in zip(groups, screen_sizes.tolist()):
+            renderer.mesh = lod_group.levels[lod_group.select_level(screen_size)]
 
-    def _render_ui_pass(self, entity_manager: EntityManager):
+    def _cull_candidates(self, meshes, models, view_projection, occluders=None):
         """
-        Handles the rendering of UI elements using separate meshes to prevent VAO conflicts.
+        Tests the bounding box of every candidate against the camera frustum in one vectorized pass,
+        then the boxes left against the occlusion buffer (if there are occluders).
+        models: (N, 4, 4) column-major model matrices (see Transform.get_matrices).
+        Returns the list of indices (into meshes) that must be drawn.
         """
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        count = len(meshes)
+        if count == 0 or not self.frustum_culling:
+            self.stats.visible += count
+            return range(count)
+
+        local_min = np.array([mesh.aabb_min for mesh in meshes], dtype=np.float32)
+        local_max = np.array([mesh.aabb_max for mesh in meshes], dtype=np.float32)
+
+        centers, extents = transform_aabbs(models.transpose(0, 2, 1), local_min, local_max)
+        mask = Frustum(view_projection).test_aabbs(centers, extents)
+        in_frustum = int(mask.sum())
+
+        if occluders and self.occlusion_culling:
+            culler = self.occlusion_culler
+            culler.render(occluders, view_projection)
+            self.stats.occluder_triangles += culler.triangle_count
+
+            candidates = np.flatnonzero(mask)
+            mask[candidates] = culler.test_aabbs(centers[candidates], extents[candidates])
+            self.stats.occluded += in_frustum - int(mask.sum())
 
-        viewport = glGetIntegerv(GL_VIEWPORT)
+        visible = np.flatnonzero(mask).tolist()
+        self.stats.visible += len(visible)
+        self.stats.culled += count - in_frustum
+        return visible
+
+    def _render_ui_pass(self, packet: FramePacket):
+        """
+        Draws the UI boxes (instanced) then the texts, on top of the world.
+        """
+        GLState.disable(GL_DEPTH_TEST)
+        GLState.enable(GL_BLEND)
+        GLState.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        viewport = GLState.get_viewport()
         width, height = viewport[2], viewport[3]
         ui_projection = glm.ortho(0.0, width, 0.0, height)
-        ui_view = glm.mat4(1.0)
 
+        # Screen-space camera & unlit lights blocks (used by the box & text shaders)
+        self.frame_uniforms.update_ui(ui_projection)
+        self.frame_uniforms.bind_ui()
+
+        if self.ui_layer:
+            # Retained: refresh the changed regions of the cached texture, then draw it over the world
+            regions = self.ui_layer.invalidate(width, height, self._ui_elements(packet))
+            for region in regions:
+                self.ui_layer.begin_region(region)
+                self._draw_ui_elements(packet)
+            if regions:
+                self.ui_layer.end_regions()
+
+            self.ui_layer.composite()
+            self.stats.draw_calls += 1
+            self.stats.ui_regions += self.ui_layer.redrawn_regions
+        else:
+            self._draw_ui_elements(packet)
+
+    def _draw_ui_elements(self, packet: FramePacket):
         # ---------------------------------------------------------
-        # 1. RENDER UI BOXES (Using self.box_mesh)
+        # 1. RENDER UI BOXES (Instanced, sorted by z_order)
         # ---------------------------------------------------------
-        for _, (transform, ui_box) in entity_manager.get_entities_with(Transform, UIBox):
-            if not ui_box.material: continue
-            
-            shader = ui_box.material.shader
-            shader.use()
-            
-            # Init box mesh if needed
-            if self.box_mesh is None: 
-                self.box_mesh = Rectangle(shader)
-
-            # Uniforms
-            glUniformMatrix4fv(glGetUniformLocation(shader.id, "u_view"), 1, GL_FALSE, glm.value_ptr(ui_view))
-            glUniformMatrix4fv(glGetUniformLocation(shader.id, "u_projection"), 1, GL_FALSE, glm.value_ptr(ui_projection))
-            glUniform4f(glGetUniformLocation(shader.id, "u_color"), *ui_box.color)
-            glUniform2f(glGetUniformLocation(shader.id, "u_dimensions"), ui_box.width, ui_box.height)
-            glUniform1f(glGetUniformLocation(shader.id, "u_radius"), ui_box.border_radius)
-
-            # Transform
-            model = glm.mat4(1.0)
-            model = glm.translate(model, transform.position)
-            model = glm.scale(model, glm.vec3(ui_box.width, ui_box.height, 1.0))
-            glUniformMatrix4fv(glGetUniformLocation(shader.id, "u_model"), 1, GL_FALSE, glm.value_ptr(model))
-
-            self.box_mesh.bind()
-            glDrawArrays(GL_TRIANGLES, 0, self.box_mesh.count)
-            self.box_mesh.unbind()
-            shader.unuse()
+        if self.ui_batcher:
+            draw_calls = self.ui_batcher.draw(packet.ui_boxes)
+            self.stats.draw_calls += draw_calls
+            self.stats.ui_boxes += len(packet.ui_boxes)
+            self.stats.ui_batches += draw_calls
 
         # ---------------------------------------------------------
-        # 2. RENDER TEXT (Using self.text_mesh)
+        # 2. RENDER TEXT (Glyph atlases, or one texture per string)
         # ---------------------------------------------------------
-        for entity, (transform, text_renderer) in entity_manager.get_entities_with(Transform, TextRenderer):
-            if text_renderer.is_dirty:
-                if text_renderer.texture: text_renderer.texture.destroy()
-                text_renderer.texture = text_renderer.font.render_text(text_renderer.text, text_renderer.color)
-                text_renderer.is_dirty = False
-                # If using generic material from main.py, it's fine.
+        if self.text_batcher:
+            draw_calls = self.text_batcher.draw(packet.texts)
+            self.stats.draw_calls += draw_calls
+            self.stats.glyphs += self.text_batcher.glyph_count
+            self.stats.text_batches += draw_calls
+        else:
+            self._render_text_textures(packet)
 
-            if not text_renderer.texture or not text_renderer.material: continue
+    def _ui_elements(self, packet: FramePacket) -> list:
+        """
+        (signature, screen rectangle) of every UI element, compared by the UILayer between frames.
+        """
+        elements = []
+        for box in packet.ui_boxes:
+            x, y = box.position.x, box.position.y
+            half_w, half_h = box.width * 0.5, box.height * 0.5
+            signature = ("box", x, y, box.width, box.height, tuple(box.color), box.border_radius,
+                         id(box.material.shader) if box.material else None, box.z_order)
+            elements.append((signature, (x - half_w, y - half_h, x + half_w, y + half_h)))
+
+        for text in packet.texts:
+            signature = ("text", text.entity, id(text.font), text.text, tuple(text.color),
+                         text.position.x, text.position.y, text.scale.x, text.scale.y,
+                         id(text.material.shader) if text.material else None)
+            if self.text_batcher:
+                rect = self.text_batcher.get_bounds(text)
+                if rect is None: continue # Draws nothing
+            else:
+                rect = None # One texture per string: no cheap bounds, the whole layer is redrawn
+            elements.append((signature, rect))
+
+        return elements
+
+    def _render_text_textures(self, packet: FramePacket):
+        """
+        Draws every text as a textured quad, re-rasterizing the string whenever it changed.
+        """
+        # Textures of the texts that disappeared
+        entities = {text.entity for text in packet.texts if text.material}
+        for entity in [entity for entity in self._text_textures if entity not in entities]:
+            texture = self._text_textures.pop(entity)
+            if texture: texture.destroy()
+
+        for text in packet.texts:
+            if not text.material: continue
+
+            texture = self._text_textures.get(text.entity)
+            if text.dirty or texture is None:
+                if texture: texture.destroy()
+                texture = text.font.render_text(text.text, text.color)
+                self._text_textures[text.entity] = texture
+
+            if not texture: continue
 
-            shader = text_renderer.material.shader
+            shader = text.material.shader
             shader.use()
 
             # Init text mesh if needed
@@ -199,105 +710,71 @@ class RenderSystem(System):
                 self.text_mesh = Rectangle(shader)
 
             # Bind Texture
-            glActiveTexture(GL_TEXTURE0)
-            glBindTexture(GL_TEXTURE_2D, text_renderer.texture.id)
-            glUniform1i(glGetUniformLocation(shader.id, "u_texture"), 0)
-            glUniform1i(glGetUniformLocation(shader.id, "u_use_texture"), 1)
-            glUniform4f(glGetUniformLocation(shader.id, "u_color"), 1, 1, 1, 1)
-
-            # Disable Lights for Text
-            glUniform3f(glGetUniformLocation(shader.id, "u_ambientColor"), 1, 1, 1)
-            glUniform1f(glGetUniformLocation(shader.id, "u_dirLight.intensity"), 0.0)
-            glUniform1i(glGetUniformLocation(shader.id, "u_pointLightCount"), 0)
-            
+            texture.bind(0)
+            GLDispatch.glUniform1i(shader.get_uniform_location("u_texture"), 0)
+            GLDispatch.glUniform1i(shader.get_uniform_location("u_use_texture"), 1)
+            GLDispatch.glUniform4f(shader.get_uniform_location("u_color"), 1.0, 1.0, 1.0, 1.0)
+
             # Reset UVs
-            glUniform2f(glGetUniformLocation(shader.id, "u_uv_scale"), 1.0, 1.0)
-            glUniform2f(glGetUniformLocation(shader.id, "u_uv_offset"), 0.0, 0.0)
+            self._upload_mesh_uniforms(shader, self.text_mesh, None)
 
-            # Transform
-            shader.set_uniform_matrix("u_view", ui_view)
-            shader.set_uniform_matrix("u_projection", ui_projection)
+            # Transform (view/projection come from the UI camera block)
             model = glm.mat4(1.0)
-            model = glm.translate(model, transform.position)
-            model = glm.scale(model, glm.vec3(text_renderer.texture.width, text_renderer.texture.height, 1.0))
-            model = glm.scale(model, transform.scale)
+            model = glm.translate(model, text.position)
+            model = glm.scale(model, glm.vec3(texture.width, texture.height, 1.0))
+            model = glm.scale(model, text.scale)
             shader.set_uniform_matrix("u_model", model)
 
-            self.text_mesh.bind()
-            glDrawArrays(GL_TRIANGLES, 0, self.text_mesh.count)
-            self.text_mesh.unbind()
-            shader.unuse()
+            self.text_mesh.draw()
+            self.stats.draw_calls += 1
 
     # =========================================================================
     # LOW-LEVEL UPLOAD HELPERS
     # =========================================================================
 
-    def _bind_material(self, material: Material):
-        loc_color = glGetUniformLocation(material.shader.id, "u_color")
-        loc_use_tex = glGetUniformLocation(material.shader.id, "u_use_texture")
-        loc_tex = glGetUniformLocation(material.shader.id, "u_texture")
+    def _bind_material(self, material: MaterialState):
+        shader = material.shader
+        loc_color = shader.get_uniform_location("u_color")
+        loc_use_tex = shader.get_uniform_location("u_use_texture")
+        loc_tex = shader.get_uniform_location("u_texture")
 
-        glUniform4f(loc_color, *material.color)
+        GLDispatch.glUniform4f(loc_color, *material.color)
 
         if material.texture:
-            glUniform1i(loc_use_tex, 1)
+            GLDispatch.glUniform1i(loc_use_tex, 1)
             material.texture.bind(0)
-            glUniform1i(loc_tex, 0)
+            GLDispatch.glUniform1i(loc_tex, 0)
+        elif material.texture_page:
+            # Same page as the previous draw: GLState skips the bind, only the layer changes.
+            # The layer is a constant vertex attribute (merged static batches provide one per vertex).
+            GLDispatch.glUniform1i(loc_use_tex, 2)
+            material.texture_page.bind(ShaderProgram.SAMPLER_UNITS["u_texture_array"])
+            loc_layer = shader.get_attrib_location("a_texture_layer")
+            if loc_layer != -1:
+                glVertexAttrib1f(loc_layer, material.texture_layer)
         else:
-            glUniform1i(loc_use_tex, 0)
-            glBindTexture(GL_TEXTURE_2D, 0)
+            GLDispatch.glUniform1i(loc_use_tex, 0)
+            GLState.bind_texture(0, 0)
 
-    def _upload_lighting_uniforms(self, shader, dir_light, point_lights):
-        # Ambient
-        loc_amb = glGetUniformLocation(shader.id, "u_ambientColor")
-        glUniform3f(loc_amb, 0.1, 0.1, 0.1)
-
-        # Directional
-        if dir_light:
-            self._upload_dir_light(shader, dir_light)
-        else:
-            glUniform1f(glGetUniformLocation(shader.id, "u_dirLight.intensity"), 0.0)
-
-        # Point Lights
-        glUniform1i(glGetUniformLocation(shader.id, "u_pointLightCount"), len(point_lights))
-        for i, (light, light_trans) in enumerate(point_lights):
-            self._upload_point_light(shader, i, light, light_trans)
-
-    def _upload_sprite_uniforms(self, entity_manager, entity, shader):
-        sprite_sheet = entity_manager.get_component(entity, SpriteSheet)
-        loc_scale = glGetUniformLocation(shader.id, "u_uv_scale")
-        loc_offset = glGetUniformLocation(shader.id, "u_uv_offset")
-
-        if sprite_sheet:
-            sx, sy, ox, oy = sprite_sheet.get_uv_transform()
-            glUniform2f(loc_scale, sx, sy)
-            glUniform2f(loc_offset, ox, oy)
+    def _upload_mesh_uniforms(self, shader, mesh: Mesh, uv_transform):
+        """
+        UV transform of the SpriteSheet (if any) & dequantization of the mesh vertex format.
+        Always uploaded: the values left by the previous mesh drawn with this shader would apply otherwise.
+        """
+        loc_scale = shader.get_uniform_location("u_uv_scale")
+        loc_offset = shader.get_uniform_location("u_uv_offset")
+
+        # Quantized UVs: uv = stored * mesh scale + mesh offset, then the sprite cell transform
+        msx, msy = mesh.uv_scale
+        mox, moy = mesh.uv_offset
+        if uv_transform:
+            sx, sy, ox, oy = uv_transform
+            GLDispatch.glUniform2f(loc_scale, msx * sx, msy * sy)
+            GLDispatch.glUniform2f(loc_offset, mox * sx + ox, moy * sy + oy)
         else:
-            glUniform2f(loc_scale, 1.0, 1.0)
-            glUniform2f(loc_offset, 0.0, 0.0)
+            GLDispatch.glUniform2f(loc_scale, msx, msy)
+            GLDispatch.glUniform2f(loc_offset, mox, moy)
 
-    def _calculate_model_matrix(self, transform):
-        model = glm.mat4(1.0)
-        model = glm.translate(model, transform.position)
-        
-        # Simple Euler Rotation (Sequential)
-        if transform.rotation.x != 0: model = glm.rotate(model, transform.rotation.x, glm.vec3(1, 0, 0))
-        if transform.rotation.y != 0: model = glm.rotate(model, transform.rotation.y, glm.vec3(0, 1, 0))
-        if transform.rotation.z != 0: model = glm.rotate(model, transform.rotation.z, glm.vec3(0, 0, 1))
-
-        model = glm.scale(model, transform.scale)
-        return model
-
-    def _upload_dir_light(self, shader, light: DirectionalLight):
-        glUniform3f(glGetUniformLocation(shader.id, "u_dirLight.direction"), *light.direction)
-        glUniform3f(glGetUniformLocation(shader.id, "u_dirLight.color"), *light.color)
-        glUniform1f(glGetUniformLocation(shader.id, "u_dirLight.intensity"), light.intensity)
-
-    def _upload_point_light(self, shader, index: int, light: PointLight, transform: Transform):
-        base = f"u_pointLights[{index}]"
-        glUniform3f(glGetUniformLocation(shader.id, f"{base}.position"), *transform.position)
-        glUniform3f(glGetUniformLocation(shader.id, f"{base}.color"), *light.color)
-        glUniform1f(glGetUniformLocation(shader.id, f"{base}.intensity"), light.intensity)
-        glUniform1f(glGetUniformLocation(shader.id, f"{base}.constant"), light.constant)
-        glUniform1f(glGetUniformLocation(shader.id, f"{base}.linear"), light.linear)
-        glUniform1f(glGetUniformLocation(shader.id, f"{base}.quadratic"), light.quadratic)
+        GLDispatch.glUniform3f(shader.get_uniform_location("u_position_scale"), *mesh.position_scale)
+        GLDispatch.glUniform3f(shader.get_uniform_location("u_position_offset"), *mesh.position_offset)
+        GLDispatch.glUniform1i(shader.get_uniform_location("u_octahedral_normals"), 1 if mesh.vertex_format.octahedral_normals else 0)
@@ -1,42 +1,92 @@
+import numpy as np
 from pyengine.ecs.component import Component
 from typing import Dict, List, Tuple
 
 
+# UV transform of every frame, shared by all the sheets with the same grid: (rows, cols, uv_rect) -> table
+_UV_TABLES: Dict[Tuple[int, int, Tuple[float, float, float, float]], List[Tuple[float, float, float, float]]] = {}
+
+# The whole texture
+FULL_UV_RECT = (1.0, 1.0, 0.0, 0.0)
+
+
+def get_uv_table(rows: int, cols: int, uv_rect: Tuple[float, float, float, float] = FULL_UV_RECT) -> List[Tuple[float, float, float, float]]:
+    """
+    Returns the (scale_x, scale_y, offset_x, offset_y) of every frame of a rows x cols grid,
+    indexed by frame. Computed once per grid size.
+    :param uv_rect: Part of the texture covered by the grid (scale_x, scale_y, offset_x, offset_y),
+                    e.g. an AtlasRegion.uv_rect. Default: the whole texture.
+    """
+    key = (rows, cols, tuple(uv_rect))
+    table = _UV_TABLES.get(key)
+    if table is None:
+        frames = np.arange(rows * cols)
+        rect_w, rect_h, rect_x, rect_y = uv_rect
+
+        # Calculate grid position (0-indexed)
+        col = frames % cols
+        row = frames // cols
+
+        # X offset is simple: column * width of cell
+        # Y offset depends on coordinate system.
+        # In OpenGL, (0,0) is Bottom-Left. Sprite sheets are usually Top-Left.
+        # We invert the row index to match OpenGL's coordinate system.
+        u_offset = rect_x + col * (rect_w / cols)
+        v_offset = rect_y + (rows - 1 - row) * (rect_h / rows)
+
+        table = [(rect_w / cols, rect_h / rows, u, v) for u, v in zip(u_offset.tolist(), v_offset.tolist())]
+        _UV_TABLES[key] = table
+    return table
+
+
 class SpriteSheet(Component):
     """
     Defines the grid layout of a texture (rows and columns).
     Used to calculate UV offsets for a specific frame index.
     """
-    def __init__(self, rows: int, cols: int):
+    def __init__(self, rows: int, cols: int, uv_rect: Tuple[float, float, float, float] = FULL_UV_RECT):
+        """
+        :param rows: Number of rows of the grid.
+        :param cols: Number of columns of the grid.
+        :param uv_rect: Part of the texture holding the grid (e.g. AtlasRegion.uv_rect for a packed image).
+        """
         self.rows = rows
         self.cols = cols
+        self.uv_rect = uv_rect
         
         # Calculate the size of one cell in UV space (0.0 to 1.0)
-        self.u_scale = 1.0 / cols
-        self.v_scale = 1.0 / rows
+        self.u_scale = uv_rect[0] / cols
+        self.v_scale = uv_rect[1] / rows
+
+        # Precomputed UV transform of every frame
+        self.uv_table = get_uv_table(rows, cols, uv_rect)
         
         # Current frame index to display
-        self.current_frame = 0
+        self._current_frame = 0
+
+        # Set while the sheet is animated by PackedAnimations (the frame then lives in its arrays)
+        self._packed = None
+        self._slot = -1
+
+    @property
+    def current_frame(self) -> int:
+        if self._packed is not None:
+            return int(self._packed.frame[self._slot])
+        return self._current_frame
+
+    @current_frame.setter
+    def current_frame(self, value: int):
+        if self._packed is not None:
+            self._packed.frame[self._slot] = value
+        else:
+            self._current_frame = value
 
     def get_uv_transform(self) -> Tuple[float, float, float, float]:
         """
-        Calculates the Scale and Offset for the current frame.
+        Returns the Scale and Offset of the current frame (looked up in the UV table).
         Returns: (scale_x, scale_y, offset_x, offset_y)
         """
-        # Calculate grid position (0-indexed)
-        col = self.current_frame % self.cols
-        row = self.current_frame // self.cols
-        
-        # Calculate offsets
-        # X offset is simple: column * width of cell
-        u_offset = col * self.u_scale
-        
-        # Y offset depends on coordinate system. 
-        # In OpenGL, (0,0) is Bottom-Left. Sprite sheets are usually Top-Left.
-        # We invert the row index to match OpenGL's coordinate system.
-        v_offset = (self.rows - 1 - row) * self.v_scale
-        
-        return (self.u_scale, self.v_scale, u_offset, v_offset)
+        return self.uv_table[self.current_frame % len(self.uv_table)]
     
 
 class Animation:
@@ -54,10 +104,53 @@ class Animator(Component):
         self.animations: Dict[str, Animation] = {}
 
         self.current_anim_name = None
-        self.timer = 0.0
+        self._timer = 0.0
         self.frame_duration = 0.1
-        self.loop = True
-        self.is_playing = False
+        self._loop = True
+        self._is_playing = False
+
+        # Set while the animator is part of PackedAnimations (the state then lives in its arrays)
+        self._packed = None
+        self._slot = -1
+
+    @property
+    def timer(self) -> float:
+        if self._packed is not None:
+            return float(self._packed.timer[self._slot])
+        return self._timer
+
+    @timer.setter
+    def timer(self, value: float):
+        if self._packed is not None:
+            self._packed.timer[self._slot] = value
+        else:
+            self._timer = value
+
+    @property
+    def loop(self) -> bool:
+        if self._packed is not None:
+            return bool(self._packed.loop[self._slot])
+        return self._loop
+
+    @loop.setter
+    def loop(self, value: bool):
+        if self._packed is not None:
+            self._packed.loop[self._slot] = value
+        else:
+            self._loop = value
+
+    @property
+    def is_playing(self) -> bool:
+        if self._packed is not None:
+            return bool(self._packed.playing[self._slot])
+        return self._is_playing
+
+    @is_playing.setter
+    def is_playing(self, value: bool):
+        if self._packed is not None:
+            self._packed.playing[self._slot] = value
+        else:
+            self._is_playing = value
 
     def add(self, name: str, animation: Animation):
         """Register a new animation sequence."""
@@ -71,6 +164,8 @@ class Animator(Component):
         if self.current_anim_name != name:
             self.current_anim_name = name
             self.frame_duration = self.animations[name].frame_duration_in_seconds
+            if self._packed is not None:
+                self._packed.set_animation(self._slot, self.animations[name])
             self.timer = 0.0
             self.loop = loop
             self.is_playing = True
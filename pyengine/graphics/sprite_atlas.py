@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+from PIL import Image
+from typing import Dict, List, Optional, Sequence, Tuple
+from pyengine.core.logger import Logger
+from pyengine.gl_utils.texture import Texture
+
+
+class AtlasRegion:
+    """
+    Where a source image ended up inside an atlas page.
+    uv_rect uses the SpriteSheet convention: (scale_x, scale_y, offset_x, offset_y),
+    with OpenGL texture coordinates (origin at the bottom-left of the page).
+    """
+    def __init__(self, texture: Texture, uv_rect: Tuple[float, float, float, float], width: int, height: int):
+        self.texture = texture
+        self.uv_rect = uv_rect
+
+        # Size of the source image in pixels
+        self.width = width
+        self.height = height
+
+
+# =============================================================================
+# RECTANGLE BIN PACKING (MaxRects, best short side fit)
+# =============================================================================
+
+def pack_rects(sizes: Sequence[Tuple[int, int]], page_size: int) -> List[Tuple[int, int, int]]:
+    """
+    Places rectangles on as few page_size x page_size pages as possible.
+    Returns (page, x, y) for every size, in the same order (origin at the top-left).
+    Raises ValueError if a rectangle is larger than a page.
+    """
+    placements: List[Optional[Tuple[int, int, int]]] = [None] * len(sizes)
+
+    # Big rectangles first: small ones fill the gaps they leave
+    order = sorted(range(len(sizes)), key=lambda i: (max(sizes[i]), min(sizes[i])), reverse=True)
+
+    # Free rectangles (x, y, w, h) of every page (they may overlap)
+    pages: List[List[Tuple[int, int, int, int]]] = []
+
+    for i in order:
+        width, height = sizes[i]
+        if width > page_size or height > page_size:
+            raise ValueError(f"Image of {width}x{height} does not fit in a {page_size}x{page_size} atlas page")
+
+        best = None
+        for page_index, free_rects in enumerate(pages):
+            for x, y, free_w, free_h in free_rects:
+                if width <= free_w and height <= free_h:
+                    # Smallest leftover along the tightest side
+                    score = (min(free_w - width, free_h - height), max(free_w - width, free_h - height))
+                    if best is None or score < best[0]:
+                        best = (score, page_index, x, y)
+            if best is not None:
+                # Keep filling the earliest page that has room
+                break
+
+        if best is None:
+            pages.append([(0, 0, page_size, page_size)])
+            best = (None, len(pages) - 1, 0, 0)
+
+        _, page_index, x, y = best
+        pages[page_index] = _split_free_rects(pages[page_index], (x, y, width, height))
+        placements[i] = (page_index, x, y)
+
+    return placements
+
+
+def _split_free_rects(free_rects: List[Tuple[int, int, int, int]], used: Tuple[int, int, int, int]) -> List[Tuple[int, int, int, int]]:
+    """Removes the used rectangle from the free space (MaxRects split & prune)."""
+    ux, uy, uw, uh = used
+    result = []
+    for x, y, w, h in free_rects:
+        # No overlap: unchanged
+        if ux >= x + w or ux + uw <= x or uy >= y + h or uy + uh <= y:
+            result.append((x, y, w, h))
+            continue
+
+        # Up to 4 maximal rectangles around the used area
+        if ux > x:
+            result.append((x, y, ux - x, h))
+        if ux + uw < x + w:
+            result.append((ux + uw, y, x + w - ux - uw, h))
+        if uy > y:
+            result.append((x, y, w, uy - y))
+        if uy + uh < y + h:
+            result.append((x, uy + uh, w, y + h - uy - uh))
+
+    # Drop rectangles contained in another one
+    pruned = []
+    for i, (x, y, w, h) in enumerate(result):
+        contained = False
+        for j, (ox, oy, ow, oh) in enumerate(result):
+            if i != j and ox <= x and oy <= y and x + w <= ox + ow and y + h <= oy + oh:
+                # Identical rectangles: keep the first one only
+                if (ox, oy, ow, oh) != (x, y, w, h) or j < i:
+                    contained = True
+                    break
+        if not contained:
+            pruned.append((x, y, w, h))
+    return pruned
+
+
+# =============================================================================
+# CLASS: SpriteAtlasBuilder
+# Packs many small images into a few large textures, so sprites drawn from
+# them can share a SpriteBatcher batch.
+# =============================================================================
+class SpriteAtlasBuilder:
+    """
+    Every image is surrounded by `extrude` copies of its border pixels (so linear filtering
+    and mipmaps sample the sprite's own edge, not its neighbor) and `padding` empty pixels.
+
+    The result (layout + page images) is cached in cache_dir, under a key derived from the
+    content of the source files and the packing parameters: later startups only hash the
+    sources and load the pages.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, page_size: int = 2048, padding: int = 2, extrude: int = 1, cache_dir: Optional[str] = ".cache/sprite_atlas"):
+        """
+        :param page_size: Maximum width and height of an atlas page in pixels.
+        :param padding: Empty pixels between two images (after extrusion).
+        :param extrude: Border pixels repeated around every image.
+        :param cache_dir: Directory of the on-disk cache (None = always pack, pages kept in memory).
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.extrude = extrude
+        self.cache_dir = cache_dir
+
+    def build(self, paths: Sequence[str]) -> Tuple[List[Texture], Dict[str, AtlasRegion]]:
+        """
+        Packs the images (or loads the cached result).
+        Returns (pages, regions by source path).
+        """
+        paths = sorted(set(paths))
+        key = self._cache_key(paths)
+
+        layout = self._load_layout(key)
+        if layout is None:
+            layout, images = self._pack(paths)
+            self._save(key, layout, images)
+            pages = [self._create_texture(image) for image in images]
+            Logger.info(f"[SpriteAtlas] Packed {len(paths)} images into {len(pages)} pages")
+        else:
+            pages = [Texture(self._page_path(key, index)) for index in range(len(layout["pages"]))]
+            Logger.info(f"[SpriteAtlas] Loaded {len(paths)} images from the atlas cache ({len(pages)} pages)")
+
+        regions = {}
+        for path, (page_index, x, y, width, height) in layout["regions"].items():
+            page_width, page_height = layout["pages"][page_index]
+            uv_rect = (
+                width / page_width,
+                height / page_height,
+                x / page_width,
+                # Images are stored top-down, textures bottom-up (see Texture)
+                1.0 - (y + height) / page_height,
+            )
+            regions[path] = AtlasRegion(pages[page_index], uv_rect, width, height)
+
+        return pages, regions
+
+    # =========================================================================
+    # PACKING
+    # =========================================================================
+
+    def _pack(self, paths: Sequence[str]) -> Tuple[dict, List[Image.Image]]:
+        images = [Image.open(path).convert("RGBA") for path in paths]
+        border = self.extrude + self.padding
+
+        # Cells: padding on the left/top, then the image with its extruded border
+        # (the padding on the right/bottom of the page is added when sizing it)
+        sizes = [(image.width + 2 * self.extrude + self.padding, image.height + 2 * self.extrude + self.padding) for image in images]
+        usable = self.page_size - self.padding
+        placements = pack_rects(sizes, usable)
+
+        page_count = max((page for page, _, _ in placements), default=-1) + 1
+
+        # Shrink every page to the smallest power of two holding its content
+        page_sizes = []
+        for page_index in range(page_count):
+            right = max(x + w for (page, x, _), (w, _) in zip(placements, sizes) if page == page_index) + self.padding
+            bottom = max(y + h for (page, _, y), (_, h) in zip(placements, sizes) if page == page_index) + self.padding
+            page_sizes.append((self._next_power_of_two(right), self._next_power_of_two(bottom)))
+
+        pages = [Image.new("RGBA", size, (0, 0, 0, 0)) for size in page_sizes]
+        regions = {}
+        for path, image, (page_index, x, y) in zip(paths, images, placements):
+            left = x + border
+            top = y + border
+            self._paste_extruded(pages[page_index], image, left, top)
+            regions[path] = [page_index, left, top, image.width, image.height]
+
+        layout = {
+            "version": self.CACHE_VERSION,
+            "pages": [list(size) for size in page_sizes],
+            "regions": regions,
+        }
+        return layout, pages
+
+    def _paste_extruded(self, page: Image.Image, image: Image.Image, left: int, top: int) -> None:
+        page.paste(image, (left, top))
+
+        e = self.extrude
+        if e == 0:
+            return
+        w, h = image.size
+
+        # Edges: stretch the outermost row/column over the border
+        page.paste(image.crop((0, 0, w, 1)).resize((w, e), Image.NEAREST), (left, top - e))
+        page.paste(image.crop((0, h - 1, w, h)).resize((w, e), Image.NEAREST), (left, top + h))
+        page.paste(image.crop((0, 0, 1, h)).resize((e, h), Image.NEAREST), (left - e, top))
+        page.paste(image.crop((w - 1, 0, w, h)).resize((e, h), Image.NEAREST), (left + w, top))
+
+        # Corners: the corner pixel
+        for (cx, cy), (px, py) in (
+            ((0, 0), (left - e, top - e)),
+            ((w - 1, 0), (left + w, top - e)),
+            ((0, h - 1), (left - e, top + h)),
+            ((w - 1, h - 1), (left + w, top + h)),
+        ):
+            page.paste(image.getpixel((cx, cy)), (px, py, px + e, py + e))
+
+    @staticmethod
+    def _next_power_of_two(value: int) -> int:
+        return 1 << max(0, value - 1).bit_length()
+
+    def _create_texture(self, image: Image.Image) -> Texture:
+        """Uploads an in-memory page (same conventions as a Texture loaded from a file)."""
+        texture = Texture()
+        texture.load_image(image)
+        return texture
+
+    # =========================================================================
+    # DISK CACHE
+    # =========================================================================
+
+    def _cache_key(self, paths: Sequence[str]) -> str:
+        digest = hashlib.sha1()
+        digest.update(f"{self.CACHE_VERSION}:{self.page_size}:{self.padding}:{self.extrude}".encode())
+        for path in paths:
+            with open(path, "rb") as f:
+                content_hash = hashlib.sha1(f.read()).hexdigest()
+            digest.update(f"|{path}:{content_hash}".encode())
+        return digest.hexdigest()
+
+    def _layout_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _page_path(self, key: str, index: int) -> str:
+        return os.path.join(self.cache_dir, f"{key}_{index}.png")
+
+    def _load_layout(self, key: str) -> Optional[dict]:
+        if not self.cache_dir or not os.path.exists(self._layout_path(key)):
+            return None
+        try:
+            with open(self._layout_path(key), "r") as f:
+                layout = json.load(f)
+        except (OSError, ValueError) as e:
+            Logger.warning(f"[SpriteAtlas] Ignoring unreadable atlas cache: {e}")
+            return None
+
+        if layout.get("version") != self.CACHE_VERSION:
+            return None
+        if not all(os.path.exists(self._page_path(key, index)) for index in range(len(layout["pages"]))):
+            return None
+        return layout
+
+    def _save(self, key: str, layout: dict, images: List[Image.Image]) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for index, image in enumerate(images):
+                image.save(self._page_path(key, index))
+
+            # Written last: a layout file means the pages are complete
+            with open(self._layout_path(key), "w") as f:
+                json.dump(layout, f)
+        except OSError as e:
+            Logger.warning(f"[SpriteAtlas] Could not write the atlas cache: {e}")
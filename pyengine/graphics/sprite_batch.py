@@ -0,0 +1,223 @@
+import numpy as np
+from OpenGL.GL import *
+from typing import Callable, Dict, List, Tuple
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from pyengine.gl_utils.gl_state import GLState
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.gl_utils.dynamic_vertex_buffer import DynamicVertexBuffer
+from pyengine.gl_utils.vertex_array import VertexArray
+from pyengine.graphics.material import MaterialState
+
+
+class SpriteBatch:
+    """
+    A run of consecutive sprites whose materials set the same GL state
+    (shader, texture, color, blend). Drawn with a single glDrawArrays call.
+    """
+    def __init__(self, material: MaterialState, first: int, count: int):
+        # First material of the run (the others are equivalent)
+        self.material = material
+
+        # Range of vertices inside the streaming buffer
+        self.first = first
+        self.count = count
+
+
+# =============================================================================
+# CLASS: SpriteBatcher
+# Collects sprites during the frame and draws them with as few calls as possible.
+# =============================================================================
+class SpriteBatcher:
+    """
+    Writes the world-space corners, normals and UVs of every submitted sprite into one
+    streaming vertex buffer (uploaded once per frame), then issues one draw call per batch.
+
+    Batches are drawn with the material's own shader (mesh.vert layout, identity u_model),
+    so sprites keep their lighting. A new batch starts when the material state changes or
+    when the RenderSystem draws a mesh in between (break_batch), so the painter's order
+    of the unbatched path is preserved.
+    """
+    # Vertex Format: [x, y, z, nx, ny, nz, u, v]
+    FLOATS_PER_VERTEX = 8
+    VERTICES_PER_SPRITE = 6
+
+    # Local corners of the unit quad (same geometry as the Rectangle mesh)
+    # Order: Bottom-Left, Bottom-Right, Top-Left, Top-Right
+    _CORNERS = np.array([
+        [-0.5, -0.5, 0.0, 1.0],
+        [ 0.5, -0.5, 0.0, 1.0],
+        [-0.5,  0.5, 0.0, 1.0],
+        [ 0.5,  0.5, 0.0, 1.0],
+    ], dtype=np.float32)
+
+    _CORNER_UVS = np.array([
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [1.0, 1.0],
+    ], dtype=np.float32)
+
+    # Two triangles per quad, same winding as Rectangle
+    _TRIANGLES = np.array([0, 1, 2, 1, 3, 2], dtype=np.intp)
+
+    _IDENTITY = np.identity(4, dtype=np.float32)
+
+    def __init__(self, initial_capacity: int = 256):
+        """
+        :param initial_capacity: Number of sprites the buffer can hold before growing.
+        """
+        stride = self.FLOATS_PER_VERTEX * 4
+
+        # Streaming ring buffer, written every frame without waiting for the GPU
+        self.vbo = DynamicVertexBuffer(stride, initial_capacity * self.VERTICES_PER_SPRITE * stride)
+
+        # One VAO per shader (attribute locations differ between programs)
+        self._vaos: Dict[int, VertexArray] = {}
+
+        # Per-frame submissions
+        self._models: List[np.ndarray] = []
+        self._uv_transforms: List[Tuple[float, float, float, float]] = []
+        self._batch_starts: List[Tuple[int, MaterialState]] = []
+        self._state = None
+        self._break = True
+
+        # Result of the last upload (read by the RenderSystem for drawing & statistics)
+        self.batches: List[SpriteBatch] = []
+        self.sprite_count = 0
+        self._base_vertex = 0
+
+    def _get_vao(self, shader: ShaderProgram) -> VertexArray:
+        vao = self._vaos.get(shader.id)
+        if vao is None:
+            stride = self.FLOATS_PER_VERTEX * 4
+            vao = VertexArray()
+
+            for name, size, offset in (("a_position", 3, 0), ("a_normal", 3, 12), ("a_texcoord", 2, 24)):
+                loc = shader.get_attrib_location(name)
+                if loc != -1:
+                    vao.add_attribute(self.vbo, loc, size, stride, offset)
+
+            self._vaos[shader.id] = vao
+        return vao
+
+    @staticmethod
+    def _state_key(material: MaterialState):
+        """Everything _bind_material and the blend state depend on."""
+        return (material.shader, material.texture, material.texture_page, material.texture_layer,
+                tuple(material.color), material.blend)
+
+    def begin(self) -> None:
+        """Starts a new frame: forgets all sprites submitted previously."""
+        self._models.clear()
+        self._uv_transforms.clear()
+        self._batch_starts.clear()
+        self._state = None
+        self._break = True
+        self.batches = []
+        self.sprite_count = 0
+
+    def submit(self, model: np.ndarray, uv_transform: Tuple[float, float, float, float], material: MaterialState) -> bool:
+        """
+        Queues one sprite.
+        :param model: Column-major (4, 4) model matrix of the sprite (applied to the unit quad), see Transform.get_matrices.
+        :param uv_transform: (scale_x, scale_y, offset_x, offset_y) as returned by SpriteSheet.get_uv_transform().
+        :param material: Provides the shader, texture, tint color and blend state.
+        Returns True if the sprite starts a new batch.
+        """
+        state = self._state_key(material)
+        new_batch = self._break or state != self._state
+        if new_batch:
+            self._batch_starts.append((len(self._models), material))
+            self._state = state
+            self._break = False
+
+        self._models.append(model)
+        self._uv_transforms.append(uv_transform)
+        return new_batch
+
+    def break_batch(self) -> None:
+        """Something else is drawn after the sprites queued so far: the next sprite starts a new batch."""
+        self._break = True
+
+    def _build_vertices(self) -> np.ndarray:
+        """
+        Generates the interleaved vertex data of every queued sprite in a few NumPy operations.
+        Returns an array of shape (sprites, 6, 8).
+        """
+        count = len(self._models)
+
+        # (N, 4, 4) column-major: models[n, j, i] is row i of column j, world = M @ corner
+        models = np.array(self._models, dtype=np.float32)
+        corners = np.einsum("nji,cj->nci", models, self._CORNERS)
+
+        # Quad normal (0, 0, 1) in world space = third column (what mat3(u_model) * a_normal gives)
+        normals = models[:, 2, 0:3]
+
+        # UV of each corner: corner_uv * scale + offset
+        uv_transforms = np.array(self._uv_transforms, dtype=np.float32)
+        corner_uvs = self._CORNER_UVS[None, :, :] * uv_transforms[:, None, 0:2] + uv_transforms[:, None, 2:4]
+
+        vertices = np.empty((count, self.VERTICES_PER_SPRITE, self.FLOATS_PER_VERTEX), dtype=np.float32)
+        vertices[:, :, 0:3] = corners[:, self._TRIANGLES, 0:3]
+        vertices[:, :, 3:6] = normals[:, None, :]
+        vertices[:, :, 6:8] = corner_uvs[:, self._TRIANGLES]
+        return vertices
+
+    def upload(self) -> List[SpriteBatch]:
+        """
+        Writes all queued sprites into the streaming buffer (one write per frame)
+        and returns the batches, in submission order. Call end() once they are drawn.
+        """
+        self.sprite_count = len(self._models)
+        if self.sprite_count == 0:
+            self.batches = []
+            return self.batches
+
+        vertices = self._build_vertices()
+
+        # batch.first is relative to this vertex
+        self.vbo.begin_frame()
+        self._base_vertex = self.vbo.write(vertices)
+
+        ends = [start for start, _ in self._batch_starts[1:]] + [self.sprite_count]
+        self.batches = [
+            SpriteBatch(material, start * self.VERTICES_PER_SPRITE, (end - start) * self.VERTICES_PER_SPRITE)
+            for (start, material), end in zip(self._batch_starts, ends)
+        ]
+        return self.batches
+
+    def draw(self, batch: SpriteBatch, bind_material: Callable[[MaterialState], None]) -> None:
+        """
+        Draws one uploaded batch with its material's shader.
+        The camera & lights come from the uniform blocks, which must be bound beforehand.
+        :param bind_material: Uploads color & textures of a material (RenderSystem._bind_material).
+        """
+        material = batch.material
+        shader = material.shader
+        shader.use()
+        bind_material(material)
+
+        # Vertices are already in world space, UVs already transformed
+        shader.set_uniform_matrix("u_model", self._IDENTITY)
+        GLDispatch.glUniform2f(shader.get_uniform_location("u_uv_scale"), 1.0, 1.0)
+        GLDispatch.glUniform2f(shader.get_uniform_location("u_uv_offset"), 0.0, 0.0)
+        GLDispatch.glUniform3f(shader.get_uniform_location("u_position_scale"), 1.0, 1.0, 1.0)
+        GLDispatch.glUniform3f(shader.get_uniform_location("u_position_offset"), 0.0, 0.0, 0.0)
+        GLDispatch.glUniform1i(shader.get_uniform_location("u_octahedral_normals"), 0)
+
+        # Redundant changes are filtered by GLState
+        GLState.set_enabled(GL_BLEND, material.blend)
+
+        self._get_vao(shader).bind()
+        GLDispatch.glDrawArrays(GL_TRIANGLES, self._base_vertex + batch.first, batch.count)
+
+    def end(self) -> None:
+        """Fences the frame's region of the streaming buffer once every batch has been drawn."""
+        if self.sprite_count:
+            self.vbo.end_frame()
+
+    def destroy(self) -> None:
+        for vao in self._vaos.values():
+            vao.destroy()
+        self._vaos.clear()
+        self.vbo.destroy()
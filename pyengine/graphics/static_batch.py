@@ -0,0 +1,180 @@
+import numpy as np
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from pyengine.core.logger import Logger
+from pyengine.ecs.component import Component
+from pyengine.ecs.entity_manager import EntityManager
+from pyengine.gl_utils.mesh import Mesh
+from pyengine.gl_utils.vertex_format import VertexFormat
+from pyengine.graphics.material import Material, MaterialState
+from pyengine.graphics.mesh_renderer import MeshRenderer
+from pyengine.graphics.sprite import SpriteSheet
+from pyengine.physics.transform import Transform
+
+
+class Static(Component):
+    """
+    Tag component for entities that never move (level geometry, decoration...).
+    Their MeshRenderers are merged into a few big meshes by the StaticBatcher.
+    Changing the Transform of a Static entity has no visible effect until the batches are rebuilt
+    (remove and add the Static tag again).
+    LODGroups are ignored: the batch is built from the mesh assigned when the tag was added.
+    """
+    pass
+
+
+# =============================================================================
+# CLASS: StaticBatcher
+# Merges the meshes of Static entities sharing a material (or a texture array page)
+# into pre-transformed world-space meshes, split into a grid of cells so each
+# cell can still be culled.
+# =============================================================================
+class StaticBatcher:
+    FLOATS_PER_VERTEX = 8
+
+    def __init__(self, cell_size: float = 16.0):
+        """
+        :param cell_size: Size (world units) of the grid cells. Entities are assigned to the cell
+                          containing the center of their bounding sphere.
+        """
+        self.cell_size = cell_size
+
+        # One MeshRenderer per (material, cell): drawn like a regular entity with an identity model matrix.
+        # Owned by the render side (filled by upload()).
+        self.batches: List[MeshRenderer] = []
+
+        # Material of every batch, in the same order (main thread side: snapshotted every frame)
+        self.materials: List[Material] = []
+
+        # Set of entities the batches were built from & component versions seen at that time
+        self._entities: FrozenSet[int] = frozenset()
+        self._versions: Tuple[int, int, int] = (-1, -1, -1)
+
+    def prepare(self, entity_manager: EntityManager) -> Optional[List[Tuple[MaterialState, np.ndarray, np.ndarray, Optional[np.ndarray], VertexFormat]]]:
+        """
+        CPU part (extract phase): if Static entities were added or removed, pre-transforms and merges
+        their geometry. Returns a list of (material, vertices, indices, texture layers or None, vertex format)
+        to pass to upload(), or None if nothing changed.
+        A batch uses the vertex format of the first mesh merged into it (quantized formats are
+        re-fitted to the bounds of the batch).
+        """
+        versions = (
+            entity_manager.get_version(Static),
+            entity_manager.get_version(MeshRenderer),
+            entity_manager.get_version(Transform),
+        )
+        if versions == self._versions:
+            return None
+        self._versions = versions
+
+        entities = frozenset(entity for entity, _ in self._static_entities(entity_manager))
+        if entities == self._entities:
+            return None
+        self._entities = entities
+
+        # Materials using a texture array page only need the same shader, page, color & blend
+        # to share a batch: the layer of each material is stored per vertex.
+        groups: Dict[Tuple[int, Tuple[int, int, int]], List[Tuple[np.ndarray, np.ndarray, int]]] = {}
+        materials: Dict[tuple, int] = {}
+        formats: Dict[Tuple[int, Tuple[int, int, int]], VertexFormat] = {}
+        batch_materials: List[Material] = []
+
+        renderers = []
+        transforms = []
+        for _, (transform, renderer) in self._static_entities(entity_manager):
+            if renderer.mesh.count > 0:
+                renderers.append(renderer)
+                transforms.append(transform)
+
+        # Model matrices in math layout (rows)
+        models = Transform.get_matrices(transforms).transpose(0, 2, 1)
+
+        for renderer, model in zip(renderers, models):
+            mesh = renderer.mesh
+            center = model[0:3, 0:3] @ mesh.bounding_center + model[0:3, 3]
+            cell = tuple(np.floor(center / self.cell_size).astype(int).tolist())
+
+            material = renderer.material
+            material_key = self._material_key(material)
+            if material_key not in materials:
+                materials[material_key] = len(batch_materials)
+                batch_materials.append(self._batch_material(material))
+
+            key = (materials[material_key], cell)
+            formats.setdefault(key, mesh.vertex_format)
+            groups.setdefault(key, []).append((self._transform_vertices(mesh.vertices, model), mesh.indices, material.texture_layer))
+
+        # Keep batches of the same material next to each other (fewer state changes when drawing)
+        geometry = []
+        self.materials = []
+        for key in sorted(groups):
+            parts = groups[key]
+            material = batch_materials[key[0]]
+
+            # Shift the indices of each part past the vertices of the previous parts
+            sizes = [len(vertices) // self.FLOATS_PER_VERTEX for vertices, _, _ in parts]
+            offsets = np.cumsum([0] + sizes[:-1])
+            vertices = np.concatenate([vertices for vertices, _, _ in parts])
+            indices = np.concatenate([indices.astype(np.uint32) + offset for (_, indices, _), offset in zip(parts, offsets)])
+
+            layers = None
+            if material.texture_page:
+                layers = np.repeat(np.array([layer for _, _, layer in parts], dtype=np.float32), sizes)
+
+            geometry.append((material.snapshot(), vertices, indices, layers, formats[key]))
+            self.materials.append(material)
+
+        return geometry
+
+    def _material_key(self, material: Material) -> tuple:
+        if material.texture_page:
+            return ("page", id(material.shader), id(material.texture_page), tuple(material.color), material.blend)
+        return ("material", id(material))
+
+    def _batch_material(self, material: Material) -> Material:
+        """Material drawing a batch (the layer comes from the vertices)."""
+        if material.texture_page:
+            return Material(material.shader, color=material.color, blend=material.blend,
+                            texture_page=material.texture_page)
+        return material
+
+    def upload(self, geometry: List[Tuple[MaterialState, np.ndarray, np.ndarray, Optional[np.ndarray], VertexFormat]]) -> None:
+        """
+        GL part (submit phase): replaces the batches with the geometry returned by prepare().
+        """
+        self.destroy()
+        for material, vertices, indices, layers, vertex_format in geometry:
+            mesh = Mesh(material.shader, vertices, indices, layers, vertex_format=vertex_format)
+            self.batches.append(MeshRenderer(mesh, material))
+
+        Logger.debug(f"[StaticBatcher] {len(self._entities)} static entities merged into {len(self.batches)} batches")
+
+    def contains(self, entity: int) -> bool:
+        """True if the entity is drawn through a batch (the RenderSystem must skip it)."""
+        return entity in self._entities
+
+    def _static_entities(self, entity_manager: EntityManager):
+        for entity, (_, transform, renderer) in entity_manager.get_entities_with(Static, Transform, MeshRenderer):
+            # Animated sprites change their UVs every frame: they cannot be baked
+            if entity_manager.get_component(entity, SpriteSheet):
+                continue
+            yield entity, (transform, renderer)
+
+    def _transform_vertices(self, vertices: np.ndarray, model: np.ndarray) -> np.ndarray:
+        """Applies a model matrix (math layout) to an [x, y, z, nx, ny, nz, u, v] array."""
+        data = np.array(vertices, dtype=np.float32).reshape(-1, self.FLOATS_PER_VERTEX)
+
+        linear = model[0:3, 0:3]
+        data[:, 0:3] = data[:, 0:3] @ linear.T + model[0:3, 3]
+
+        # Normals use the inverse transpose (correct with non-uniform scale)
+        normal_matrix = np.linalg.inv(linear).T
+        normals = data[:, 3:6] @ normal_matrix.T
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        data[:, 3:6] = normals / np.maximum(lengths, 1e-12)
+
+        return data.ravel()
+
+    def destroy(self) -> None:
+        for batch in self.batches:
+            batch.mesh.destroy()
+        self.batches = []
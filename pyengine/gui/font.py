@@ -1,7 +1,10 @@
+import ctypes
+import numpy as np
 import sdl2.sdlttf
 from sdl2 import *
+from typing import Optional, Tuple
 from pyengine.core.logger import Logger
-from pyengine.gl_utils.texture import Texture
+from pyengine.gl_utils.texture import Texture, surface_pixels
 
 
 class Font:
@@ -9,10 +12,22 @@ class Font:
     Wrapper around SDL_ttf font.
     """
     def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
         self.font = sdl2.sdlttf.TTF_OpenFont(path.encode(), size)
         if not self.font:
             Logger.error(f"Failed to load font: {path}")
 
+    @property
+    def height(self) -> int:
+        """Maximum pixel height of a line of text (ascent + descent)."""
+        return sdl2.sdlttf.TTF_FontHeight(self.font) if self.font else 0
+
+    @property
+    def line_skip(self) -> int:
+        """Recommended pixel distance between two baselines."""
+        return sdl2.sdlttf.TTF_FontLineSkip(self.font) if self.font else 0
+
     def render_text(self, text: str, color=(255, 255, 255)) -> Texture:
         """
         Renders a string to an SDL Surface, converts it to OpenGL Texture.
@@ -36,6 +51,49 @@ class Font:
         
         return texture
 
+    def render_glyph(self, char: str) -> Optional[Tuple[np.ndarray, int, int]]:
+        """
+        Rasterizes a single character (used to fill a GlyphAtlas).
+        Returns (coverage, offset_x, advance) or None if the font has no such glyph:
+          - coverage: (height, width) uint8 alpha, top row first. The cell spans the whole
+            line height, so its top edge is the top of the line.
+          - offset_x: position of the cell's left edge relative to the pen (negative for
+            glyphs overhanging to the left).
+          - advance: how far the pen moves after this glyph, in pixels.
+        """
+        if not self.font:
+            return None
+
+        code = ord(char)
+        if code > 0xFFFF or not sdl2.sdlttf.TTF_GlyphIsProvided(self.font, code):
+            return None
+
+        minx, maxx, miny, maxy, advance = (ctypes.c_int() for _ in range(5))
+        sdl2.sdlttf.TTF_GlyphMetrics(self.font, code, ctypes.byref(minx), ctypes.byref(maxx),
+                                     ctypes.byref(miny), ctypes.byref(maxy), ctypes.byref(advance))
+
+        # Rendered in white: the color is applied per vertex when drawing
+        surface = sdl2.sdlttf.TTF_RenderGlyph_Blended(self.font, code, SDL_Color(255, 255, 255, 255))
+        if not surface:
+            # Whitespace: nothing to draw, but the pen still moves
+            return np.zeros((0, 0), dtype=np.uint8), 0, advance.value
+
+        # Blended glyphs are ARGB8888: the alpha is the top byte of each pixel
+        contents = surface.contents
+        rows = surface_pixels(contents)[:, :contents.w * 4]
+        coverage = (np.ascontiguousarray(rows).view(np.uint32) >> 24).astype(np.uint8)
+        SDL_FreeSurface(surface)
+
+        return coverage, min(0, minx.value), advance.value
+
+    def get_kerning(self, previous: str, char: str) -> int:
+        """
+        Pixel adjustment of the pen between two consecutive characters (usually <= 0).
+        """
+        if not self.font:
+            return 0
+        return sdl2.sdlttf.TTF_GetFontKerningSizeGlyphs(self.font, ord(previous), ord(char))
+
     def destroy(self):
         if self.font:
             sdl2.sdlttf.TTF_CloseFont(self.font)
@@ -0,0 +1,164 @@
+import numpy as np
+from OpenGL.GL import *
+from typing import Dict, Optional, Tuple
+from pyengine.core.logger import Logger
+from pyengine.gl_utils.gl_state import GLState
+from pyengine.gl_utils.texture import Texture
+from pyengine.gui.font import Font
+
+
+class Glyph:
+    """
+    Placement of one character inside a GlyphAtlas (texels, origin at the bottom-left).
+    """
+    def __init__(self, x: int, y: int, width: int, height: int, offset_x: int, advance: int):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+        # Left edge of the cell relative to the pen & pen movement (see Font.render_glyph)
+        self.offset_x = offset_x
+        self.advance = advance
+
+
+# =============================================================================
+# CLASS: GlyphAtlas
+# Every glyph of one Font (= one path & size), rasterized once into a shared
+# single-channel texture.
+# =============================================================================
+class GlyphAtlas:
+    """
+    Printable ASCII is rasterized up front, other characters the first time they are asked for.
+    Glyphs are packed in shelves (rows of cells of the font height); when the texture is full,
+    it doubles in height. Glyph rects are in texels, so they stay valid when it grows,
+    but normalized UVs must be recomputed: `version` changes every time this happens.
+
+    The coverage is kept on the CPU as well, so new glyphs only upload the rows they touched.
+    """
+    PRELOADED_CHARACTERS = "".join(chr(code) for code in range(32, 127))
+
+    def __init__(self, font: Font, width: int = 512, padding: int = 1):
+        """
+        :param font: The font to rasterize.
+        :param width: Width of the atlas texture in texels (fixed).
+        :param padding: Empty texels around every glyph (avoids bleeding with linear filtering).
+        """
+        self.font = font
+        self.padding = padding
+
+        self.width = width
+        self.height = 64
+        self.version = 0
+
+        # Coverage, row 0 = bottom of the texture (OpenGL order)
+        self.pixels = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        # char -> Glyph (None if the font has no such character)
+        self.glyphs: Dict[str, Optional[Glyph]] = {}
+
+        # Shelf packing cursor
+        self._shelf_x = padding
+        self._shelf_y = padding
+        self._shelf_height = 0
+
+        # Version of the texture on the GPU (-1 = never uploaded) & rows modified since the last upload
+        self._uploaded_version = -1
+        self._dirty_rows: Optional[Tuple[int, int]] = None
+
+        self.texture = Texture()
+        for char in self.PRELOADED_CHARACTERS:
+            self.get_glyph(char)
+
+    def get_glyph(self, char: str) -> Optional[Glyph]:
+        """
+        Returns the placement of a character, rasterizing it on first use.
+        """
+        if char in self.glyphs:
+            return self.glyphs[char]
+
+        glyph = None
+        rendered = self.font.render_glyph(char)
+        if rendered is not None:
+            coverage, offset_x, advance = rendered
+            height, width = coverage.shape
+            if width + 2 * self.padding > self.width:
+                Logger.warning(f"[GlyphAtlas] Glyph '{char}' is wider than the atlas, skipped")
+            else:
+                x, y = self._allocate(width, height)
+                # Flip the rows: glyphs are top-first, the atlas is bottom-first
+                self.pixels[y:y + height, x:x + width] = coverage[::-1]
+                self._mark_dirty(y, y + height)
+                glyph = Glyph(x, y, width, height, offset_x, advance)
+
+        self.glyphs[char] = glyph
+        return glyph
+
+    def _allocate(self, width: int, height: int) -> Tuple[int, int]:
+        """Finds room for a width x height cell. Returns its bottom-left texel."""
+        if width == 0 or height == 0:
+            return 0, 0
+
+        # Start a new shelf when the current one is full
+        if self._shelf_x + width + self.padding > self.width:
+            self._shelf_y += self._shelf_height + self.padding
+            self._shelf_x = self.padding
+            self._shelf_height = 0
+
+        while self._shelf_y + height + self.padding > self.height:
+            self._grow()
+
+        x, y = self._shelf_x, self._shelf_y
+        self._shelf_x += width + self.padding
+        self._shelf_height = max(self._shelf_height, height)
+        return x, y
+
+    def _grow(self) -> None:
+        """Doubles the height of the atlas (existing glyphs keep their texel position)."""
+        pixels = np.zeros((self.height * 2, self.width), dtype=np.uint8)
+        pixels[:self.height] = self.pixels
+        self.pixels = pixels
+        self.height *= 2
+        self.version += 1
+        self._dirty_rows = None
+
+    def _mark_dirty(self, first_row: int, last_row: int) -> None:
+        if self._uploaded_version != self.version:
+            return # The whole texture is re-created anyway
+        if self._dirty_rows is None:
+            self._dirty_rows = (first_row, last_row)
+        else:
+            self._dirty_rows = (min(self._dirty_rows[0], first_row), max(self._dirty_rows[1], last_row))
+
+    def upload(self) -> None:
+        """
+        Sends pending changes to the GPU (call before drawing, on the thread owning the GL context).
+        """
+        if self._uploaded_version == self.version and self._dirty_rows is None:
+            return
+
+        GLState.bind_texture(None, self.texture.id)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+
+        if self._uploaded_version != self.version:
+            # First upload, or the atlas grew: re-create the whole texture
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_R8, self.width, self.height, 0, GL_RED, GL_UNSIGNED_BYTE, self.pixels)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            self.texture.width = self.width
+            self.texture.height = self.height
+            self._uploaded_version = self.version
+        else:
+            # Only the band of rows touched by new glyphs
+            first, last = self._dirty_rows
+            band = np.ascontiguousarray(self.pixels[first:last])
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, first, self.width, last - first, GL_RED, GL_UNSIGNED_BYTE, band)
+
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
+        GLState.bind_texture(None, 0)
+        self._dirty_rows = None
+
+    def destroy(self) -> None:
+        self.texture.destroy()
@@ -0,0 +1,230 @@
+import numpy as np
+from OpenGL.GL import *
+from typing import Dict, List, Optional, Tuple
+from pyengine.gl_utils.dynamic_vertex_buffer import DynamicVertexBuffer
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.gl_utils.vertex_array import VertexArray
+from pyengine.graphics.frame_packet import TextItem
+from pyengine.gui.font import Font
+from pyengine.gui.glyph_atlas import GlyphAtlas
+
+
+# =============================================================================
+# CLASS: TextBatcher
+# Draws every TextRenderer of the frame from glyph atlases: strings are laid
+# out into quads (with kerning) and streamed into one vertex buffer.
+# =============================================================================
+class TextBatcher:
+    """
+    Changing a string only costs a layout (a few NumPy operations): nothing is rasterized
+    or uploaded except glyphs seen for the first time.
+    Consecutive texts using the same font share one draw call, so with a single font
+    all the text on screen is drawn at once.
+    """
+    # Vertex Format: [x, y, u, v, r, g, b, a]
+    FLOATS_PER_VERTEX = 8
+    VERTICES_PER_GLYPH = 6
+
+    # Corners of a glyph cell (fractions of its size)
+    # Order: Bottom-Left, Bottom-Right, Top-Left, Top-Right
+    _CORNERS = np.array([
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [1.0, 1.0],
+    ], dtype=np.float32)
+
+    # Two triangles per quad, same winding as Rectangle
+    _TRIANGLES = np.array([0, 1, 2, 1, 3, 2], dtype=np.intp)
+
+    # Laid out strings kept around (counters & timers only cycle through a few values)
+    MAX_CACHED_LAYOUTS = 1024
+
+    def __init__(self, shader: ShaderProgram, initial_capacity: int = 1024):
+        """
+        :param shader: The text shader (shaders/text.vert + text.frag).
+        :param initial_capacity: Number of glyphs the buffer can hold before growing.
+        """
+        self.shader = shader
+
+        stride = self.FLOATS_PER_VERTEX * 4
+        self.vbo = DynamicVertexBuffer(stride, initial_capacity * self.VERTICES_PER_GLYPH * stride)
+        self.vao = VertexArray()
+
+        pos_loc = shader.get_attrib_location("a_position")
+        if pos_loc != -1:
+            self.vao.add_attribute(self.vbo, pos_loc, 2, stride, 0)
+
+        tex_loc = shader.get_attrib_location("a_texcoord")
+        if tex_loc != -1:
+            self.vao.add_attribute(self.vbo, tex_loc, 2, stride, 8)
+
+        color_loc = shader.get_attrib_location("a_color")
+        if color_loc != -1:
+            self.vao.add_attribute(self.vbo, color_loc, 4, stride, 16)
+
+        # One atlas per Font (the AssetManager shares a Font per path & size)
+        self.atlases: Dict[Font, GlyphAtlas] = {}
+
+        # (atlas, text) -> (atlas version, (glyphs, 6, 4) local [x, y, u, v])
+        self._layouts: Dict[Tuple[GlyphAtlas, str], Tuple[int, np.ndarray]] = {}
+
+        # Result of the last draw (read by the RenderSystem for statistics)
+        self.glyph_count = 0
+
+    def get_atlas(self, font: Font) -> GlyphAtlas:
+        atlas = self.atlases.get(font)
+        if atlas is None:
+            atlas = GlyphAtlas(font)
+            self.atlases[font] = atlas
+        return atlas
+
+    def _layout(self, atlas: GlyphAtlas, text: str) -> np.ndarray:
+        """
+        Places the glyphs of a string, centered on (0, 0) like the old text quad.
+        Lines go down, each one line_skip below the previous.
+        Returns the vertices of its quads: (glyphs, 6, 4) [x, y, u, v].
+        """
+        key = (atlas, text)
+        cached = self._layouts.get(key)
+        if cached is not None and cached[0] == atlas.version:
+            return cached[1]
+
+        font = atlas.font
+        line_height = font.height
+        line_skip = font.line_skip
+
+        # Cells: [left, bottom, width, height] in pixels & [x, y, width, height] in texels
+        cells = []
+        rects = []
+        pen_x = 0
+        line_top = 0
+        right = 0
+        previous = None
+
+        for char in text:
+            if char == "\n":
+                pen_x = 0
+                line_top -= line_skip
+                previous = None
+                continue
+
+            glyph = atlas.get_glyph(char)
+            if glyph is None:
+                previous = None
+                continue
+
+            if previous is not None:
+                pen_x += font.get_kerning(previous, char)
+
+            if glyph.width > 0:
+                left = pen_x + glyph.offset_x
+                cells.append((left, line_top - glyph.height, glyph.width, glyph.height))
+                rects.append((glyph.x, glyph.y, glyph.width, glyph.height))
+                right = max(right, left + glyph.width)
+
+            pen_x += glyph.advance
+            previous = char
+
+        vertices = np.empty((len(cells), self.VERTICES_PER_GLYPH, 4), dtype=np.float32)
+        if cells:
+            cells = np.array(cells, dtype=np.float32)
+            rects = np.array(rects, dtype=np.float32)
+
+            # Center the block of text
+            block_height = line_height - line_top
+            cells[:, 0] -= right * 0.5
+            cells[:, 1] += block_height * 0.5
+
+            corners = self._CORNERS[self._TRIANGLES]
+            vertices[:, :, 0:2] = cells[:, None, 0:2] + corners[None] * cells[:, None, 2:4]
+
+            # Texels -> normalized UVs (depends on the current atlas size)
+            atlas_size = np.array([atlas.width, atlas.height], dtype=np.float32)
+            vertices[:, :, 2:4] = (rects[:, None, 0:2] + corners[None] * rects[:, None, 2:4]) / atlas_size
+
+        if len(self._layouts) >= self.MAX_CACHED_LAYOUTS:
+            self._layouts.clear()
+        self._layouts[key] = (atlas.version, vertices)
+        return vertices
+
+    def get_bounds(self, text: TextItem) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Screen rectangle (min_x, min_y, max_x, max_y) covered by a text, or None if it draws nothing.
+        """
+        local = self._layout(self.get_atlas(text.font), text.text)
+        if len(local) == 0:
+            return None
+
+        xs = local[:, :, 0] * text.scale.x + text.position.x
+        ys = local[:, :, 1] * text.scale.y + text.position.y
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+    def draw(self, texts: List[TextItem]) -> int:
+        """
+        Lays out, uploads and draws the texts. The UI camera block must be bound beforehand.
+        Returns the number of draw calls issued.
+        """
+        self.glyph_count = 0
+        if not texts:
+            return 0
+
+        # 1. Layout (cached) then place every string on screen
+        runs: List[Tuple[GlyphAtlas, int, int]] = []
+        chunks = []
+        first = 0
+        for text in texts:
+            atlas = self.get_atlas(text.font)
+            local = self._layout(atlas, text.text)
+            if len(local) == 0:
+                continue
+
+            vertices = np.empty((len(local), self.VERTICES_PER_GLYPH, self.FLOATS_PER_VERTEX), dtype=np.float32)
+            vertices[:, :, 0] = local[:, :, 0] * text.scale.x + text.position.x
+            vertices[:, :, 1] = local[:, :, 1] * text.scale.y + text.position.y
+            vertices[:, :, 2:4] = local[:, :, 2:4]
+
+            # TextRenderer colors are 0-255 (RGB or RGBA)
+            color = tuple(text.color) + (255,) * (4 - len(text.color))
+            vertices[:, :, 4:8] = np.array(color, dtype=np.float32) / 255.0
+            chunks.append(vertices)
+
+            count = len(local) * self.VERTICES_PER_GLYPH
+            if runs and runs[-1][0] is atlas:
+                runs[-1] = (atlas, runs[-1][1], runs[-1][2] + count)
+            else:
+                runs.append((atlas, first, count))
+            first += count
+
+        if not chunks:
+            return 0
+
+        # Rows of glyphs seen for the first time this frame
+        for atlas, _, _ in runs:
+            atlas.upload()
+
+        # 2. Upload everything at once
+        self.vbo.begin_frame()
+        base_vertex = self.vbo.write(np.concatenate(chunks))
+
+        # 3. One draw call per run of texts sharing an atlas
+        self.shader.use()
+        GLDispatch.glUniform1i(self.shader.get_uniform_location("u_atlas"), 0)
+        self.vao.bind()
+        for atlas, start, count in runs:
+            atlas.texture.bind(0)
+            GLDispatch.glDrawArrays(GL_TRIANGLES, base_vertex + start, count)
+
+        self.vbo.end_frame()
+
+        self.glyph_count = first // self.VERTICES_PER_GLYPH
+        return len(runs)
+
+    def destroy(self) -> None:
+        for atlas in self.atlases.values():
+            atlas.destroy()
+        self.atlases.clear()
+        self._layouts.clear()
+        self.vao.destroy()
+        self.vbo.destroy()
@@ -0,0 +1,127 @@
+import numpy as np
+from OpenGL.GL import *
+from typing import Dict, List, Tuple
+from pyengine.gl_utils.dynamic_vertex_buffer import DynamicVertexBuffer
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.gl_utils.vertex_array import VertexArray
+from pyengine.gl_utils.vertex_buffer import VertexBuffer
+from pyengine.graphics.frame_packet import UIBoxItem
+
+
+# =============================================================================
+# CLASS: UIBatcher
+# Draws every UIBox of the frame with instanced rendering: one unit quad,
+# one instance per box (center, size, color, corner radius).
+# =============================================================================
+class UIBatcher:
+    """
+    Boxes are sorted by z_order (stable, so equal layers keep their creation order),
+    then consecutive boxes sharing a shader are drawn with a single glDrawArraysInstanced.
+    With the default shader, the whole UI is one draw call.
+    """
+    # Instance Format: [center_x, center_y, width, height, r, g, b, a, radius]
+    FLOATS_PER_INSTANCE = 9
+
+    # Unit quad drawn as a triangle strip: Bottom-Left, Bottom-Right, Top-Left, Top-Right
+    _CORNERS = np.array([
+        [-0.5, -0.5],
+        [ 0.5, -0.5],
+        [-0.5,  0.5],
+        [ 0.5,  0.5],
+    ], dtype=np.float32)
+
+    # Per-instance attributes: (name, component count, offset in floats)
+    _INSTANCE_ATTRIBUTES = (
+        ("a_rect", 4, 0),
+        ("a_color", 4, 4),
+        ("a_radius", 1, 8),
+    )
+
+    def __init__(self, default_shader: ShaderProgram, initial_capacity: int = 64):
+        """
+        :param default_shader: Used for boxes without a material (shaders/ui.vert + ui.frag).
+        :param initial_capacity: Number of boxes the instance buffer can hold before growing.
+        """
+        self.default_shader = default_shader
+        self.stride = self.FLOATS_PER_INSTANCE * 4
+
+        self.quad_vbo = VertexBuffer(self._CORNERS)
+        self.instance_vbo = DynamicVertexBuffer(self.stride, initial_capacity * self.stride)
+
+        # One VAO per shader (attribute locations can differ): shader id -> (vao, instance attribute locations)
+        self._vaos: Dict[int, Tuple[VertexArray, List[Tuple[int, int, int]]]] = {}
+
+    def _get_vao(self, shader: ShaderProgram) -> Tuple[VertexArray, List[Tuple[int, int, int]]]:
+        entry = self._vaos.get(shader.id)
+        if entry is None:
+            vao = VertexArray()
+            corner_loc = shader.get_attrib_location("a_corner")
+            if corner_loc != -1:
+                vao.add_attribute(self.quad_vbo, corner_loc, 2, 8, 0)
+
+            locations = []
+            for name, count, offset in self._INSTANCE_ATTRIBUTES:
+                loc = shader.get_attrib_location(name)
+                if loc != -1:
+                    locations.append((loc, count, offset * 4))
+
+            entry = (vao, locations)
+            self._vaos[shader.id] = entry
+        return entry
+
+    def _build_instances(self, boxes: List[UIBoxItem]) -> np.ndarray:
+        instances = np.empty((len(boxes), self.FLOATS_PER_INSTANCE), dtype=np.float32)
+        instances[:, 0:2] = [(box.position.x, box.position.y) for box in boxes]
+        instances[:, 2:4] = [(box.width, box.height) for box in boxes]
+        instances[:, 4:8] = [box.color for box in boxes]
+        instances[:, 8] = [box.border_radius for box in boxes]
+        return instances
+
+    def draw(self, boxes: List[UIBoxItem]) -> int:
+        """
+        Draws the boxes. The UI camera block must be bound beforehand.
+        Returns the number of draw calls issued.
+        """
+        if not boxes:
+            return 0
+
+        # Painter's order: lowest layer first
+        boxes = sorted(boxes, key=lambda box: box.z_order)
+        shaders = [box.material.shader if box.material else self.default_shader for box in boxes]
+
+        # 1. Upload every instance at once
+        self.instance_vbo.begin_frame()
+        base_instance = self.instance_vbo.write(self._build_instances(boxes))
+
+        # 2. One instanced draw per run of boxes sharing a shader
+        draw_calls = 0
+        start = 0
+        while start < len(boxes):
+            shader = shaders[start]
+            end = start + 1
+            while end < len(boxes) and shaders[end] is shader:
+                end += 1
+
+            vao, locations = self._get_vao(shader)
+
+            # GL 3.3 has no "base instance": point the instance attributes at the first box of the run
+            byte_offset = (base_instance + start) * self.stride
+            for loc, count, offset in locations:
+                vao.add_attribute(self.instance_vbo, loc, count, self.stride, byte_offset + offset, divisor=1)
+
+            shader.use()
+            vao.bind()
+            GLDispatch.glDrawArraysInstanced(GL_TRIANGLE_STRIP, 0, len(self._CORNERS), end - start)
+            draw_calls += 1
+            start = end
+
+        self.instance_vbo.end_frame()
+        return draw_calls
+
+    def destroy(self) -> None:
+        for vao, _ in self._vaos.values():
+            vao.destroy()
+        self._vaos.clear()
+        self.quad_vbo.destroy()
+        self.instance_vbo.destroy()
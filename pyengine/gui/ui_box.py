@@ -7,18 +7,22 @@ class UIBox(Component):
     """
     Component representing a background panel with rounded corners.
     """
-    def __init__(self, width: float, height: float, color: tuple = (0.2, 0.2, 0.2, 0.8), border_radius: float = 10.0):
+    def __init__(self, width: float, height: float, color: tuple = (0.2, 0.2, 0.2, 0.8), border_radius: float = 10.0,
+                 z_order: int = 0):
         """
         :param width: Width in pixels.
         :param height: Height in pixels.
         :param color: RGBA tuple (0.0 to 1.0). Default is dark gray semi-transparent.
         :param border_radius: Radius of the corners in pixels.
+        :param z_order: Drawing layer. Boxes with a higher z_order are drawn on top
+                        (boxes of the same layer keep their creation order).
         """
         self.width = width
         self.height = height
         self.color = color
         self.border_radius = border_radius
+        self.z_order = z_order
         
-        # We need a material to hold the shader
+        # Optional: overrides the default shader (shaders/ui.vert + ui.frag)
         self.material: Optional[Material] = None
         
\ No newline at end of file
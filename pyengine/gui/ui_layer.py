@@ -0,0 +1,168 @@
+from collections import Counter
+from OpenGL.GL import *
+from typing import Hashable, List, Optional, Sequence, Tuple
+from pyengine.gl_utils.framebuffer import Framebuffer
+from pyengine.gl_utils.gl_dispatch import GLDispatch
+from pyengine.gl_utils.gl_state import GLState
+from pyengine.gl_utils.shader import ShaderProgram
+from pyengine.gl_utils.vertex_array import VertexArray
+
+# Screen rectangle in pixels: (min_x, min_y, max_x, max_y). None = the whole screen.
+Rect = Optional[Tuple[float, float, float, float]]
+
+
+# =============================================================================
+# CLASS: UILayer
+# Retained UI: the boxes & texts are drawn into an offscreen texture that is
+# only updated where something changed, then composited over the world with a
+# single full-screen triangle every frame.
+# =============================================================================
+class UILayer:
+    """
+    Every element of the frame is described by a signature (everything that affects its pixels)
+    and its screen rectangle. Elements whose signature appeared or disappeared since the last
+    frame mark their old and new rectangles as dirty; only those regions are cleared and redrawn
+    (with a scissor). A static HUD costs one textured draw per frame.
+
+    The texture holds premultiplied alpha (see begin_region), composited with (ONE, ONE_MINUS_SRC_ALPHA).
+    """
+    # Beyond this many separate regions, a single region enclosing them all is redrawn
+    MAX_DIRTY_REGIONS = 4
+
+    # Extra pixels around every rectangle (anti-aliased edges bleed past the geometry)
+    MARGIN = 2
+
+    def __init__(self, composite_shader: ShaderProgram):
+        """
+        :param composite_shader: Draws the cached texture (shaders/composite.vert + composite.frag).
+        """
+        self.composite_shader = composite_shader
+        self.target: Optional[Framebuffer] = None
+
+        # The full-screen triangle is generated from gl_VertexID, but a VAO must be bound to draw
+        self.vao = VertexArray()
+
+        # Elements drawn into the texture: signature -> count & signature -> rectangle
+        self._signatures: Counter = Counter()
+        self._rects = {}
+
+        # Regions redrawn during the last frame (read by the RenderSystem for statistics)
+        self.redrawn_regions = 0
+
+    def invalidate(self, width: int, height: int, elements: Sequence[Tuple[Hashable, Rect]]) -> List[Tuple[int, int, int, int]]:
+        """
+        Compares the elements of this frame with the cached ones.
+        :param elements: (signature, rectangle) of every UI element.
+        :return: Regions (x, y, width, height) to clear & redraw, in pixels.
+        """
+        self.redrawn_regions = 0
+        full_screen = [(0, 0, width, height)]
+
+        if self.target is None or (self.target.width, self.target.height) != (width, height):
+            if self.target is None:
+                self.target = Framebuffer(width, height, depth=False)
+            else:
+                self.target.resize(width, height)
+            self._store(elements)
+            return full_screen
+
+        signatures = Counter(signature for signature, _ in elements)
+        if signatures == self._signatures:
+            return []
+
+        # Changed elements: where they were (removed) & where they are now (added)
+        rects = {}
+        rects.update(self._rects)
+        rects.update((signature, rect) for signature, rect in elements)
+
+        dirty = []
+        for signature in (signatures - self._signatures) + (self._signatures - signatures):
+            rect = rects.get(signature)
+            if rect is None:
+                self._store(elements)
+                return full_screen
+            dirty.append(rect)
+
+        self._store(elements)
+        return self._to_regions(dirty, width, height)
+
+    def _store(self, elements: Sequence[Tuple[Hashable, Rect]]) -> None:
+        self._signatures = Counter(signature for signature, _ in elements)
+        self._rects = {signature: rect for signature, rect in elements}
+
+    def _to_regions(self, rects: List[Tuple[float, float, float, float]], width: int, height: int) -> List[Tuple[int, int, int, int]]:
+        """Grows the rectangles by MARGIN, merges the overlapping ones and clamps them to the screen."""
+        boxes = []
+        for min_x, min_y, max_x, max_y in rects:
+            box = [
+                max(0, int(min_x) - self.MARGIN), max(0, int(min_y) - self.MARGIN),
+                min(width, int(max_x) + 1 + self.MARGIN), min(height, int(max_y) + 1 + self.MARGIN),
+            ]
+            if box[2] > box[0] and box[3] > box[1]:
+                boxes.append(box)
+
+        # Merge until no two regions overlap (each merge removes one region)
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    a, b = boxes[i], boxes[j]
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        boxes[i] = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                        del boxes[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        if len(boxes) > self.MAX_DIRTY_REGIONS:
+            boxes = [[min(b[0] for b in boxes), min(b[1] for b in boxes), max(b[2] for b in boxes), max(b[3] for b in boxes)]]
+
+        return [(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in boxes]
+
+    # =========================================================================
+    # RENDERING
+    # =========================================================================
+
+    def begin_region(self, region: Tuple[int, int, int, int]) -> None:
+        """
+        Redirects drawing into the cached texture, restricted to a region (cleared to transparent).
+        Colors are accumulated premultiplied: color * alpha, alpha blended with (ONE, ONE_MINUS_SRC_ALPHA).
+        """
+        self.target.bind()
+        GLState.viewport(0, 0, self.target.width, self.target.height)
+
+        GLState.enable(GL_SCISSOR_TEST)
+        glScissor(*region)
+        glClearColor(0.0, 0.0, 0.0, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT)
+
+        GLState.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+        self.redrawn_regions += 1
+
+    def end_regions(self) -> None:
+        """Back to the window (the viewport is unchanged: same size as the texture)."""
+        GLState.disable(GL_SCISSOR_TEST)
+        self.target.unbind()
+
+    def composite(self) -> None:
+        """Draws the cached texture over the window."""
+        if self.target is None:
+            return
+
+        self.composite_shader.use()
+        GLState.bind_texture(0, self.target.color_texture)
+        GLDispatch.glUniform1i(self.composite_shader.get_uniform_location("u_texture"), 0)
+        GLState.blend_func(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+
+        self.vao.bind()
+        GLDispatch.glDrawArrays(GL_TRIANGLES, 0, 3)
+
+    def destroy(self) -> None:
+        if self.target:
+            self.target.destroy()
+            self.target = None
+        self.vao.destroy()
+        self._signatures.clear()
+        self._rects = {}
@@ -1,10 +1,245 @@
 import glm
+import numpy as np
+from typing import Sequence
 from pyengine.ecs.component import Component
 
+
+class TransformVector(glm.vec3):
+    """
+    Copy of a Transform vector, returned by its position/rotation/scale properties.
+    Writing a component (transform.position.y += 1) or updating the vector in place
+    (+=, -=, *=, /=) is forwarded to the Transform, which marks its matrix dirty.
+    """
+    def __init__(self, value, transform: "Transform" = None, name: str = None):
+        super().__init__(value)
+        self.__dict__["_transform"] = transform
+        self.__dict__["_name"] = name
+
+    def _forward(self, apply) -> None:
+        transform = self.__dict__["_transform"]
+        if transform is not None:
+            apply(getattr(transform, self.__dict__["_name"]))
+            transform.mark_dirty()
+
+    def __setattr__(self, name, value) -> None:
+        # Components & swizzles (x, y, z, xy...)
+        glm.vec3.__setattr__(self, name, value)
+        self._forward(lambda vector: glm.vec3.__setattr__(vector, name, value))
+
+    def __setitem__(self, index, value) -> None:
+        glm.vec3.__setitem__(self, index, value)
+        self._forward(lambda vector: vector.__setitem__(index, value))
+
+    def __iadd__(self, other):
+        glm.vec3.__iadd__(self, other)
+        self._forward(lambda vector: vector.__iadd__(other))
+        return self
+
+    def __isub__(self, other):
+        glm.vec3.__isub__(self, other)
+        self._forward(lambda vector: vector.__isub__(other))
+        return self
+
+    def __imul__(self, other):
+        glm.vec3.__imul__(self, other)
+        self._forward(lambda vector: vector.__imul__(other))
+        return self
+
+    def __itruediv__(self, other):
+        glm.vec3.__itruediv__(self, other)
+        self._forward(lambda vector: vector.__itruediv__(other))
+        return self
+
+
 class Transform(Component):
+    """
+    Position, rotation (Euler angles in radians) and scale of an entity.
+
+    The local model matrix is cached and only rebuilt after one of the properties is written.
+    The properties return TransformVector copies: assigning a whole vector
+    (transform.position += glm.vec3(0, 1, 0)) and mutating a single component in place
+    (transform.position.y += 1) both mark the matrix dirty.
+
+    Unlike the plain glm.vec3 attributes this replaced, a returned vector is only aliased for writes:
+    after `p = t.position`, `p.x = 1` still writes through to t, but `p` is a snapshot for reads
+    and does not see later changes made through t (or through another vector returned by it).
+    """
     def __init__(self, position=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
         # glm.vec3 is powerful: supports + - * /, cross product, etc.
-        self.position = glm.vec3(position)
-        self.rotation = glm.vec3(rotation) # Euler angles (radians)
-        self.scale = glm.vec3(scale)
-        
\ No newline at end of file
+        self._position = glm.vec3(position)
+        self._rotation = glm.vec3(rotation) # Euler angles (radians)
+        self._scale = glm.vec3(scale)
+
+        # Cached data, rebuilt lazily by get_matrix()
+        self._orientation = glm.quat()
+        self._matrix = glm.mat4(1.0)
+        self._dirty = True
+
+        # Incremented on every write. Lets other systems detect changes without comparing vectors.
+        self.version = 0
+
+    @property
+    def position(self) -> TransformVector:
+        return TransformVector(self._position, self, "_position")
+
+    @position.setter
+    def position(self, value) -> None:
+        self._position = glm.vec3(value)
+        self.mark_dirty()
+
+    @property
+    def rotation(self) -> TransformVector:
+        return TransformVector(self._rotation, self, "_rotation")
+
+    @rotation.setter
+    def rotation(self, value) -> None:
+        self._rotation = glm.vec3(value)
+        self.mark_dirty()
+
+    @property
+    def scale(self) -> TransformVector:
+        return TransformVector(self._scale, self, "_scale")
+
+    @scale.setter
+    def scale(self, value) -> None:
+        self._scale = glm.vec3(value)
+        self.mark_dirty()
+
+    @property
+    def orientation(self) -> glm.quat:
+        """
+        The rotation as a quaternion (X then Y then Z, same order as the Euler angles).
+        """
+        if self._dirty:
+            self._rebuild()
+        return self._orientation
+
+    def mark_dirty(self) -> None:
+        """
+        Forces the matrix to be rebuilt on next access.
+        Call this after mutating position/rotation/scale in place.
+        """
+        self._dirty = True
+        self.version += 1
+
+    def get_matrix(self) -> glm.mat4:
+        """
+        Returns the local model matrix (Translate * Rotate * Scale).
+        The returned matrix is shared: do not modify it in place.
+        """
+        if self._dirty:
+            self._rebuild()
+        return self._matrix
+
+    def _rebuild(self) -> None:
+        # Compose the Euler angles once into a quaternion
+        # (Equivalent to rotating around X, then Y, then Z in local space)
+        rx, ry, rz = self._rotation
+        self._orientation = (
+            glm.angleAxis(rx, glm.vec3(1, 0, 0)) *
+            glm.angleAxis(ry, glm.vec3(0, 1, 0)) *
+            glm.angleAxis(rz, glm.vec3(0, 0, 1))
+        )
+
+        # Rotation matrix with each axis (column) scaled, then the translation in the last column
+        matrix = glm.mat4_cast(self._orientation)
+        matrix[0] *= self._scale.x
+        matrix[1] *= self._scale.y
+        matrix[2] *= self._scale.z
+        matrix[3] = glm.vec4(self._position, 1.0)
+
+        self._matrix = matrix
+        self._dirty = False
+
+    @classmethod
+    def get_matrices(cls, transforms: Sequence["Transform"]) -> np.ndarray:
+        """
+        get_matrix() of many Transforms, as returned by compose_matrices() (column-major (N, 4, 4)).
+        Clean transforms reuse their cached matrix; the dirty ones are rebuilt together in one
+        NumPy pass and stored back into their cache, so get_matrix() returns the same values.
+        """
+        if not transforms:
+            return np.zeros((0, 4, 4), dtype=np.float32)
+
+        dirty = [transform for transform in transforms if transform._dirty]
+        if dirty:
+            # Vectors gathered through glm.array (one C copy per property)
+            positions = np.array(glm.array([transform._position for transform in dirty]), dtype=np.float32)
+            rotations = np.array(glm.array([transform._rotation for transform in dirty]), dtype=np.float32)
+            scales = np.array(glm.array([transform._scale for transform in dirty]), dtype=np.float32)
+
+            orientations = euler_to_quaternions(rotations)
+            matrices = compose_matrices(positions, orientations, scales)
+
+            # Back to PyGLM objects without a Python float per component:
+            # glm.array reads the math layout of mat4 and the [w, x, y, z] order of quat
+            glm_orientations = glm.array(orientations).reinterpret_cast(glm.quat)
+            glm_matrices = glm.array(np.ascontiguousarray(matrices.transpose(0, 2, 1)))
+            for transform, orientation, matrix in zip(dirty, glm_orientations, glm_matrices):
+                transform._orientation = orientation
+                transform._matrix = matrix
+                transform._dirty = False
+
+        # np.array(glm.array) has the math layout: back to column-major
+        matrices = np.array(glm.array([transform._matrix for transform in transforms]), dtype=np.float32)
+        return np.ascontiguousarray(matrices.transpose(0, 2, 1))
+
+
+# =============================================================================
+# BATCHED MATRICES
+# The same Translate * Rotate * Scale as Transform.get_matrix(), computed for N
+# entities at once with NumPy (no PyGLM call or Python object per entity).
+# =============================================================================
+
+def euler_to_quaternions(rotations: np.ndarray) -> np.ndarray:
+    """
+    Composes Euler angles like Transform (X then Y then Z: qx * qy * qz).
+    :param rotations: (N, 3) angles in radians.
+    :return: (N, 4) quaternions [w, x, y, z] (the order of np.array(glm.quat)).
+    """
+    half = np.asarray(rotations, dtype=np.float32) * 0.5
+    cx, cy, cz = np.cos(half).T
+    sx, sy, sz = np.sin(half).T
+
+    quaternions = np.empty((len(half), 4), dtype=np.float32)
+    quaternions[:, 0] = cx * cy * cz - sx * sy * sz
+    quaternions[:, 1] = sx * cy * cz + cx * sy * sz
+    quaternions[:, 2] = cx * sy * cz - sx * cy * sz
+    quaternions[:, 3] = cx * cy * sz + sx * sy * cz
+    return quaternions
+
+
+def compose_matrices(positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    Builds N model matrices in one pass.
+    :param positions: (N, 3) translations.
+    :param rotations: (N, 3) Euler angles in radians, or (N, 4) unit quaternions [w, x, y, z].
+    :param scales: (N, 3) scale factors.
+    :return: (N, 4, 4) float32 matrices in column-major order (matrices[i, column, row], like glm.mat4 in memory):
+             ready for glUniformMatrix4fv(location, N, GL_FALSE, matrices) or an instance buffer.
+             matrices.transpose(0, 2, 1) is the mathematical layout of np.array(glm.mat4).
+    """
+    rotations = np.asarray(rotations, dtype=np.float32)
+    quaternions = rotations if rotations.shape[1] == 4 else euler_to_quaternions(rotations)
+    w, x, y, z = quaternions.T
+    scales = np.asarray(scales, dtype=np.float32)
+    sx, sy, sz = scales.T
+
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    # Rotation columns scaled by their axis, then the translation column
+    matrices = np.zeros((len(quaternions), 4, 4), dtype=np.float32)
+    matrices[:, 0, 0] = (1.0 - 2.0 * (yy + zz)) * sx
+    matrices[:, 0, 1] = 2.0 * (xy + wz) * sx
+    matrices[:, 0, 2] = 2.0 * (xz - wy) * sx
+    matrices[:, 1, 0] = 2.0 * (xy - wz) * sy
+    matrices[:, 1, 1] = (1.0 - 2.0 * (xx + zz)) * sy
+    matrices[:, 1, 2] = 2.0 * (yz + wx) * sy
+    matrices[:, 2, 0] = 2.0 * (xz + wy) * sz
+    matrices[:, 2, 1] = 2.0 * (yz - wx) * sz
+    matrices[:, 2, 2] = (1.0 - 2.0 * (xx + yy)) * sz
+    matrices[:, 3, 0:3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
@@ -0,0 +1,15 @@
+#version 330 core
+
+out vec4 frag_color;
+
+// Cached UI layer (premultiplied alpha, same size as the window, see UILayer)
+uniform sampler2D u_texture;
+
+void main() {
+    frag_color = texelFetch(u_texture, ivec2(gl_FragCoord.xy), 0);
+
+    // Optimization: Discard fully transparent pixels
+    if (frag_color.a < 0.004) {
+        discard;
+    }
+}
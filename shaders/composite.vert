@@ -0,0 +1,7 @@
+#version 330 core
+
+// Full-screen triangle generated from the vertex index (no vertex buffer needed)
+void main() {
+    vec2 position = vec2((gl_VertexID << 1) & 2, gl_VertexID & 2);
+    gl_Position = vec4(position * 2.0 - 1.0, 0.0, 1.0);
+}
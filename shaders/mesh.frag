@@ -1,103 +1,116 @@
-#version 120
-
-#ifdef GL_ES
-    precision mediump float;
-#endif
+#version 330 core
 
 // --- INPUTS ---
-varying vec2 v_texcoord;
-varying vec3 v_normal;
-varying vec3 v_frag_pos;
+in vec2 v_texcoord;
+in vec3 v_normal;
+in vec3 v_frag_pos;
+in float v_view_depth;
+flat in float v_texture_layer;
+
+out vec4 frag_color;
 
 // --- UNIFORMS ---
 uniform sampler2D u_texture;
 uniform vec4 u_color;
-uniform int u_use_texture;
-
-uniform vec3 u_view_pos; // Need camera position for specular (later), or simple distance checks
-
-// --- LIGHT STRUCTURES ---
-struct DirLight {
-    vec3 direction;
-    vec3 color;
-    float intensity;
+uniform int u_use_texture; // 0 = color only, 1 = u_texture, 2 = layer of u_texture_array
+
+// Texture array page of the material (see TextureArray)
+uniform sampler2DArray u_texture_array;
+
+// Shared by every shader, uploaded once per frame (see FrameUniforms)
+layout(std140) uniform Lights {
+    vec4 u_ambient_color;       // rgb
+    vec4 u_dir_light_direction; // xyz
+    vec4 u_dir_light_color;     // rgb, a = intensity
+    ivec4 u_cluster_grid;       // xyz = cluster counts, w = slicing mode (0 = off, 1 = log, 2 = linear)
+    vec4 u_cluster_depth;       // x = scale, y = bias
+    vec4 u_viewport;            // x, y, width, height
 };
 
-struct PointLight {
-    vec3 position;
-    vec3 color;
-    float intensity;
-    
-    float constant;
-    float linear;
-    float quadratic;
-};
-
-// Define max number of lights
-#define NR_POINT_LIGHTS 4
-
-uniform DirLight u_dirLight;
-uniform PointLight u_pointLights[NR_POINT_LIGHTS];
-uniform int u_pointLightCount; // How many active lights?
-
-uniform vec3 u_ambientColor; 
+// --- CLUSTERED POINT LIGHTS (see ClusteredLighting) ---
+uniform samplerBuffer u_light_data;     // 3 texels per light: position+range, color+intensity, attenuation
+uniform usamplerBuffer u_cluster_data;  // 1 texel per cluster: offset, count
+uniform usamplerBuffer u_light_indices; // light indices, grouped by cluster
 
 // --- FUNCTIONS ---
 
-vec3 CalcDirLight(DirLight light, vec3 normal) {
+vec3 CalcDirLight(vec3 normal) {
     // Light direction (negate because we want direction FROM light TO fragment usually), 
     // but typically diff calculation wants FROM fragment TO light.
     // Let's standardise: light.direction is direction of rays. 
     // We need direction TO light source = -light.direction
-    vec3 lightDir = normalize(-light.direction);
+    vec3 lightDir = normalize(-u_dir_light_direction.xyz);
     
     // Diffuse shading
     float diff = max(dot(normal, lightDir), 0.0);
     
     // Combine results
-    vec3 diffuse = diff * light.color * light.intensity;
+    vec3 diffuse = diff * u_dir_light_color.rgb * u_dir_light_color.a;
     return diffuse;
 }
 
-vec3 CalcPointLight(PointLight light, vec3 normal, vec3 fragPos) {
-    vec3 lightDir = normalize(light.position - fragPos);
+vec3 CalcPointLight(int index, vec3 normal, vec3 fragPos) {
+    vec4 position_range = texelFetch(u_light_data, index * 3);
+    vec4 color_intensity = texelFetch(u_light_data, index * 3 + 1);
+    vec4 attenuation_params = texelFetch(u_light_data, index * 3 + 2);
+
+    vec3 lightDir = normalize(position_range.xyz - fragPos);
     
     // Diffuse shading
     float diff = max(dot(normal, lightDir), 0.0);
     
-    // Attenuation
-    float distance = length(light.position - fragPos);
-    float attenuation = 1.0 / (light.constant + light.linear * distance + light.quadratic * (distance * distance));    
+    // Attenuation (the light is only evaluated within its range, where this is >= 1/256)
+    float distance = length(position_range.xyz - fragPos);
+    float attenuation = 1.0 / (attenuation_params.x + attenuation_params.y * distance + attenuation_params.z * (distance * distance));
     
-    vec3 diffuse = diff * light.color * light.intensity;
+    vec3 diffuse = diff * color_intensity.rgb * color_intensity.a;
     
     return diffuse * attenuation;
 }
 
+int FindCluster() {
+    // Depth slice
+    float slice_f;
+    if (u_cluster_grid.w == 1) {
+        slice_f = log(max(v_view_depth, 1e-4)) * u_cluster_depth.x - u_cluster_depth.y;
+    } else {
+        slice_f = v_view_depth * u_cluster_depth.x - u_cluster_depth.y;
+    }
+    int slice = clamp(int(floor(slice_f)), 0, u_cluster_grid.z - 1);
+
+    // Screen tile
+    vec2 screen_uv = (gl_FragCoord.xy - u_viewport.xy) / u_viewport.zw;
+    ivec2 tile = clamp(ivec2(screen_uv * vec2(u_cluster_grid.xy)), ivec2(0), u_cluster_grid.xy - 1);
+
+    return tile.x + u_cluster_grid.x * (tile.y + u_cluster_grid.y * slice);
+}
+
 void main() {
     // 1. Base Color
     vec4 objectColor = u_color;
     if (u_use_texture == 1) {
-        objectColor = texture2D(u_texture, v_texcoord) * u_color;
+        objectColor = texture(u_texture, v_texcoord) * u_color;
+    } else if (u_use_texture == 2) {
+        objectColor = texture(u_texture_array, vec3(v_texcoord, v_texture_layer)) * u_color;
     }
 
     vec3 norm = normalize(v_normal);
     vec3 result = vec3(0.0);
 
     // 2. Add Ambient
-    result += u_ambientColor * objectColor.rgb;
+    result += u_ambient_color.rgb * objectColor.rgb;
 
     // 3. Add Directional Light
-    result += CalcDirLight(u_dirLight, norm) * objectColor.rgb;
-
-    // 4. Add Point Lights
-    for(int i = 0; i < NR_POINT_LIGHTS; i++) {
-        // GLSL 1.20 workaround: Loops must be unrolled or fixed size.
-        // We iterate all and check count inside or just assume valid data if 0 intensity.
-        if (i < u_pointLightCount) {
-            result += CalcPointLight(u_pointLights[i], norm, v_frag_pos) * objectColor.rgb;
+    result += CalcDirLight(norm) * objectColor.rgb;
+
+    // 4. Add Point Lights (only those touching the cluster of this fragment)
+    if (u_cluster_grid.w != 0) {
+        uvec2 range = texelFetch(u_cluster_data, FindCluster()).xy;
+        for (uint i = 0u; i < range.y; i++) {
+            int light_index = int(texelFetch(u_light_indices, int(range.x + i)).r);
+            result += CalcPointLight(light_index, norm, v_frag_pos) * objectColor.rgb;
         }
     }
 
-    gl_FragColor = vec4(result, objectColor.a);
+    frag_color = vec4(result, objectColor.a);
 }
\ No newline at end of file
@@ -1,16 +1,27 @@
-#version 120
+#version 330 core
 
-attribute vec3 a_position;
-attribute vec3 a_normal;
-attribute vec2 a_texcoord;
+in vec3 a_position;
+in vec3 a_normal;
+in vec2 a_texcoord;
 
-varying vec2 v_texcoord;
-varying vec3 v_normal;
-varying vec3 v_frag_pos;
+// Texture array layer: per vertex in merged static batches, otherwise a constant set per draw
+in float a_texture_layer;
+
+out vec2 v_texcoord;
+out vec3 v_normal;
+out vec3 v_frag_pos;
+out float v_view_depth; // Distance along the camera axis (used to find the light cluster)
+flat out float v_texture_layer;
+
+// Shared by every shader, uploaded once per frame (see FrameUniforms)
+layout(std140) uniform Camera {
+    mat4 u_view;
+    mat4 u_projection;
+    mat4 u_view_projection;
+    vec4 u_camera_position;
+};
 
 uniform mat4 u_model;
-uniform mat4 u_view;
-uniform mat4 u_projection;
 
 // Scale allows us to zoom into a single cell (e.g., 0.25 for a 4x4 grid)
 uniform vec2 u_uv_scale;
@@ -18,17 +29,39 @@ uniform vec2 u_uv_scale;
 // Offset allows us to move to the specific cell (row/col)
 uniform vec2 u_uv_offset;
 
+// Compressed vertex formats (see VertexFormat): position = a_position * scale + offset
+uniform vec3 u_position_scale = vec3(1.0);
+uniform vec3 u_position_offset = vec3(0.0);
+
+// 1 = a_normal holds an octahedral encoding in .xy
+uniform int u_octahedral_normals = 0;
+
+vec3 decode_normal() {
+    if (u_octahedral_normals == 0) {
+        return a_normal;
+    }
+    vec3 n = vec3(a_normal.xy, 1.0 - abs(a_normal.x) - abs(a_normal.y));
+    float t = max(-n.z, 0.0);
+    n.x += n.x >= 0.0 ? -t : t;
+    n.y += n.y >= 0.0 ? -t : t;
+    return normalize(n);
+}
+
 void main() {
     // Calculate world position
-    vec4 world_pos = u_model * vec4(a_position, 1.0);
+    vec3 position = a_position * u_position_scale + u_position_offset;
+    vec4 world_pos = u_model * vec4(position, 1.0);
     v_frag_pos = world_pos.xyz;
 
     // Transform Normal to World Space
     // Ideally use a Normal Matrix (transpose(inverse(model))) to handle non-uniform scaling
     // For now, casting u_model to mat3 works if scaling is uniform.
-    v_normal = mat3(u_model) * a_normal;
+    v_normal = mat3(u_model) * decode_normal();
+
+    v_view_depth = -(u_view * world_pos).z;
 
-    gl_Position = u_projection * u_view * world_pos;
+    gl_Position = u_view_projection * world_pos;
     
     v_texcoord = (a_texcoord * u_uv_scale) + u_uv_offset;
+    v_texture_layer = a_texture_layer;
 }
\ No newline at end of file
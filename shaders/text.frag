@@ -0,0 +1,19 @@
+#version 330 core
+
+in vec2 v_texcoord;
+in vec4 v_color;
+
+out vec4 frag_color;
+
+// Glyph atlas: coverage only, in the red channel (see GlyphAtlas)
+uniform sampler2D u_atlas;
+
+void main() {
+    float coverage = texture(u_atlas, v_texcoord).r;
+    frag_color = vec4(v_color.rgb, v_color.a * coverage);
+
+    // Optimization: Discard fully transparent pixels
+    if (frag_color.a < 0.01) {
+        discard;
+    }
+}
@@ -0,0 +1,24 @@
+#version 330 core
+
+// Glyph corners in screen pixels, laid out on the CPU by the TextBatcher
+in vec2 a_position;
+in vec2 a_texcoord;
+in vec4 a_color;
+
+out vec2 v_texcoord;
+out vec4 v_color;
+
+// Screen-space camera of the UI pass (see FrameUniforms)
+layout(std140) uniform Camera {
+    mat4 u_view;
+    mat4 u_projection;
+    mat4 u_view_projection;
+    vec4 u_camera_position;
+};
+
+void main() {
+    gl_Position = u_view_projection * vec4(a_position, 0.0, 1.0);
+
+    v_texcoord = a_texcoord;
+    v_color = a_color;
+}
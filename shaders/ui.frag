@@ -1,11 +1,11 @@
-#version 120
+#version 330 core
 
-varying vec2 v_texcoord;
+in vec2 v_local;      // Pixel position relative to the box center
+in vec2 v_half_size;  // Half of Width, Height in pixels
+in float v_radius;    // Corner radius in pixels
+in vec4 v_color;      // R, G, B, A
 
-// Box Parameters
-uniform vec4 u_color;       // R, G, B, A
-uniform vec2 u_dimensions;  // Width, Height in pixels
-uniform float u_radius;     // Corner radius in pixels
+out vec4 frag_color;
 
 // Function to calculate Signed Distance Field for a rounded box
 // p: current pixel position (relative to center)
@@ -17,27 +17,20 @@ float roundedBoxSDF(vec2 p, vec2 b, float r) {
 }
 
 void main() {
-    // 1. Convert UVs (0..1) to Pixel Coordinates relative to center
-    // If u_dimensions is (200, 100), coordinates go from (-100, -50) to (100, 50)
-    vec2 pos = (v_texcoord - 0.5) * u_dimensions;
+    // 1. Calculate Distance
+    float dist = roundedBoxSDF(v_local, v_half_size, v_radius);
     
-    // 2. Calculate Half-Size
-    vec2 half_size = u_dimensions / 2.0;
-    
-    // 3. Calculate Distance
-    float dist = roundedBoxSDF(pos, half_size, u_radius);
-    
-    // 4. Anti-Aliasing (Smooth edges)
+    // 2. Anti-Aliasing (Smooth edges)
     // If distance < 0, we are inside. If > 0, outside.
     // smoothstep creates a smooth transition between -1.0 and 1.0 pixel (soft edge)
     float alpha = 1.0 - smoothstep(0.0, 1.5, dist);
     
-    // 5. Output Color
+    // 3. Output Color
     // Apply object alpha * calculated shape alpha
-    gl_FragColor = vec4(u_color.rgb, u_color.a * alpha);
+    frag_color = vec4(v_color.rgb, v_color.a * alpha);
     
     // Optimization: Discard fully transparent pixels
-    if (gl_FragColor.a < 0.01) {
+    if (frag_color.a < 0.01) {
         discard;
     }
-}
+}
\ No newline at end of file
@@ -1,18 +1,31 @@
-#version 120
+#version 330 core
 
-attribute vec3 a_position;
-attribute vec2 a_texcoord;
+// Per vertex: corner of the unit quad (-0.5 .. 0.5)
+in vec2 a_corner;
 
-varying vec2 v_texcoord;
+// Per instance (one UIBox each, see UIBatcher)
+in vec4 a_rect;    // Center X, Center Y, Width, Height (pixels)
+in vec4 a_color;   // R, G, B, A
+in float a_radius; // Corner radius in pixels
 
-uniform mat4 u_model;
-uniform mat4 u_view;
-uniform mat4 u_projection;
+out vec2 v_local;      // Pixel position relative to the box center
+out vec2 v_half_size;
+out float v_radius;
+out vec4 v_color;
+
+// Screen-space camera of the UI pass (see FrameUniforms)
+layout(std140) uniform Camera {
+    mat4 u_view;
+    mat4 u_projection;
+    mat4 u_view_projection;
+    vec4 u_camera_position;
+};
 
 void main() {
-    // Standard transformation
-    gl_Position = u_projection * u_view * u_model * vec4(a_position, 1.0);
-    
-    // Pass UVs to fragment shader (0.0 to 1.0)
-    v_texcoord = a_texcoord;
+    v_local = a_corner * a_rect.zw;
+    v_half_size = a_rect.zw * 0.5;
+    v_radius = a_radius;
+    v_color = a_color;
+
+    gl_Position = u_view_projection * vec4(a_rect.xy + v_local, 0.0, 1.0);
 }
\ No newline at end of file